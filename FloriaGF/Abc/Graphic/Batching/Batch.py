@@ -13,6 +13,7 @@ if t.TYPE_CHECKING:
     from ....Graphic.Objects.FBO import FBO
     from ..Materials.Material import Material
     from ..Camera import Camera
+    from ....AsyncEvent import AsyncEvent
 
 
 class Batch(
@@ -56,7 +57,19 @@ class Batch(
 
     @property
     @abstractmethod
-    def program_compose(self) -> 'ComposeShaderProgram': ...
+    def enabled(self) -> bool: ...
+
+    @property
+    @abstractmethod
+    def on_change_index(self) -> 'AsyncEvent[Batch, int]': ...
+
+    @property
+    @abstractmethod
+    def on_change_enabled(self) -> 'AsyncEvent[Batch, bool]': ...
+
+    @property
+    @abstractmethod
+    def program_compose(self) -> t.Optional['ComposeShaderProgram']: ...
 
     @property
     @abstractmethod
@@ -71,6 +71,10 @@ class Camera(
     @abstractmethod
     def ubo(self) -> 'BO': ...
 
+    @abstractmethod
+    def BindUBO(self, binding: int):
+        """Загрузить изменившиеся поля блока камеры и привязать его к точке `binding`. Требует контекста OpenGL."""
+
     @abstractmethod
     def GetPosition(self) -> 'Types.Vec3[float]': ...
 
@@ -26,6 +26,14 @@ class Material[TProgram: 'BatchShaderProgram' = 'BatchShaderProgram'](
     @abstractmethod
     def program(self) -> TProgram: ...
 
+    @abstractmethod
+    def GetSortKey(self) -> tuple[int, int]:
+        '''
+        Returns:
+            (программа, текстура) - ключ сортировки отрисовки, материалы с равным ключом привязывают одно состояние.
+        '''
+        ...
+
     @contextmanager
     @abstractmethod
     def Bind(self, camera: 'Camera', *args: t.Any, **kwargs: t.Any):
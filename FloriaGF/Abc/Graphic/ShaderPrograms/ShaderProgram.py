@@ -5,6 +5,8 @@ from contextlib import contextmanager
 from ... import Mixins
 
 if t.TYPE_CHECKING:
+    import numpy as np
+
     from .Scheme import Scheme, SchemeItem
 
 
@@ -21,10 +23,19 @@ class ShaderProgram(
     @abstractmethod
     def scheme(self) -> 'Scheme': ...
 
+    @property
+    @abstractmethod
+    def blended(self) -> bool:
+        '''Программа смешивает цвет с уже нарисованным: порядок отрисовки её групп важен.'''
+
     @abstractmethod
     def SetUniformFloat(self, name: str, value: float): ...
     @abstractmethod
-    def SetUniformVector(self, name: str, value: tuple[float, ...]): ...
+    def SetUniformInt(self, name: str, value: int): ...
+    @abstractmethod
+    def SetUniformVector(self, name: str, value: 'tuple[float, ...] | np.ndarray'): ...
+    @abstractmethod
+    def SetUniformMatrix(self, name: str, value: 'np.ndarray', transpose: bool = False): ...
 
     @contextmanager
     @abstractmethod
@@ -13,6 +13,10 @@ if t.TYPE_CHECKING:
     from ....Managers.InputManager import InputManager
     from ....Managers.MaterialManager import MaterialManager
     from ..Camera import Camera
+    from ....Graphic.Objects.RenderTargetPool import RenderTargetPool
+    from ....Graphic.Objects.VAO import VAO
+    from ....Graphic.Objects.UniformRingBuffer import UniformRingBuffer
+    from ....Graphic.Windows.ShareGroup import ShareGroup
     from .... import GL, Types
 
 
@@ -32,6 +36,9 @@ class Window(
     @abstractmethod
     def GetGLFWWindow(self) -> t.Optional['_GLFWwindow']: ...
 
+    @abstractmethod
+    def GetUniformRing(self, itemsize: int) -> 'UniformRingBuffer': ...
+
     @contextmanager
     @abstractmethod
     def Bind(self):
@@ -47,10 +54,18 @@ class Window(
     @abstractmethod
     def closed(self) -> bool: ...
 
+    @property
+    @abstractmethod
+    def share_group(self) -> 'ShareGroup': ...
+
     @property
     @abstractmethod
     def shader_manager(self) -> 'ShaderManager': ...
 
+    @property
+    @abstractmethod
+    def vao_quad(self) -> 'VAO': ...
+
     @property
     @abstractmethod
     def material_manager(self) -> 'MaterialManager': ...
@@ -59,6 +74,10 @@ class Window(
     @abstractmethod
     def input_manager(self) -> 'InputManager': ...
 
+    @property
+    @abstractmethod
+    def render_target_pool(self) -> 'RenderTargetPool': ...
+
     # events
 
     @property
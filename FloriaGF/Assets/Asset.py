@@ -5,6 +5,9 @@ from abc import ABC, abstractmethod
 
 from .. import Abc, Utils, Convert
 
+if t.TYPE_CHECKING:
+    from .Loader import AssetLoader
+
 
 class Asset(
     Abc.Mixins.Repr,
@@ -18,9 +21,12 @@ class Asset(
 
     @classmethod
     @abstractmethod
-    async def Load(cls, path: str | pathlib.Path) -> 'Asset':
+    async def Load(cls, path: str | pathlib.Path, loader: t.Optional['AssetLoader'] = None) -> 'Asset':
         '''
         Загружает ассет из полученого пути
+
+        Args:
+            loader: пулы для декодирования и чтения. Если не указан, загрузка выполняется в `asyncio.to_thread`.
         '''
 
     @classmethod
@@ -0,0 +1,287 @@
+import typing as t
+import os
+import pathlib
+import pickle
+import hashlib
+import threading
+from time import time
+
+import numpy as np
+
+from .. import Types
+
+
+class _Entry(t.NamedTuple):
+    mtime: int
+    size: int
+    hash: str
+
+
+class AssetCache:
+    '''
+    Дисковый кэш декодированных ассетов.
+
+    Файл идентифицируется по (путь, mtime, размер), данные хранятся по хэшу содержимого,
+    поэтому переименованный или заново сохранённый без изменений файл попадает в тот же блоб.
+
+    Блобы:
+        - `<hash>.npy`: пиксели RGBA (height, width, 4), читаются через memory-map. Стек кадров листа
+          (`Animation.GetFramesArray`) - представление этих пикселей без копирования, отдельно не хранится.
+        - `<hash>.pickle`: разобранный JSON.
+
+    При превышении `max_size` удаляются давно не использованные блобы. Блоб, который ещё отображён в память
+    (на Windows такой файл нельзя удалить или заменить), удаляется при следующей попытке.
+    Ошибки записи не прерывают загрузку ассета: данные просто не попадают в кэш.
+    Методы потокобезопасны и выполняются в пуле ввода-вывода загрузчика.
+    '''
+
+    INDEX_NAME = 'index.bin'
+    BLOB_SUFFIXES = ('.npy', '.pickle')
+
+    __slots__ = (
+        '_dir',
+        '_max_size',
+        '_lock',
+        '_entries',
+        '_blobs',
+        '_deferred',
+        '_total',
+        '_dirty',
+    )
+
+    def __init__(
+        self,
+        dir: str | pathlib.Path,
+        max_size: int = 1 << 30,
+    ):
+        self._dir: pathlib.Path = pathlib.Path(dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+        self._max_size: int = max_size
+        self._lock = threading.Lock()
+
+        # resolved path: entry
+        self._entries: dict[str, _Entry] = {}
+        # blob name: (last use time, size)
+        self._blobs: dict[str, tuple[float, int]] = {}
+        # блобы, удаление которых не удалось
+        self._deferred: set[str] = set()
+        self._total: int = 0
+        self._dirty: bool = False
+
+        self._LoadIndex()
+
+    def _LoadIndex(self):
+        try:
+            with open(self._dir / self.INDEX_NAME, 'rb') as file:
+                self._entries, self._blobs = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            self._entries, self._blobs = {}, {}
+
+        # блобы, удалённые вручную или оставшиеся от прерванной записи
+        names = {blob.name for blob in self._dir.iterdir() if blob.suffix in self.BLOB_SUFFIXES}
+        self._blobs = {name: item for name, item in self._blobs.items() if name in names}
+        for name in names - self._blobs.keys():
+            self._blobs[name] = (0, (self._dir / name).stat().st_size)
+
+        self._total = sum(size for _, size in self._blobs.values())
+
+    def Flush(self):
+        '''
+        Сохраняет индекс на диск, если он изменился.
+        '''
+        with self._lock:
+            self._RemoveDeferred()
+
+            if not self._dirty:
+                return
+
+            temp = self._dir / f'{self.INDEX_NAME}.tmp'
+            with open(temp, 'wb') as file:
+                pickle.dump((self._entries, self._blobs), file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, self._dir / self.INDEX_NAME)
+
+            self._dirty = False
+
+    @staticmethod
+    def _HashFile(path: pathlib.Path) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, 'rb') as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _GetHash(self, path: pathlib.Path) -> str:
+        stat = path.stat()
+        key = str(path.resolve())
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.mtime == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry.hash
+
+        hash = self._HashFile(path)
+
+        with self._lock:
+            self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, hash)
+            self._dirty = True
+
+        return hash
+
+    def _Touch(self, name: str, size: t.Optional[int] = None):
+        '''
+        Вызывается под `_lock`.
+        '''
+        if size is None:
+            size = self._blobs[name][1]
+        else:
+            self._total += size - self._blobs.get(name, (0, 0))[1]
+
+        self._blobs[name] = (time(), size)
+        self._dirty = True
+
+    def _Remove(self, name: str):
+        '''
+        Вызывается под `_lock`. Неудавшееся удаление откладывается.
+        '''
+        try:
+            (self._dir / name).unlink(missing_ok=True)
+        except OSError:
+            self._deferred.add(name)
+        else:
+            self._deferred.discard(name)
+
+    def _RemoveDeferred(self):
+        for name in tuple(self._deferred):
+            self._Remove(name)
+
+    def _PruneEntries(self):
+        '''
+        Удаляет записи файлов, для хэша которых не осталось блобов. Вызывается под `_lock`.
+        '''
+        hashes = {name.split('.', 1)[0] for name in self._blobs}
+        self._entries = {key: entry for key, entry in self._entries.items() if entry.hash in hashes}
+
+    def _Blob(self, path: str | pathlib.Path, suffix: str) -> t.Optional[pathlib.Path]:
+        blob = self._dir / f'{self._GetHash(pathlib.Path(path))}{suffix}'
+
+        with self._lock:
+            if blob.name not in self._blobs or not blob.exists():
+                return None
+
+            self._Touch(blob.name)
+
+        return blob
+
+    def _Adopt(self, blob: pathlib.Path) -> bool:
+        '''
+        Возвращает в кэш блоб, уже лежащий на диске: содержимое определяется именем. Вызывается под `_lock`.
+        '''
+        try:
+            size = blob.stat().st_size
+        except OSError:
+            return False
+
+        self._deferred.discard(blob.name)
+        self._Touch(blob.name, size)
+        return True
+
+    def _Put(self, path: str | pathlib.Path, suffix: str, write: t.Callable[[pathlib.Path], t.Any]):
+        blob = self._dir / f'{self._GetHash(pathlib.Path(path))}{suffix}'
+
+        with self._lock:
+            if (blob.name in self._blobs or blob.name in self._deferred) and self._Adopt(blob):
+                return
+
+        temp = blob.with_name(f'{blob.name}.{threading.get_ident()}.tmp')
+        try:
+            write(temp)
+            os.replace(temp, blob)
+
+        except OSError:
+            # нет места, или блоб с тем же содержимым занят другим потоком / отображён в память
+            temp.unlink(missing_ok=True)
+            with self._lock:
+                self._Adopt(blob)
+            return
+
+        with self._lock:
+            self._Adopt(blob)
+
+        self.Evict()
+
+    def GetImage(self, path: str | pathlib.Path) -> t.Optional[np.ndarray]:
+        '''
+        Returns:
+            Пиксели RGBA (height, width, 4), отображённые в память, или None при промахе.
+        '''
+        if (blob := self._Blob(path, '.npy')) is None:
+            return None
+        return np.load(blob, mmap_mode='r')
+
+    def PutImage(self, path: str | pathlib.Path, pixels: np.ndarray):
+        def Write(temp: pathlib.Path):
+            with open(temp, 'wb') as file:
+                np.save(file, pixels)
+
+        self._Put(path, '.npy', Write)
+
+    def GetJson(self, path: str | pathlib.Path) -> t.Optional[tuple[Types.JSON]]:
+        '''
+        Returns:
+            Кортеж из одного элемента с данными (JSON может быть `null`) или None при промахе.
+        '''
+        if (blob := self._Blob(path, '.pickle')) is None:
+            return None
+        with open(blob, 'rb') as file:
+            return (pickle.load(file),)
+
+    def PutJson(self, path: str | pathlib.Path, data: Types.JSON):
+        def Write(temp: pathlib.Path):
+            with open(temp, 'wb') as file:
+                pickle.dump(data, file, pickle.HIGHEST_PROTOCOL)
+
+        self._Put(path, '.pickle', Write)
+
+    def Evict(self):
+        '''
+        Удаляет давно не использованные блобы, пока размер кэша превышает `max_size`.
+        '''
+        with self._lock:
+            self._RemoveDeferred()
+
+            if self._total <= self._max_size:
+                return
+
+            for name, (_, size) in sorted(self._blobs.items(), key=lambda item: item[1][0]):
+                if self._total <= self._max_size:
+                    break
+
+                self._Remove(name)
+                self._blobs.pop(name)
+                self._total -= size
+
+            self._PruneEntries()
+            self._dirty = True
+
+    def Clear(self):
+        with self._lock:
+            for name in self._blobs:
+                self._Remove(name)
+
+            self._entries.clear()
+            self._blobs.clear()
+            self._total = 0
+            self._dirty = True
+
+    @property
+    def size(self) -> int:
+        return self._total
+
+    @property
+    def dir(self) -> pathlib.Path:
+        return self._dir
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
@@ -6,6 +6,7 @@ import numpy as np
 
 from .. import Abc, Types, Validator, Convert
 from .Asset import Asset
+from .Loader import AssetLoader, DecodeImage
 from ..Graphic.Objects.Texture import Texture
 
 
@@ -24,10 +25,14 @@ class Image(Asset):
         self._texture: t.Optional[Texture] = None
 
     @classmethod
-    async def Load(cls, path: str | Path) -> 'Image':
+    async def Load(cls, path: str | Path, loader: t.Optional[AssetLoader] = None) -> 'Image':
         asset = Image(path)
 
-        asset.image = await asyncio.to_thread(PIL.Image.open, path)
+        if loader is not None:
+            asset.image = await loader.LoadImage(path)
+        else:
+            size, data = await asyncio.to_thread(DecodeImage, path)
+            asset.image = PIL.Image.frombuffer('RGBA', size, data, 'raw', 'RGBA', 0, 1)
 
         return asset
 
@@ -7,6 +7,9 @@ import aiofiles
 from .. import Abc, Types, Validator
 from .Text import Text
 
+if t.TYPE_CHECKING:
+    from .Loader import AssetLoader
+
 
 class Json(
     Text,
@@ -30,11 +33,16 @@ class Json(
         return asset
 
     @classmethod
-    async def Load(cls, path: str | Path) -> 'Json':
+    async def Load(cls, path: str | Path, loader: t.Optional['AssetLoader'] = None) -> 'Json':
         asset = Json(path)
 
-        async with aiofiles.open(path, 'r') as file:
-            asset._text = await file.read()
+        if loader is not None:
+            asset._text, asset._data = await loader.LoadJson(path)
+            if asset._text is None and asset._data is None:
+                asset._text = 'null'
+        else:
+            async with aiofiles.open(path, 'r') as file:
+                asset._text = await file.read()
 
         return asset
 
@@ -42,6 +50,11 @@ class Json(
         super().SetText(value)
         self._data = None
 
+    def GetText(self) -> t.Optional[str]:
+        if self._text is None and self._data is not None:
+            self._text = json.dumps(self._data)
+        return self._text
+
     def GetData(self) -> t.Optional[Types.JSON]:
         if self._data is None:
             self._data = json.loads(Validator.NotNone(self.text))
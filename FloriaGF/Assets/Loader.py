@@ -0,0 +1,193 @@
+import typing as t
+import os
+import pathlib
+import asyncio
+from functools import partial
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import json
+import numpy as np
+import PIL.Image
+
+from .. import Abc, Types
+from ..Config import Config
+from .Cache import AssetCache
+
+
+def DecodeImage(path: str | pathlib.Path) -> tuple[tuple[int, int], bytes]:
+    '''
+    Полностью декодирует изображение в RGBA.
+
+    Выполняется в процессе пула, поэтому возвращает только сериализуемые данные.
+
+    Returns:
+        (размер, пиксели RGBA)
+    '''
+    with PIL.Image.open(path) as image:
+        image.load()
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        return image.size, image.tobytes()
+
+
+def ReadText(path: str | pathlib.Path) -> str:
+    with open(path, 'r') as file:
+        return file.read()
+
+
+def ReadJson(path: str | pathlib.Path) -> tuple[str, Types.JSON]:
+    text = ReadText(path)
+    return text, json.loads(text)
+
+
+class AssetLoader(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Пулы исполнителей для загрузки ассетов.
+
+    Декодирование выполняется в пуле процессов, ввод-вывод - в пуле потоков.
+    Пулы создаются при первом обращении.
+
+    Если задан кэш (по умолчанию при `Config.ASSET_CACHE_DIR`), декодированные данные берутся с диска.
+    '''
+
+    __slots__ = (
+        '_workers',
+        '_io_workers',
+        '_processes',
+        '_decode_executor',
+        '_io_executor',
+        '_cache',
+    )
+
+    def __init__(
+        self,
+        workers: t.Optional[int] = None,
+        io_workers: t.Optional[int] = None,
+        processes: bool = True,
+        cache: t.Optional[AssetCache] = None,
+    ):
+        self._workers: int = workers or Config.ASSET_LOAD_WORKERS or os.cpu_count() or 1
+        self._io_workers: int = io_workers or min(32, self._workers * 4)
+        self._processes: bool = processes
+
+        self._decode_executor: t.Optional[Executor] = None
+        self._io_executor: t.Optional[ThreadPoolExecutor] = None
+
+        self._cache: t.Optional[AssetCache] = (
+            AssetCache(Config.ASSET_CACHE_DIR, Config.ASSET_CACHE_MAX_SIZE)
+            if cache is None and Config.ASSET_CACHE_DIR is not None
+            else cache
+        )
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        if self._cache is not None:
+            self._cache.Flush()
+
+        for executor in (self._decode_executor, self._io_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        self._decode_executor = None
+        self._io_executor = None
+
+    def _GetDecodeExecutor(self) -> Executor:
+        if self._decode_executor is None:
+            self._decode_executor = (
+                ProcessPoolExecutor(self._workers)
+                if self._processes
+                else ThreadPoolExecutor(self._workers, thread_name_prefix='asset-decode')
+            )
+        return self._decode_executor
+
+    def _GetIOExecutor(self) -> ThreadPoolExecutor:
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(self._io_workers, thread_name_prefix='asset-io')
+        return self._io_executor
+
+    async def Decode[**P, T](self, func: t.Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        '''
+        Выполняет `func` в пуле декодирования. Функция и аргументы должны быть сериализуемы.
+
+        Если пул процессов сломан (например, упал рабочий процесс), загрузчик переключается на потоки.
+        '''
+        loop = asyncio.get_running_loop()
+        executor = self._GetDecodeExecutor()
+        try:
+            return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+        except BrokenProcessPool:
+            self._ReplaceDecodeExecutor(executor)
+            return await self.Decode(func, *args, **kwargs)
+
+    def _ReplaceDecodeExecutor(self, executor: Executor):
+        '''
+        Заменяет сломанный пул процессов пулом потоков. Задачи, увидевшие тот же сломанный пул,
+        заменяют его один раз; пул ввода-вывода и кэш не затрагиваются.
+        '''
+        if self._decode_executor is not executor:
+            return
+
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._decode_executor = None
+        self._processes = False
+
+    async def Read[**P, T](self, func: t.Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        '''
+        Выполняет `func` в пуле ввода-вывода.
+        '''
+        return await asyncio.get_running_loop().run_in_executor(self._GetIOExecutor(), partial(func, *args, **kwargs))
+
+    async def LoadImage(self, path: str | pathlib.Path) -> PIL.Image.Image:
+        if self._cache is not None and (pixels := await self.Read(self._cache.GetImage, path)) is not None:
+            return PIL.Image.frombuffer('RGBA', (pixels.shape[1], pixels.shape[0]), pixels, 'raw', 'RGBA', 0, 1)
+
+        size, data = await self.Decode(DecodeImage, path)
+
+        if self._cache is not None:
+            await self.Read(
+                self._cache.PutImage,
+                path,
+                np.frombuffer(data, dtype=np.uint8).reshape((size[1], size[0], 4)),
+            )
+
+        return PIL.Image.frombuffer('RGBA', size, data, 'raw', 'RGBA', 0, 1)
+
+    async def LoadText(self, path: str | pathlib.Path) -> str:
+        return await self.Read(ReadText, path)
+
+    async def LoadJson(self, path: str | pathlib.Path) -> tuple[t.Optional[str], Types.JSON]:
+        '''
+        Returns:
+            (текст, данные). При попадании в кэш текст не читается и равен None.
+        '''
+        if self._cache is not None and (cached := await self.Read(self._cache.GetJson, path)) is not None:
+            return None, cached[0]
+
+        text, data = await self.Read(ReadJson, path)
+
+        if self._cache is not None:
+            await self.Read(self._cache.PutJson, path, data)
+
+        return text, data
+
+    async def Flush(self):
+        '''
+        Сохраняет индекс кэша.
+        '''
+        if self._cache is not None:
+            await self.Read(self._cache.Flush)
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def processes(self) -> bool:
+        return self._processes
+
+    @property
+    def cache(self) -> t.Optional[AssetCache]:
+        return self._cache
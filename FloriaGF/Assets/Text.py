@@ -5,6 +5,9 @@ import aiofiles
 from .. import Abc, Convert, Validator
 from .Asset import Asset
 
+if t.TYPE_CHECKING:
+    from .Loader import AssetLoader
+
 
 class Text(Asset):
     __slots__ = ('_text',)
@@ -20,11 +23,14 @@ class Text(Asset):
         self._text: t.Optional[str] = None
 
     @classmethod
-    async def Load(cls, path: str | Path) -> 'Text':
+    async def Load(cls, path: str | Path, loader: t.Optional['AssetLoader'] = None) -> 'Text':
         asset = Text(path)
 
-        async with aiofiles.open(path, 'r') as file:
-            asset._text = await file.read()
+        if loader is not None:
+            asset._text = await loader.LoadText(path)
+        else:
+            async with aiofiles.open(path, 'r') as file:
+                asset._text = await file.read()
 
         return asset
 
@@ -43,7 +49,7 @@ class Text(Asset):
             path = self.path
 
         async with aiofiles.open(Validator.NotNone(path), 'w') as file:
-            await file.write(Validator.NotNone(self._text))
+            await file.write(Validator.NotNone(self.GetText()))
 
         return self
 
@@ -2,3 +2,5 @@ from .Asset import Asset
 from .Image import Image
 from .Text import Text
 from .Json import Json
+from .Loader import AssetLoader
+from .Cache import AssetCache
@@ -1,4 +1,5 @@
 import typing as t
+import os
 from dataclasses import dataclass
 
 if t.TYPE_CHECKING:
@@ -52,9 +53,48 @@ class ConfigCls:
     def TPS_delay(self) -> float:
         return (1 / self.TPS) if self.TPS > 0 else 0
 
+    BATCH_DRAW_INDIRECT: bool = True
+    '''Рисовать группы батча через `glMultiDraw*Indirect`, если версия контекста OpenGL 4.3 и выше.'''
+
+    GL_CHECK_ERRORS: bool = False
+    '''Проверять `glGetError` при выходе из привязки, если проверка ошибок PyOpenGL отключена.'''
+
     CONTEXT_VERSIONS: 'Types.hints.context_version' = (4, 2)
     '''Версия OpenGL. `Настоятельно не рекомендуется менять.`'''
 
+    ASSET_LOAD_WORKERS: t.Optional[int] = None
+    '''Количество процессов декодирования ассетов. `None` - по числу ядер.'''
+    ASSET_LOAD_LIMIT: int = 64
+    '''Максимум одновременно загружаемых файлов в `AssetManager.LoadDir`.'''
+
+    ASSET_CACHE_DIR: t.Optional[str] = None
+    '''Папка дискового кэша декодированных ассетов. `None` - кэш отключён.'''
+    ASSET_CACHE_MAX_SIZE: int = 1 << 30
+    '''Максимальный размер дискового кэша ассетов в байтах.'''
+
+    RENDER_TARGET_IDLE_FRAMES: int = 120
+    '''Через сколько кадров простоя удаляется свободный FBO из пула целей окна.'''
+
+    SHADER_CACHE_DIR: t.Optional[str] = None
+    '''Папка кэша бинарников шейдерных программ. `None` - программы компилируются при каждом запуске.'''
+
+    UNIFORM_RING_FRAMES: int = 3
+    '''Количество регионов (кадров) общих UBO камер окна.'''
+
+    SHARE_CONTEXTS: bool = False
+    '''Окна без явного `share` разделяют контексты OpenGL (программы, буферы, текстуры) с общей группой процесса.'''
+
+    PROFILER_ENABLED: bool = False
+    '''Включить `profiler` при инициализации ядра: области `@stopwatch` собираются в дерево каждого кадра.'''
+
+    STOPWATCH_ENABLED: bool = os.environ.get('FLORIAGF_STOPWATCH', '1').lower() not in ('0', 'false', 'off')
+    '''
+    Обёртки `@stopwatch`. Читается при декорировании (переменная окружения `FLORIAGF_STOPWATCH=0` отключает их с импорта),
+    изменение после импорта применяется в `Core.Initialize` через `SetInstrumentation`.
+    '''
+    STOPWATCH_SAMPLE_EVERY: int = 1
+    '''Замерять каждый N-й вызов функций `@stopwatch`.'''
+
     CANCEL_TASK_TIMEOUT: float = 5
     '''Количество секунд ожидания завершения асинхронных задач во время завершения ядра.'''
 
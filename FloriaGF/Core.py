@@ -9,7 +9,8 @@ from .Loggers import core_logger
 from .TimeoutScheduler import TimeoutScheduler
 from .Timer import TimerStorage, VariableTimer, FixedTimer
 from .AsyncEvent import AsyncEvent
-from .Stopwatch import Stopwatch
+from .Stopwatch import Stopwatch, SetInstrumentation, SetSampling
+from .Profiler import profiler
 
 if t.TYPE_CHECKING:
     from . import Managers
@@ -72,6 +73,12 @@ class CoreCls(Abc.Core):
         self._sps_timer = FixedTimer(Config.SPS_delay)
         self._tps_timer = VariableTimer(Config.TPS_delay)
 
+        SetInstrumentation(Config.STOPWATCH_ENABLED or Config.PROFILER_ENABLED)
+        SetSampling(Config.STOPWATCH_SAMPLE_EVERY)
+
+        if Config.PROFILER_ENABLED:
+            profiler.Enable()
+
         await self.on_initialized.InvokeAsync(self)
 
         core_logger.info(f'Initialized for {perf_counter() - t1:.4f} sec')
@@ -122,9 +129,11 @@ class CoreCls(Abc.Core):
                     async def RunWindowManager():
                         while self.enable:
                             if self.fps_timer.Try():
+                                profiler.BeginFrame()
                                 glfw.poll_events()
                                 await self.window_manager.Simulate()
                                 await self.on_draw.InvokeAsync(self)
+                                profiler.EndFrame()
                             await asyncio.sleep(0)
 
                     async def RunSimulateManager():
@@ -144,6 +153,8 @@ class CoreCls(Abc.Core):
                 case 'sync':
                     while self.enable:
                         with self._stopwatch_cycle:
+                            profiler.BeginFrame()
+
                             if self.fps_timer.Try():
                                 glfw.poll_events()
                                 await self.window_manager.Simulate()
@@ -155,6 +166,8 @@ class CoreCls(Abc.Core):
                             # if self.tps_timer.Try():
                             # await self.timer_storage.Invoke()
 
+                            profiler.EndFrame()
+
                         await asyncio.sleep(0)
 
                 case _:
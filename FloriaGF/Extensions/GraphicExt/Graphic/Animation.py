@@ -1,4 +1,5 @@
 import typing as t
+import numpy as np
 from PIL.Image import Image
 
 from FloriaGF import Abc, Types, Validator
@@ -36,6 +37,22 @@ class Animation(Abc.Mixins.Signaturable, Abc.Mixins.Repr):
         frame_size = (self.image.width, self.image.height / self.count)
         return tuple(self.image.crop((0, frame_size[1] * i, frame_size[0], frame_size[1] * (i + 1))) for i in range(self.count))
 
+    def GetFramesArray(self) -> np.ndarray:
+        '''
+        Декодирует лист кадров один раз в непрерывный буфер RGBA.
+
+        Returns:
+            Представление формы (count, height, width, 4) без покадровых копий.
+        '''
+        image = self.image if self.image.mode == 'RGBA' else self.image.convert('RGBA')
+        width, height = self.size
+
+        pixels = np.asarray(image, dtype=np.uint8)
+        if pixels.shape[0] != height * self.count:
+            pixels = pixels[: height * self.count]
+
+        return pixels.reshape((self.count, height, width, 4))
+
     class Modify_Kwargs(t.TypedDict, total=False):
         name: str
         image: 'Assets.Image | Image'
@@ -0,0 +1,84 @@
+import typing as t
+
+from FloriaGF import Abc, Core, Types
+
+from ..Materials.AtlasSprite3DMaterial import AtlasSprite3DMaterial
+from .Sprite3DObject import Sprite3DObject
+from .. import Meshes
+
+if t.TYPE_CHECKING:
+    from ..Animation import Animation
+
+
+class AtlasSprite3DObject(
+    Sprite3DObject[AtlasSprite3DMaterial],
+):
+    '''
+    Спрайт, кадры которого берутся из атласа окна.
+
+    Вместо атрибута `frame` в инстанс-данные передаются `uv_rect` и `layer` текущего кадра.
+    '''
+
+    ATTRIBS = t.Union[
+        Sprite3DObject.ATTRIBS,
+        t.Literal[
+            'uv_rect',
+            'layer',
+        ],
+    ]
+
+    MATERIAL_NAME = 'atlas-sprite-3d-material'
+
+    @classmethod
+    def New(
+        cls,
+        batch: Abc.Batch,
+        animation: t.Optional['Animation'] = None,
+        position: Types.hints.position_3d = (0, 0, 0),
+        rotation: Types.hints.rotation = (0, 0, 0),
+        scale: t.Optional[Types.hints.scale_3d] = None,
+        opacity: float = 1,
+        visible: bool = True,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ):
+        material = batch.window.material_manager.sequence.OfType(AtlasSprite3DMaterial).GetByNameOrDefaultLazy(
+            cls.MATERIAL_NAME,
+            lambda: batch.window.material_manager.Register(AtlasSprite3DMaterial.New(batch.window, animation, cls.MATERIAL_NAME)),
+        )
+
+        mesh = Core.mesh_manager.sequence.GetByNameOrDefaultLazy(
+            cls.MESH_NAME,
+            lambda: Core.mesh_manager.Register(Meshes.CreateSpriteMesh(cls.MESH_NAME)),
+        )
+
+        return AtlasSprite3DObject(
+            batch,
+            material,
+            mesh,
+            animation,
+            position,
+            rotation,
+            scale,
+            opacity,
+            visible,
+        )
+
+    def _GetInstanceAttribute(self, name: AtlasSprite3DObject.ATTRIBS) -> t.Any:
+        if name == 'uv_rect':
+            if (regions := self.material.regions) is None:
+                return (0, 0, 1, 1)
+            return self.material.atlas.GetUVRect(regions[self.frame])
+
+        elif name == 'layer':
+            if (regions := self.material.regions) is None:
+                return 0
+            return regions[self.frame].layer
+
+        return super()._GetInstanceAttribute(name)
+
+    def _UpdateInstanceAttributes(self, *names: AtlasSprite3DObject.ATTRIBS, all: bool = False):
+        return super()._UpdateInstanceAttributes(
+            *(field for name in names for field in (('uv_rect', 'layer') if name == 'frame' else (name,))),
+            all=all,
+        )
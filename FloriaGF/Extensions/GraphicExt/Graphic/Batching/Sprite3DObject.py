@@ -6,6 +6,7 @@ from FloriaGF import Abc, Core, Validator, Utils, Types, Convert, VariableTimer,
 from FloriaGF import AsyncEvent
 from FloriaGF.Graphic.Batching import InterpolationInstanceObject
 
+from ..Materials.AnimationMaterial import AnimationMaterial
 from ..Materials.Sprite3DMaterial import Sprite3DMaterial
 from .. import Meshes
 
@@ -14,7 +15,7 @@ if t.TYPE_CHECKING:
 
 
 class Sprite3DObject[
-    TMaterial: Sprite3DMaterial = Sprite3DMaterial,
+    TMaterial: AnimationMaterial[t.Any] = Sprite3DMaterial,
 ](
     InterpolationInstanceObject[TMaterial],
 ):
@@ -43,7 +44,7 @@ class Sprite3DObject[
         visible: bool = True,
         *args: t.Any,
         **kwargs: t.Any,
-    ):
+    ) -> 'Sprite3DObject[t.Any]':
         material = batch.window.material_manager.sequence.OfType(Sprite3DMaterial).GetByNameOrDefaultLazy(
             cls.MATERIAL_NAME,
             lambda: batch.window.material_manager.Register(Sprite3DMaterial.New(batch.window, animation, cls.MATERIAL_NAME)),
@@ -177,7 +178,7 @@ class Sprite3DObject[
             return self.opacity
 
         elif name == 'frame':
-            return self.frame
+            return self.material.base_layer + self.frame
 
         return super()._GetInstanceAttribute(name)
 
@@ -1 +1,2 @@
 from .Sprite3DObject import Sprite3DObject
+from .AtlasSprite3DObject import AtlasSprite3DObject
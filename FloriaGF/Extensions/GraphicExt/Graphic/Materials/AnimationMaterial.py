@@ -0,0 +1,57 @@
+import typing as t
+
+from FloriaGF import Abc
+from FloriaGF.Graphic.Materials.Material import Material
+
+
+if t.TYPE_CHECKING:
+    from FloriaGF.Graphic.Objects.UniformBlockBuffer import UniformBlockBuffer
+
+    from ..Animation import Animation
+
+
+class AnimationMaterial[
+    TProgram: Abc.Graphic.ShaderPrograms.BatchShaderProgram,
+](
+    Material[TProgram],
+):
+    '''
+    Материал с анимацией: общая часть материалов, которые принимает `Sprite3DObject`.
+    '''
+
+    __slots__ = ('_animation',)
+
+    def __init__(
+        self,
+        program: TProgram,
+        animation: t.Optional['Animation'] = None,
+        name: t.Optional[str] = None,
+        *,
+        uniforms: t.Optional['UniformBlockBuffer'] = None,
+    ):
+        super().__init__(program, name, uniforms=uniforms)
+
+        self._animation: t.Optional['Animation'] = animation
+
+    class Modify_Kwargs(
+        Material.Modify_Kwargs,
+        total=False,
+    ):
+        animation: t.Optional['Animation']
+
+    def Modify(self, **kwargs: t.Unpack[Modify_Kwargs]):
+        return self.__class__(
+            self.program,
+            kwargs.get('animation', self.animation),
+            kwargs.get('name', self.name),
+            uniforms=kwargs.get('uniforms', self.uniforms),
+        )
+
+    @property
+    def animation(self) -> t.Optional['Animation']:
+        return self._animation
+
+    @property
+    def base_layer(self) -> int:
+        '''Слой первого кадра анимации в текстурном массиве материала.'''
+        return 0
@@ -0,0 +1,85 @@
+import typing as t
+from uuid import UUID
+from contextlib import contextmanager
+
+from FloriaGF import Abc
+
+from .AnimationMaterial import AnimationMaterial
+from ..ShaderPrograms.AtlasSprite3DShaderProgram import AtlasSprite3DShaderProgram
+from ..Objects.TextureAtlas import TextureAtlas, AtlasRegion
+
+
+if t.TYPE_CHECKING:
+    from FloriaGF.Graphic.Windows.ShareGroup import ShareGroup
+
+    from ..Animation import Animation
+
+
+class AtlasSprite3DMaterial(AnimationMaterial[AtlasSprite3DShaderProgram]):
+    '''
+    Материал спрайтов, кадры которых лежат в общем атласе группы контекстов окна.
+
+    Сигнатура не зависит от анимации, поэтому спрайты с разными анимациями попадают в одну группу
+    и рисуются одним вызовом. Кадр выбирается через инстанс-атрибуты `uv_rect` и `layer`.
+    '''
+
+    PROGRAM_NAME = 'atlas-sprite-3d-program'
+
+    # ShareGroup.id: TextureAtlas
+    _atlases: dict[UUID, TextureAtlas] = {}
+
+    __slots__ = ()
+
+    @classmethod
+    def New(
+        cls,
+        window: Abc.Window,
+        animation: t.Optional['Animation'] = None,
+        name: t.Optional[str] = None,
+    ):
+        program = window.shader_manager.sequence.OfType(AtlasSprite3DShaderProgram).GetByNameOrDefaultLazy(
+            cls.PROGRAM_NAME,
+            lambda: window.shader_manager.Register(AtlasSprite3DShaderProgram(window, cls.PROGRAM_NAME)),
+        )
+
+        return AtlasSprite3DMaterial(
+            program,
+            animation,
+            name,
+        )
+
+    @classmethod
+    def GetAtlas(cls, window: Abc.Window) -> TextureAtlas:
+        if (atlas := cls._atlases.get(window.share_group.id)) is None:
+            atlas = TextureAtlas(window)
+            cls._atlases[window.share_group.id] = atlas
+
+            @window.share_group.on_dispose.Register
+            def _(share_group: 'ShareGroup'):
+                if (atlas := cls._atlases.pop(share_group.id, None)) is not None:
+                    atlas.Dispose()
+
+        return atlas
+
+    @property
+    def atlas(self) -> TextureAtlas:
+        return self.GetAtlas(self.program.window)
+
+    @property
+    def regions(self) -> t.Optional[tuple[AtlasRegion, ...]]:
+        '''
+        Области кадров текущей анимации. При первом обращении анимация добавляется в атлас.
+        '''
+        if self._animation is None:
+            return None
+        return self.atlas.Insert(self._animation)
+
+    @contextmanager
+    def Bind(self, camera: Abc.Camera, *args: t.Any, **kwargs: t.Any):
+        with super().Bind(camera):
+            with self.atlas.texture.Bind():
+                yield self
+
+    def GetSortKey(self) -> tuple[int, int]:
+        texture_key = id(self.atlas)
+        return (self.program.id, texture_key if self.uniforms is None else hash((texture_key, self.uniforms_id)))
@@ -7,23 +7,25 @@ from contextlib import contextmanager
 
 from FloriaGF import Abc, Core, Utils
 from FloriaGF.Graphic.Objects.Texture import Texture
-from FloriaGF.Graphic.Materials.Material import Material
 
+from .AnimationMaterial import AnimationMaterial
 from ..ShaderPrograms.Sprite3DShaderProgram import Sprite3DShaderProgram
-from ..Objects.TextureArrays import TextureArrays
+from ..Objects.TextureArrays import TextureArrays, TextureArraySlice
 
 
 if t.TYPE_CHECKING:
+    from FloriaGF.Graphic.Windows.ShareGroup import ShareGroup
+
     from ..Animation import Animation
 
 
-class Sprite3DMaterial(Material[Sprite3DShaderProgram]):
+class Sprite3DMaterial(AnimationMaterial[Sprite3DShaderProgram]):
     PROGRAM_NAME = 'sprite-3d-program'
 
-    # Window.id: TextureArrays
+    # ShareGroup.id: TextureArrays
     _texture_arrays: dict[UUID, TextureArrays] = {}
 
-    __slots__ = ('_animation',)
+    __slots__ = ()
 
     @classmethod
     def New(
@@ -43,64 +45,56 @@ class Sprite3DMaterial(Material[Sprite3DShaderProgram]):
             name,
         )
 
-    def __init__(
-        self,
-        program: Sprite3DShaderProgram,
-        animation: t.Optional['Animation'] = None,
-        name: t.Optional[str] = None,
-    ):
-        super().__init__(program, name)
-
-        self._animation: t.Optional['Animation'] = animation
+    @classmethod
+    def GetTextureArrays(cls, window: Abc.Window) -> TextureArrays:
+        if (texture_arrays := cls._texture_arrays.get(window.share_group.id)) is None:
+            texture_arrays = TextureArrays(window)
+            cls._texture_arrays[window.share_group.id] = texture_arrays
 
-    class Modify_Kwargs(
-        Material.Modify_Kwargs,
-        total=False,
-    ):
-        animation: t.Optional['Animation']
+            @window.share_group.on_dispose.Register
+            def _(share_group: 'ShareGroup'):
+                if (texture_arrays := cls._texture_arrays.pop(share_group.id, None)) is not None:
+                    texture_arrays.Dispose()
 
-    def Modify(self, **kwargs: t.Unpack[Modify_Kwargs]):
-        return self.__class__(
-            self.program,
-            kwargs.get('animation', self.animation),
-            kwargs.get('name', self.name),
-        )
+        return texture_arrays
 
     @classmethod
-    def _GetTexture(cls, window: Abc.Window, animation: 'Animation') -> Texture:
-        if (texture_arrays := cls._texture_arrays.get(window.id)) is None:
-            texture_arrays = TextureArrays()
-            cls._texture_arrays[window.id] = texture_arrays
-
-            @window.on_closed.Register
-            def _(window: Abc.Window):
-                cls._texture_arrays.pop(window.id, None)
+    def _GetSlice(cls, window: Abc.Window, animation: 'Animation') -> TextureArraySlice:
+        texture_arrays = cls.GetTextureArrays(window)
 
-        if (texture := texture_arrays.Get(animation.name)) is None:
-            texture = texture_arrays.Register(animation.name, animation.GetFrames(), window)
+        if (item := texture_arrays.Get(animation.name)) is None:
+            item = texture_arrays.Register(animation.name, animation.GetFramesArray())
 
-        return texture
+        return item
 
     @property
-    def texture(self) -> t.Optional[Texture]:
+    def slice(self) -> t.Optional[TextureArraySlice]:
         if self._animation is None:
             return None
-        return self._GetTexture(self.program.window, self._animation)
+        return self._GetSlice(self.program.window, self._animation)
 
     @property
-    def animation(self):
-        return self._animation
+    def base_layer(self) -> int:
+        return 0 if (item := self.slice) is None else item.base_layer
+
+    @property
+    def texture(self) -> t.Optional[Texture]:
+        return None if (item := self.slice) is None else item.texture
 
     @contextmanager
     def Bind(self, camera: Abc.Camera, *args: t.Any, **kwargs: t.Any):
-        with self.program.Bind(camera):
+        with super().Bind(camera):
             with texture.Bind() if (texture := self.texture) is not None else Utils.EmptyBind():
                 yield self
 
+    def GetSortKey(self) -> tuple[int, int]:
+        texture_key = 0 if (item := self.slice) is None else item.pool.GetSignature()
+        return (self.program.id, texture_key if self.uniforms is None else hash((texture_key, self.uniforms_id)))
+
     def GetSignature(self):
         return hash(
             (
                 super().GetSignature(),
-                None if self.animation is None else self.animation.GetSignature(),
+                None if (item := self.slice) is None else item.pool.GetSignature(),
             )
         )
@@ -1 +1,3 @@
+from .AnimationMaterial import AnimationMaterial
 from .Sprite3DMaterial import Sprite3DMaterial
+from .AtlasSprite3DMaterial import AtlasSprite3DMaterial
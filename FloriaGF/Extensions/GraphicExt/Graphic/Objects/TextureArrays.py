@@ -1,55 +1,322 @@
 import typing as t
-from OpenGL import GL
+import numpy as np
 from PIL import Image
+
+from FloriaGF import Abc, GL
 from FloriaGF.Graphic.Objects import Texture
-from FloriaGF import Abc
 
 
-class TextureArrays:
-    def __init__(self):
-        self._storage: dict[str, Texture] = {}
+class TextureArraySlice(t.NamedTuple):
+    '''Непрерывный диапазон слоёв пула, занятый кадрами одной анимации.'''
 
-    @t.overload
-    def Register(self, name: str, texture: Texture, /) -> Texture: ...
+    pool: 'TextureArrayPool'
+    base_layer: int
+    layers: int
 
-    @t.overload
-    def Register(self, name: str, layers: t.Sequence[Image.Image], window: Abc.Window, /) -> Texture: ...
+    @property
+    def texture(self) -> Texture:
+        return self.pool.texture
 
-    def Register(self, *args: str | Texture | t.Sequence[Image.Image] | Abc.Window) -> Texture:
-        name = t.cast(str, args[0])
-        if name in self._storage:
-            raise RuntimeError()
 
-        if isinstance(args[1], Texture):
-            texture = args[1]
+class TextureArrayPool(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Общий `texture_2d_array` для кадров одного размера и формата.
 
-        elif isinstance(args[1], t.Sequence):
-            layers = t.cast(t.Sequence[Image.Image], args[1])
-            window = t.cast(Abc.Window, args[2])
+    Слои выделяются непрерывными диапазонами из списка свободных участков (first-fit),
+    при нехватке места ёмкость удваивается вплоть до `max_layers`, но не больше предела драйвера.
 
-            texture = Texture(
-                window,
-                'texture_2d_array',
-            )
-            with texture.Bind():
-                texture.TexStorage3D(layers)
+    Выделение и освобождение слоёв не требуют привязанного контекста: пиксели копятся до `Upload`,
+    который пересоздаёт текстуру при росте ёмкости (старые слои копируются на GPU) и дозагружает ожидающие слои.
+    Предел драйвера запрашивается в контексте окна при первом росте.
+    '''
+
+    GUARANTEED_LAYERS: t.Final = 256
+    '''Минимальный предел слоёв, гарантированный OpenGL 3.0+: начальная ёмкость не запрашивает драйвер.'''
+
+    __slots__ = (
+        '_window',
+        '_index',
+        '_size',
+        '_format',
+        '_capacity',
+        '_max_layers',
+        '_free',
+        '_pending',
+        '_texture',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        size: tuple[int, int],
+        format: GL.hints.texture_internal_format = 'rgba8',
+        index: int = 0,
+        capacity: int = 8,
+        max_layers: t.Optional[int] = None,
+    ):
+        if capacity <= 0 or (max_layers is not None and max_layers <= 0):
+            raise ValueError()
+
+        self._window = window
+        self._index: int = index
+
+        self._size: tuple[int, int] = size
+        self._format: GL.hints.texture_internal_format = format
 
+        # запрошенный предел, предел драйвера учитывается в `max_layers`
+        self._max_layers: t.Optional[int] = max_layers
+        self._capacity: int = min(capacity, self.GUARANTEED_LAYERS if max_layers is None else max_layers)
+        # (start, count)
+        self._free: list[tuple[int, int]] = [(0, self._capacity)]
+        # (base_layer, pixels)
+        self._pending: list[tuple[int, np.ndarray]] = []
+
+        self._texture: t.Optional[Texture] = None
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        if self._texture is not None:
+            self._texture.Dispose()
+            self._texture = None
+
+    def _Grow(self, count: int) -> bool:
+        # хвостовой свободный участок продолжается новыми слоями
+        tail = self._free[-1] if len(self._free) > 0 and sum(self._free[-1]) == self._capacity else None
+        need = count - (0 if tail is None else tail[1])
+
+        capacity = self._capacity
+        while capacity - self._capacity < need:
+            capacity *= 2
+        capacity = min(capacity, self.max_layers)
+
+        if capacity - self._capacity < need:
+            return False
+
+        if tail is None:
+            self._free.append((self._capacity, capacity - self._capacity))
         else:
-            raise RuntimeError()
+            self._free[-1] = (tail[0], tail[1] + capacity - self._capacity)
+
+        self._capacity = capacity
+        return True
+
+    def Allocate(self, pixels: np.ndarray) -> t.Optional[int]:
+        '''
+        Выделяет слои под кадры `pixels` формы (count, height, width, 4).
+
+        Returns:
+            Базовый слой или None, если пул не может вместить кадры.
+        '''
+        count = pixels.shape[0]
+        if count <= 0:
+            raise ValueError()
+
+        if pixels.shape[1:3] != (self._size[1], self._size[0]):
+            raise ValueError()
+
+        for i, (start, free_count) in enumerate(self._free):
+            if free_count >= count:
+                break
+        else:
+            if not self._Grow(count):
+                return None
+            i = len(self._free) - 1
+            start, free_count = self._free[i]
+
+        if free_count == count:
+            self._free.pop(i)
+        else:
+            self._free[i] = (start + count, free_count - count)
+
+        self._pending.append((start, pixels))
+
+        return start
+
+    def Free(self, base_layer: int, count: int):
+        '''
+        Возвращает диапазон слоёв в список свободных, объединяя соседние участки.
+        '''
+        self._pending = [item for item in self._pending if item[0] != base_layer]
+
+        self._free.append((base_layer, count))
+        self._free.sort()
+
+        merged: list[tuple[int, int]] = []
+        for start, free_count in self._free:
+            if len(merged) > 0 and sum(merged[-1]) == start:
+                merged[-1] = (merged[-1][0], merged[-1][1] + free_count)
+            else:
+                merged.append((start, free_count))
+
+        self._free = merged
+
+    def Upload(self) -> Texture:
+        '''
+        Требует контекста OpenGL.
+        '''
+        if self._texture is None or self._texture.depth != self._capacity:
+            texture = Texture(self._window, 'texture_2d_array')
+            with texture.Bind():
+                texture.AllocateStorage3D(self._size, self._capacity, self._format)
+
+            if self._texture is not None:
+                texture.CopyLayers(self._texture)
+                self._texture.Dispose()
+
+            self._texture = texture
+
+        if len(self._pending) > 0:
+            with self._texture.Bind():
+                for base_layer, pixels in self._pending:
+                    self._texture.SubImage3D(pixels, (0, 0, base_layer))
+            self._pending.clear()
+
+        return self._texture
 
-        if texture.type != 'texture_2d_array':
+    @property
+    def texture(self) -> Texture:
+        return self.Upload()
+
+    @property
+    def key(self) -> tuple[tuple[int, int], GL.hints.texture_internal_format]:
+        return (self._size, self._format)
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def max_layers(self) -> int:
+        '''
+        Запрошенный предел, ограниченный пределом драйвера. Привязывает контекст окна, значение драйвера кэшируется.
+        '''
+        with self._window.Bind():
+            limit = GL.Texture.GetMaxArrayLayers()
+        return limit if self._max_layers is None else min(self._max_layers, limit)
+
+    @property
+    def free_layers(self) -> int:
+        return sum(count for _, count in self._free)
+
+    @property
+    def window(self):
+        return self._window
+
+    def GetSignature(self) -> int:
+        return hash((self.key, self._index))
+
+
+class TextureArrays(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Пулы массивов текстур окна, сгруппированные по размеру кадра и формату.
+
+    Анимации одного размера делят общий `texture_2d_array` и различаются только базовым слоем,
+    поэтому число привязок текстур за кадр равно числу классов размеров.
+    '''
+
+    __slots__ = (
+        '_window',
+        '_max_layers',
+        '_pools',
+        '_storage',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        max_layers: t.Optional[int] = None,
+    ):
+        '''
+        Args:
+            max_layers: Предел слоёв одного пула. По умолчанию предел драйвера.
+        '''
+        self._window = window
+        self._max_layers: t.Optional[int] = max_layers
+
+        self._pools: dict[tuple[tuple[int, int], GL.hints.texture_internal_format], list[TextureArrayPool]] = {}
+        self._storage: dict[str, TextureArraySlice] = {}
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        for pools in self._pools.values():
+            for pool in pools:
+                pool.Dispose()
+        self._pools.clear()
+        self._storage.clear()
+
+    @staticmethod
+    def _GetLayersPixels(layers: 'np.ndarray | t.Sequence[Image.Image]') -> np.ndarray:
+        if isinstance(layers, np.ndarray):
+            if layers.ndim != 4 or layers.shape[0] == 0 or layers.shape[3] != 4:
+                raise ValueError()
+            return np.ascontiguousarray(layers, dtype=np.uint8)
+
+        if len(layers) == 0:
+            raise ValueError()
+
+        width, height = layers[0].size
+        pixels = np.empty((len(layers), height, width, 4), dtype=np.uint8)
+        for i, layer in enumerate(layers):
+            pixels[i] = np.asarray(layer.convert('RGBA'), dtype=np.uint8)
+
+        return pixels
+
+    def Register(
+        self,
+        name: str,
+        layers: 'np.ndarray | t.Sequence[Image.Image]',
+        format: GL.hints.texture_internal_format = 'rgba8',
+    ) -> TextureArraySlice:
+        if name in self._storage:
             raise RuntimeError()
 
-        self._storage[name] = texture
+        pixels = self._GetLayersPixels(layers)
+        size = (pixels.shape[2], pixels.shape[1])
+
+        pools = self._pools.setdefault((size, format), [])
+        for pool in pools:
+            if (base_layer := pool.Allocate(pixels)) is not None:
+                break
+        else:
+            pool = TextureArrayPool(self._window, size, format, len(pools), max_layers=self._max_layers)
+            pools.append(pool)
+            if (base_layer := pool.Allocate(pixels)) is None:
+                raise ValueError(f'Animation "{name}" has more frames than max layers {pool.max_layers}')
+
+        item = TextureArraySlice(pool, base_layer, pixels.shape[0])
+        self._storage[name] = item
+
+        return item
 
-        return texture
+    def Remove(self, name: str):
+        if (item := self._storage.pop(name, None)) is None:
+            return
+        item.pool.Free(item.base_layer, item.layers)
 
-    def Get(self, name: str) -> t.Optional[Texture]:
+    def Get(self, name: str) -> t.Optional[TextureArraySlice]:
         return self._storage.get(name)
 
     def Has(self, name: str) -> bool:
         return name in self._storage
 
+    @property
+    def pools(self) -> tuple[TextureArrayPool, ...]:
+        return tuple(pool for pools in self._pools.values() for pool in pools)
+
+    @property
+    def window(self):
+        return self._window
+
     @property
     def count(self) -> int:
         return len(self._storage)
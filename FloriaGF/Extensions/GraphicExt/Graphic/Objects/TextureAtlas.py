@@ -0,0 +1,327 @@
+import typing as t
+import numpy as np
+
+from FloriaGF import Abc
+from FloriaGF.Graphic.Objects import Texture
+
+if t.TYPE_CHECKING:
+    from ..Animation import Animation
+
+
+class AtlasRegion(t.NamedTuple):
+    '''Область кадра в атласе (в пикселях).'''
+
+    layer: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+    def GetUVRect(self, page_size: tuple[int, int]) -> tuple[float, float, float, float]:
+        '''
+        Returns:
+            (u, v, width, height) в нормализованных координатах страницы.
+        '''
+        page_width, page_height = page_size
+        return (
+            self.x / page_width,
+            self.y / page_height,
+            self.width / page_width,
+            self.height / page_height,
+        )
+
+
+class SkylinePacker:
+    '''
+    Упаковщик прямоугольников алгоритмом skyline (bottom-left) для одной страницы.
+
+    Хранит "линию горизонта" как список сегментов (x, y, width) и размещает каждый
+    новый прямоугольник так, чтобы его нижняя граница была как можно ниже.
+    '''
+
+    __slots__ = (
+        '_width',
+        '_height',
+        '_skyline',
+    )
+
+    def __init__(self, width: int, height: int):
+        if width <= 0 or height <= 0:
+            raise ValueError()
+
+        self._width: int = width
+        self._height: int = height
+        self._skyline: list[tuple[int, int, int]] = [(0, 0, width)]
+
+    def _Fit(self, index: int, width: int, height: int) -> t.Optional[int]:
+        x = self._skyline[index][0]
+        if x + width > self._width:
+            return None
+
+        y = 0
+        width_left = width
+        i = index
+        while width_left > 0:
+            if i >= len(self._skyline):
+                return None
+
+            y = max(y, self._skyline[i][1])
+            if y + height > self._height:
+                return None
+
+            width_left -= self._skyline[i][2]
+            i += 1
+
+        return y
+
+    def Insert(self, width: int, height: int) -> t.Optional[tuple[int, int]]:
+        '''
+        Размещает прямоугольник.
+
+        Returns:
+            Позиция (x, y) или None, если прямоугольник не помещается на страницу.
+        '''
+        best: t.Optional[tuple[int, int, int, int]] = None  # (bottom, width, index, y)
+
+        for index, (_, _, segment_width) in enumerate(self._skyline):
+            if (y := self._Fit(index, width, height)) is None:
+                continue
+
+            if best is None or (y + height, segment_width) < best[:2]:
+                best = (y + height, segment_width, index, y)
+
+        if best is None:
+            return None
+
+        _, _, index, y = best
+        x = self._skyline[index][0]
+
+        self._skyline.insert(index, (x, y + height, width))
+
+        i = index + 1
+        while i < len(self._skyline):
+            seg_x, seg_y, seg_width = self._skyline[i]
+            prev_x, _, prev_width = self._skyline[i - 1]
+
+            if seg_x >= prev_x + prev_width:
+                break
+
+            shrink = prev_x + prev_width - seg_x
+            if seg_width - shrink > 0:
+                self._skyline[i] = (seg_x + shrink, seg_y, seg_width - shrink)
+                break
+
+            self._skyline.pop(i)
+
+        self._Merge()
+
+        return x, y
+
+    def _Merge(self):
+        i = 0
+        while i < len(self._skyline) - 1:
+            x, y, width = self._skyline[i]
+            if y == self._skyline[i + 1][1]:
+                self._skyline[i] = (x, y, width + self._skyline[i + 1][2])
+                self._skyline.pop(i + 1)
+            else:
+                i += 1
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+
+class TextureAtlas(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Атлас кадров анимаций, разложенных по слоям (страницам) одного `texture_2d_array`.
+
+    Поддерживает два режима:
+        - Build: упаковка заранее известного набора анимаций (кадры сортируются по высоте).
+        - Insert: инкрементальное добавление анимаций во время работы.
+
+    Методы, загружающие данные в текстуру, требуют контекста OpenGL. В текстуру догружаются только
+    новые кадры, целиком атлас загружается лишь при пересоздании текстуры (появлении страниц).
+    '''
+
+    __slots__ = (
+        '_window',
+        '_page_size',
+        '_padding',
+        '_packers',
+        '_pixels',
+        '_regions',
+        '_texture',
+        '_dirty',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        page_size: tuple[int, int] = (1024, 1024),
+        padding: int = 1,
+    ):
+        self._window = window
+
+        self._page_size: tuple[int, int] = page_size
+        self._padding: int = padding
+
+        self._packers: list[SkylinePacker] = []
+        self._pixels: np.ndarray = np.zeros((0, page_size[1], page_size[0], 4), dtype=np.uint8)
+        self._regions: dict[str, tuple[AtlasRegion, ...]] = {}
+
+        self._texture: t.Optional[Texture] = None
+        # области, ещё не загруженные в текстуру
+        self._dirty: list[AtlasRegion] = []
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        if self._texture is not None:
+            self._texture.Dispose()
+            self._texture = None
+
+    @staticmethod
+    def _GetFramesPixels(animation: 'Animation') -> np.ndarray:
+        return animation.GetFramesArray()
+
+    def _AddPage(self):
+        self._packers.append(SkylinePacker(*self._page_size))
+        self._pixels = np.concatenate(
+            (self._pixels, np.zeros((1, self._page_size[1], self._page_size[0], 4), dtype=np.uint8)),
+        )
+
+    def _Place(self, pixels: np.ndarray) -> AtlasRegion:
+        height, width = pixels.shape[:2]
+        padded = (width + self._padding * 2, height + self._padding * 2)
+
+        if padded[0] > self._page_size[0] or padded[1] > self._page_size[1]:
+            raise ValueError(f'Frame {width}x{height} does not fit into atlas page {self._page_size}')
+
+        for layer, packer in enumerate(self._packers):
+            if (position := packer.Insert(*padded)) is not None:
+                break
+        else:
+            self._AddPage()
+            layer = len(self._packers) - 1
+            position = self._packers[layer].Insert(*padded)
+            if position is None:
+                raise RuntimeError()
+
+        x, y = position[0] + self._padding, position[1] + self._padding
+        self._pixels[layer, y : y + height, x : x + width] = pixels
+
+        region = AtlasRegion(layer, x, y, width, height)
+        self._dirty.append(region)
+
+        return region
+
+    def Insert(self, animation: 'Animation') -> tuple[AtlasRegion, ...]:
+        '''
+        Инкрементально добавляет кадры анимации в атлас.
+        '''
+        if (regions := self._regions.get(animation.name)) is not None:
+            return regions
+
+        regions = tuple(self._Place(pixels) for pixels in self._GetFramesPixels(animation))
+        self._regions[animation.name] = regions
+
+        return regions
+
+    def Build(self, animations: t.Iterable['Animation']):
+        '''
+        Упаковывает набор анимаций за один проход.
+
+        Кадры упаковываются в порядке убывания высоты, что даёт более плотную укладку, чем последовательные Insert.
+        '''
+        frames: list[tuple[str, int, np.ndarray]] = [
+            (animation.name, index, pixels)
+            for animation in animations
+            if animation.name not in self._regions
+            for index, pixels in enumerate(self._GetFramesPixels(animation))
+        ]
+        placed: dict[str, dict[int, AtlasRegion]] = {}
+
+        for name, index, pixels in sorted(frames, key=lambda item: (item[2].shape[0], item[2].shape[1]), reverse=True):
+            placed.setdefault(name, {})[index] = self._Place(pixels)
+
+        for name, regions in placed.items():
+            self._regions[name] = tuple(regions[index] for index in range(len(regions)))
+
+        return self
+
+    def Get(self, name: str) -> t.Optional[tuple[AtlasRegion, ...]]:
+        return self._regions.get(name)
+
+    def Has(self, name: str) -> bool:
+        return name in self._regions
+
+    def GetUVRect(self, region: AtlasRegion) -> tuple[float, float, float, float]:
+        return region.GetUVRect(self._page_size)
+
+    def Upload(self) -> Texture:
+        '''
+        Загружает новые кадры в текстуру. При появлении новых страниц текстура пересоздаётся и загружается целиком.
+        '''
+        if len(self._dirty) == 0 and self._texture is not None:
+            return self._texture
+
+        pages = max(1, len(self._packers))
+
+        if self._texture is None or self._texture.depth != pages:
+            if self._texture is not None:
+                self._texture.Dispose()
+
+            self._texture = Texture(self._window, 'texture_2d_array')
+            with self._texture.Bind() as texture:
+                texture.AllocateStorage3D(self._page_size, pages)
+                if len(self._packers) > 0:
+                    texture.SubImage3D(self._pixels)
+
+        else:
+            with self._texture.Bind() as texture:
+                for region in self._dirty:
+                    texture.SubImage3D(
+                        np.ascontiguousarray(
+                            self._pixels[
+                                region.layer : region.layer + 1,
+                                region.y : region.y + region.height,
+                                region.x : region.x + region.width,
+                            ]
+                        ),
+                        (region.x, region.y, region.layer),
+                    )
+
+        self._dirty.clear()
+
+        return self._texture
+
+    @property
+    def texture(self) -> Texture:
+        return self.Upload()
+
+    @property
+    def page_size(self) -> tuple[int, int]:
+        return self._page_size
+
+    @property
+    def pages(self) -> int:
+        return len(self._packers)
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def count(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, item: str):
+        return self.Has(item)
+
+    def __len__(self):
+        return self.count
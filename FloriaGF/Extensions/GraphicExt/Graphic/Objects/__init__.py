@@ -1 +1,2 @@
-from .TextureArrays import TextureArrays
+from .TextureArrays import TextureArrays, TextureArrayPool, TextureArraySlice
+from .TextureAtlas import TextureAtlas, AtlasRegion, SkylinePacker
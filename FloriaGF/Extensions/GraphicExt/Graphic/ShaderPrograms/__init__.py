@@ -1 +1,2 @@
 from .Sprite3DShaderProgram import Sprite3DShaderProgram
+from .AtlasSprite3DShaderProgram import AtlasSprite3DShaderProgram
@@ -13,7 +13,7 @@ class AnimationManager(
 ):
     @property
     def sequence(self) -> AnimationSequence[Animation]:
-        return AnimationSequence(self._storage.values())
+        return AnimationSequence(self._storage.values(), self._GetSequenceIndex())
 
     @staticmethod
     def _GetKey(item: Animation) -> t.Any:
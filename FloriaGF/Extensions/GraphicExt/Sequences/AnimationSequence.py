@@ -6,6 +6,9 @@ from FloriaGF.Sequences.Sequence import Sequence
 
 from ..Graphic.Animation import Animation
 
+if t.TYPE_CHECKING:
+    from FloriaGF.Sequences.SequenceIndex import SequenceIndex
+
 
 TItem = t.TypeVar('TItem', bound=Animation, covariant=True)
 
@@ -17,8 +20,8 @@ class AnimationSequence(
     t.Generic[TItem],
 ):
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return AnimationSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return AnimationSequence(source, index)
 
     if t.TYPE_CHECKING:
 
@@ -6,6 +6,7 @@ from OpenGL import GL
 import OpenGL
 
 from . import Logger
+from ..Config import Config
 
 
 @contextmanager
@@ -16,7 +17,13 @@ def Bind[T: t.Any](
     release_func: t.Callable[[T], t.Any],
     equal_func: t.Callable[[T, T], bool] = lambda x, y: x == y,
     name: str = '- ? -',
+    lazy: bool = False,
 ):
+    '''
+    Args:
+        lazy: не отвязывать объект, когда стек опустел. Объект остаётся привязанным до следующей привязки,
+            а теневое состояние (`State`) отбрасывает её, если привязывается тот же объект.
+    '''
     skip = len(stack) > 0 and equal_func(stack[-1], item)
 
     try:
@@ -31,7 +38,7 @@ def Bind[T: t.Any](
 
         yield
 
-        if not OpenGL.ERROR_CHECKING and not skip and (code := GL.glGetError()) != GL.GL_NO_ERROR:
+        if Config.GL_CHECK_ERRORS and not OpenGL.ERROR_CHECKING and not skip and (code := GL.glGetError()) != GL.GL_NO_ERROR:
             raise RuntimeError(code)
 
     finally:
@@ -44,6 +51,9 @@ def Bind[T: t.Any](
                 get_func(prev_item)
                 Logger.OutPut(name, f'* {item} -> {prev_item}', False, prev_item)
 
+            elif lazy:
+                Logger.OutPut(name, '~', False, item)
+
             else:
                 release_func(item)
                 Logger.OutPut(name, '-', False, item)
@@ -1,11 +1,12 @@
 from OpenGL import GL
 import typing as t
+import functools
 import types as ts
 import numpy as np
 from collections import deque
 from contextlib import contextmanager
 
-from .. import Binding, hints, Convert
+from .. import Binding, State, hints, Convert
 
 
 def Create() -> int:
@@ -14,6 +15,9 @@ def Create() -> int:
 
 def Delete(*ids: int):
     GL.glDeleteBuffers(len(ids), ids)
+    for id in ids:
+        State.Forget('buffer', id)
+        State.Forget('buffer_base', id)
 
 
 def Data(
@@ -42,16 +46,52 @@ def SubData(
     )
 
 
+def CopySubData(read_id: int, write_id: int, read_offset: int, write_offset: int, size: int):
+    with Bind('copy_read_buffer', read_id), Bind('copy_write_buffer', write_id):
+        GL.glCopyBufferSubData(GL.GL_COPY_READ_BUFFER, GL.GL_COPY_WRITE_BUFFER, read_offset, write_offset, size)
+
+
+def BindBase(type: hints.buffer_type, index: int, id: int):
+    if State.Set(('buffer_base', type, index), id, GL.glBindBufferBase, Convert.ToOpenGLBufferType(type), index, id):
+        # glBindBufferBase также меняет общую точку привязки
+        State.Assume(('buffer', type), id)
+
+
+def BindRange(type: hints.buffer_type, index: int, id: int, offset: int, size: int):
+    if State.Set(
+        ('buffer_base', type, index),
+        (id, offset, size),
+        GL.glBindBufferRange,
+        Convert.ToOpenGLBufferType(type),
+        index,
+        id,
+        offset,
+        size,
+    ):
+        State.Assume(('buffer', type), id)
+
+
+@functools.cache
+def GetUniformOffsetAlignment() -> int:
+    '''
+    Требует контекста OpenGL.
+
+    Returns:
+        Выравнивание смещения `BindRange` для `uniform_buffer`.
+    '''
+    return int(GL.glGetIntegerv(GL.GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+
+
 _item = tuple[hints.buffer_type, int]
 _stack = deque[_item]()
 
 
 def _Get(item: _item):
-    GL.glBindBuffer(Convert.ToOpenGLBufferType(item[0]), item[1])
+    State.Set(('buffer', item[0]), item[1], GL.glBindBuffer, Convert.ToOpenGLBufferType(item[0]), item[1])
 
 
 def _Release(item: _item):
-    GL.glBindBuffer(Convert.ToOpenGLBufferType(item[0]), 0)
+    State.Set(('buffer', item[0]), 0, GL.glBindBuffer, Convert.ToOpenGLBufferType(item[0]), 0)
 
 
 @contextmanager
@@ -62,5 +102,7 @@ def Bind(type: hints.buffer_type, id: int):
         _Get,
         _Release,
         name='Buffer',
+        # индексный буфер отвязывается сразу, чтобы не попасть в следующий привязанный VAO
+        lazy=type != 'element_array_buffer',
     ):
         yield
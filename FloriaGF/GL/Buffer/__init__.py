@@ -1 +1,11 @@
-from .Common import Create, Delete, Data, SubData, Bind
+from .Common import (
+    Create,
+    Delete,
+    Data,
+    SubData,
+    CopySubData,
+    BindBase,
+    BindRange,
+    GetUniformOffsetAlignment,
+    Bind,
+)
@@ -3,7 +3,7 @@ from OpenGL import GL
 import functools
 
 from .. import Types
-from . import hints, Convert
+from . import State, hints, Convert
 
 
 def ClearColor(color: Types.hints.rgba | Types.hints.rgb):
@@ -12,7 +12,7 @@ def ClearColor(color: Types.hints.rgba | Types.hints.rgb):
     if len(values) < 4:
         values = (*values, 255)
 
-    GL.glClearColor(*(x / 255 for x in values))
+    State.Set(('clear_color',), values, GL.glClearColor, *(x / 255 for x in values))
 
 
 def Clear(*masks: hints.mask):
@@ -29,16 +29,35 @@ def Viewport(
     offset: Types.hints.offset_2d,
     size: Types.hints.size_2d,
 ):
-    GL.glViewport(*offset, *size)
+    State.Set(('viewport',), (*offset, *size), GL.glViewport, *offset, *size)
 
 
 def DepthFunc(value: hints.depth_func):
-    GL.glDepthFunc(Convert.ToDepthFunc(value))
+    State.Set(('depth_func',), value, GL.glDepthFunc, Convert.ToDepthFunc(value))
 
 
 def BlendEquation(value: hints.blend_equation):
-    GL.glBlendEquation(Convert.ToOpenGLBlendEquation(value))
+    State.Set(('blend_equation',), value, GL.glBlendEquation, Convert.ToOpenGLBlendEquation(value))
 
 
 def BlendFactors(blend_factors: tuple[hints.blend_factor, hints.blend_factor]):
-    GL.glBlendFunc(*(Convert.ToOpenGLBlendFactor(factor) for factor in blend_factors))
+    State.Set(
+        ('blend_factors',),
+        tuple(blend_factors),
+        GL.glBlendFunc,
+        *(Convert.ToOpenGLBlendFactor(factor) for factor in blend_factors),
+    )
+
+
+@functools.cache
+def GetDriverInfo() -> tuple[str, str, str]:
+    '''
+    Требует контекста OpenGL.
+
+    Returns:
+        (производитель, устройство, версия) драйвера.
+    '''
+    return t.cast(
+        tuple[str, str, str],
+        tuple((GL.glGetString(name) or b'').decode(errors='replace') for name in (GL.GL_VENDOR, GL.GL_RENDERER, GL.GL_VERSION)),
+    )
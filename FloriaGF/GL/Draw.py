@@ -1,4 +1,6 @@
 import typing as t
+import ctypes
+import numpy as np
 from OpenGL import GL
 
 # from .. import Types, Convert
@@ -43,3 +45,81 @@ def ElementsInstanced(
         None,
         instance_count,
     )
+
+
+def ElementsInstancedBaseVertex(
+    primitive: hints.primitive,
+    count: int,
+    instance_count: int,
+    first_index: int = 0,
+    base_vertex: int = 0,
+):
+    GL.glDrawElementsInstancedBaseVertex(
+        Convert.ToOpenGLPrimitive(primitive),
+        count,
+        GL.GL_UNSIGNED_INT,
+        ctypes.c_void_p(first_index * ctypes.sizeof(ctypes.c_uint32)),
+        instance_count,
+        base_vertex,
+    )
+
+
+ARRAYS_INDIRECT_COMMAND: t.Final = np.dtype(
+    [
+        ('count', np.uint32),
+        ('instance_count', np.uint32),
+        ('first', np.uint32),
+        ('base_instance', np.uint32),
+    ]
+)
+'''`DrawArraysIndirectCommand`'''
+
+ELEMENTS_INDIRECT_COMMAND: t.Final = np.dtype(
+    [
+        ('count', np.uint32),
+        ('instance_count', np.uint32),
+        ('first_index', np.uint32),
+        ('base_vertex', np.int32),
+        ('base_instance', np.uint32),
+    ]
+)
+'''`DrawElementsIndirectCommand`'''
+
+
+def SupportsMultiDrawIndirect(context_version: t.Sequence[int]) -> bool:
+    return tuple(context_version) >= (4, 3)
+
+
+def MultiArraysIndirect(
+    primitive: hints.primitive,
+    draw_count: int,
+    offset: int = 0,
+    stride: int = 0,
+):
+    '''
+    Требует OpenGL 4.3 и привязанного `draw_indirect_buffer` с командами `ARRAYS_INDIRECT_COMMAND`.
+    '''
+    GL.glMultiDrawArraysIndirect(
+        Convert.ToOpenGLPrimitive(primitive),
+        ctypes.c_void_p(offset),
+        draw_count,
+        stride,
+    )
+
+
+def MultiElementsIndirect(
+    primitive: hints.primitive,
+    draw_count: int,
+    offset: int = 0,
+    stride: int = 0,
+):
+    '''
+    Требует OpenGL 4.3 и привязанного `draw_indirect_buffer` с командами `ELEMENTS_INDIRECT_COMMAND`.
+    '''
+    GL.glMultiDrawElementsIndirect(
+        Convert.ToOpenGLPrimitive(primitive),
+        GL.GL_UNSIGNED_INT,
+        ctypes.c_void_p(offset),
+        draw_count,
+        stride,
+    )
@@ -7,7 +7,7 @@ from contextlib import contextmanager
 import asyncio
 
 from ... import Types, Validator
-from .. import Binding, hints, Convert
+from .. import Binding, State, hints, Convert
 from ..Common import Viewport
 
 if t.TYPE_CHECKING:
@@ -20,6 +20,8 @@ def Create() -> int:
 
 def Delete(*ids: int):
     GL.glDeleteFramebuffers(len(ids), ids)
+    for id in ids:
+        State.Forget('framebuffer', id)
 
 
 def AttachTexture2D[TTex: 'Texture | int'](
@@ -52,12 +54,12 @@ _stack = deque[_item]()
 
 
 def _Get(item: _item):
-    GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, item[0])
+    State.Set(('framebuffer',), item[0], GL.glBindFramebuffer, GL.GL_FRAMEBUFFER, item[0])
     Viewport((0, 0), item[1])
 
 
 def _Release(item: _item):
-    GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, 0)
+    State.Set(('framebuffer',), 0, GL.glBindFramebuffer, GL.GL_FRAMEBUFFER, 0)
 
 
 @contextmanager
@@ -0,0 +1,88 @@
+import typing as t
+import numpy as np
+
+from . import hints
+
+if t.TYPE_CHECKING:
+    from .. import Abc
+
+
+# тип: (тип элемента, компонентов в столбце, столбцов)
+_BLOCK_TYPES: t.Final[dict[hints.glsl_type, tuple[type, int, int]]] = {
+    'float': (np.float32, 1, 1),
+    'int': (np.int32, 1, 1),
+    'uint': (np.uint32, 1, 1),
+    'vec2': (np.float32, 2, 1),
+    'vec3': (np.float32, 3, 1),
+    'vec4': (np.float32, 4, 1),
+    'mat3': (np.float32, 3, 3),
+    'mat4': (np.float32, 4, 4),
+}
+
+
+def _Align(value: int, alignment: int) -> int:
+    return -(-value // alignment) * alignment
+
+
+def GetFieldLayout(
+    type: hints.glsl_type,
+    layout: hints.block_layout = 'std140',
+) -> tuple[int, np.typing.DTypeLike, tuple[int, ...]]:
+    '''
+    Returns:
+        (выравнивание, тип элемента, форма) поля блока.
+        Столбцы матриц дополняются до выравнивания: `mat3` в std140 имеет форму `(3, 4)`.
+    '''
+    if (item := _BLOCK_TYPES.get(type)) is None:
+        raise ValueError(type)
+
+    dtype, components, columns = item
+
+    # vec3 выравнивается как vec4
+    alignment = 4 * (components if components != 3 else 4)
+
+    if columns == 1:
+        return alignment, dtype, (components,)
+
+    if layout == 'std140':
+        alignment = _Align(alignment, 16)
+
+    return alignment, dtype, (columns, alignment // 4)
+
+
+def GetBlockDType(
+    fields: t.Iterable['Abc.Graphic.ShaderPrograms.SchemeItem'],
+    layout: hints.block_layout = 'std140',
+) -> np.dtype:
+    '''
+    Структурированный dtype записи блока с явными смещениями по правилам `layout`.
+    Запись такого dtype загружается в буфер одним вызовом без перепаковки.
+    '''
+    names: list[str] = []
+    formats: list[tuple[np.typing.DTypeLike, tuple[int, ...]]] = []
+    offsets: list[int] = []
+
+    offset = 0
+    max_alignment = 4
+    for item in fields:
+        alignment, dtype, shape = GetFieldLayout(item['type'], layout)
+        offset = _Align(offset, alignment)
+
+        names.append(item['name'])
+        formats.append((dtype, shape))
+        offsets.append(offset)
+
+        offset += np.dtype((dtype, shape)).itemsize
+        max_alignment = max(max_alignment, alignment)
+
+    if layout == 'std140':
+        max_alignment = _Align(max_alignment, 16)
+
+    return np.dtype(
+        {
+            'names': names,
+            'formats': formats,
+            'offsets': offsets,
+            'itemsize': _Align(offset, max_alignment),
+        }
+    )
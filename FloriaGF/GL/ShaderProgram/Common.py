@@ -5,8 +5,9 @@ import types as ts
 from collections import deque
 from contextlib import contextmanager, asynccontextmanager
 import asyncio
+import numpy as np
 
-from .. import Binding
+from .. import Binding, State
 
 
 def Create() -> int:
@@ -15,6 +16,7 @@ def Create() -> int:
 
 def Delete(id: int):
     GL.glDeleteProgram(id)
+    State.Forget('program', id)
 
 
 def Attach(id: int, *shader_ids: int):
@@ -34,6 +36,44 @@ def Validate(id: int):
         raise RuntimeError(GL.glGetProgramInfoLog(id).decode())
 
 
+def SetBinaryRetrievable(id: int):
+    '''
+    Вызывается до `Link`, чтобы драйвер сохранил бинарник программы для `GetBinary`.
+    '''
+    GL.glProgramParameteri(id, GL.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL.GL_TRUE)
+
+
+def SupportsBinary() -> bool:
+    return int(GL.glGetIntegerv(GL.GL_NUM_PROGRAM_BINARY_FORMATS)) > 0
+
+
+def GetBinary(id: int) -> t.Optional[tuple[int, bytes]]:
+    '''
+    Returns:
+        (формат, бинарник) слинкованной программы или None, если драйвер не сохранил бинарник.
+    '''
+    size = int(GL.glGetProgramiv(id, GL.GL_PROGRAM_BINARY_LENGTH))
+    if size <= 0:
+        return None
+
+    length = np.zeros(1, dtype=np.int32)
+    format = np.zeros(1, dtype=np.uint32)
+    data = np.empty(size, dtype=np.uint8)
+
+    GL.glGetProgramBinary(id, size, length, format, data)
+
+    return int(format[0]), data[: int(length[0])].tobytes()
+
+
+def LoadBinary(id: int, format: int, data: bytes) -> bool:
+    '''
+    Returns:
+        Принял ли драйвер бинарник. При смене драйвера или железа бинарник отвергается.
+    '''
+    GL.glProgramBinary(id, format, np.frombuffer(data, dtype=np.uint8), len(data))
+    return GL.glGetProgramiv(id, GL.GL_LINK_STATUS) == GL.GL_TRUE
+
+
 def GetUniformLocation(id: int, name: str) -> int:
     return GL.glGetUniformLocation(id, name)
 
@@ -44,15 +84,45 @@ def GetUniformBlockIndex(id: int, name: str) -> int:
     return index
 
 
+def GetUniformBlockLayout(id: int, name: str) -> t.Optional[tuple[int, dict[str, int]]]:
+    '''
+    Returns:
+        (размер данных блока, {поле: смещение}) по данным драйвера или None, если блок неактивен.
+        Имена полей без префикса блока.
+    '''
+    if (index := GL.glGetUniformBlockIndex(id, name)) == GL.GL_INVALID_INDEX:
+        return None
+
+    params = np.zeros(2, dtype=np.int32)
+    GL.glGetActiveUniformBlockiv(id, index, GL.GL_UNIFORM_BLOCK_DATA_SIZE, params[0:])
+    GL.glGetActiveUniformBlockiv(id, index, GL.GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS, params[1:])
+    size, count = int(params[0]), int(params[1])
+
+    indices = np.zeros(count, dtype=np.int32)
+    GL.glGetActiveUniformBlockiv(id, index, GL.GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES, indices)
+
+    offsets = np.zeros(count, dtype=np.int32)
+    GL.glGetActiveUniformsiv(id, count, indices.astype(np.uint32), GL.GL_UNIFORM_OFFSET, offsets)
+
+    fields: dict[str, int] = {}
+    for uniform_index, offset in zip(indices, offsets):
+        # PyOpenGL возвращает [длина, массив int8], а не bytes
+        length, chars = GL.glGetActiveUniformName(id, int(uniform_index), 256)
+        uniform_name = bytes(np.asarray(chars[:length], dtype=np.uint8)).decode()
+        fields[uniform_name.removeprefix(f'{name}.')] = int(offset)
+
+    return size, fields
+
+
 _stack = deque[int]()
 
 
 def _Get(id: int):
-    GL.glUseProgram(id)
+    State.Set(('program',), id, GL.glUseProgram, id)
 
 
 def _Release(id: int):
-    GL.glUseProgram(0)
+    State.Set(('program',), 0, GL.glUseProgram, 0)
 
 
 @contextmanager
@@ -63,5 +133,6 @@ def Bind(id: int):
         _Get,
         _Release,
         name='ShaderProgram',
+        lazy=True,
     ):
         yield
@@ -1 +1,15 @@
-from .Common import Create, Attach, Bind, Delete, Link, Validate, GetUniformLocation, GetUniformBlockIndex
+from .Common import (
+    Create,
+    Attach,
+    Bind,
+    Delete,
+    Link,
+    Validate,
+    SetBinaryRetrievable,
+    SupportsBinary,
+    GetBinary,
+    LoadBinary,
+    GetUniformLocation,
+    GetUniformBlockIndex,
+    GetUniformBlockLayout,
+)
@@ -1,43 +1,129 @@
+import typing as t
 from OpenGL import GL
 from . import hints, Convert
 
 
-_depth: bool = False
-_blend: bool = False
+class CallStats(t.NamedTuple):
+    '''Счётчики вызовов OpenGL за кадр.'''
 
+    issued: int
+    '''Выполнено вызовов, меняющих состояние.'''
+    elided: int
+    '''Отброшено избыточных вызовов.'''
 
-def Enable(cap: hints.capability):
-    if cap == 'depth':
-        global _depth
 
-        if _depth:
-            return
-        _depth = True
+_UNSET: t.Final = object()
+
+# ('program',) / ('vao',) / ('buffer', type) / ('buffer_base', type, index) / ('texture', unit, type) / ('active_texture',)
+# ('framebuffer',) / ('viewport',) / ('cap', cap) / ('depth_func',) / ('blend_equation',) / ('blend_factors',) / ...
+_state: dict[tuple[t.Any, ...], t.Any] = {}
+
+_issued: int = 0
+_elided: int = 0
+
+_context: t.Any = None
+
+
+def Set(key: tuple[t.Any, ...], value: t.Any, func: t.Callable[..., t.Any], *args: t.Any) -> bool:
+    '''
+    Вызывает `func(*args)`, только если теневое значение `key` отличается от `value`.
+
+    Returns:
+        Был ли выполнен вызов.
+    '''
+    global _issued, _elided
+
+    if _state.get(key, _UNSET) == value:
+        _elided += 1
+        return False
+
+    func(*args)
+    _state[key] = value
+    _issued += 1
+    return True
+
+
+def Get(key: tuple[t.Any, ...], default: t.Any = None) -> t.Any:
+    return _state.get(key, default)
+
+
+def Assume(key: tuple[t.Any, ...], value: t.Any):
+    '''
+    Записывает значение, установленное побочным эффектом другого вызова.
+    '''
+    _state[key] = value
+
 
-    elif cap == 'blend':
-        global _blend
+def Reset(*keys: tuple[t.Any, ...]):
+    '''
+    Забывает значения ключей - следующий вызов будет выполнен безусловно.
+    '''
+    for key in keys:
+        _state.pop(key, None)
 
-        if _blend:
-            return
-        _blend = True
 
-    GL.glEnable(Convert.ToOpenGLCapability(cap))
+def Forget(kind: str, value: t.Any):
+    '''
+    Забывает все привязки вида `kind`, указывающие на `value`.
+
+    Вызывается при удалении объекта: драйвер отвязывает его сам, а имя может быть выдано повторно.
+    Значения вида `(id, ...)` (например, диапазоны `BindRange`) сравниваются по первому элементу.
+    '''
+    for key in [
+        key
+        for key, item in _state.items()
+        if key[0] == kind and (item == value or (isinstance(item, tuple) and item[0] == value))
+    ]:
+        _state.pop(key)
+
+
+def Invalidate():
+    '''
+    Сбрасывает теневое состояние. Вызывается при смене текущего контекста.
+    '''
+    _state.clear()
+
+
+def EndFrame() -> CallStats:
+    '''
+    Returns:
+        Счётчики с прошлого вызова, после чего обнуляет их.
+    '''
+    global _issued, _elided
+
+    stats = CallStats(_issued, _elided)
+    _issued = _elided = 0
+    return stats
+
+
+def GetCallStats() -> CallStats:
+    return CallStats(_issued, _elided)
+
+
+def Enable(cap: hints.capability):
+    Set(('cap', cap), True, GL.glEnable, Convert.ToOpenGLCapability(cap))
 
 
 def Disable(cap: hints.capability):
-    if cap == 'depth':
-        global _depth
+    Set(('cap', cap), False, GL.glDisable, Convert.ToOpenGLCapability(cap))
+
+
+def SetContext(context: t.Any):
+    '''
+    Отмечает смену текущего контекста. Теневое состояние сохраняется, пока контекст тот же.
+    '''
+    global _context
+
+    if context is None or context == _context:
+        return
 
-        if not _depth:
-            return
-        _depth = False
+    Invalidate()
+    _context = context
 
-    elif cap == 'blend':
-        global _blend
 
-        if not _blend:
-            return
-        _blend = False
+def DropContext(context: t.Any):
+    global _context
 
-    else:
-        GL.glDisable(Convert.ToOpenGLCapability(cap))
+    if context == _context:
+        Invalidate()
+        _context = None
@@ -5,10 +5,11 @@ import types as ts
 from collections import deque
 from contextlib import contextmanager
 import asyncio
+import functools
 import numpy as np
 
 from ... import Types
-from .. import Binding, hints, Convert
+from .. import Binding, State, hints, Convert
 
 
 def Create() -> int:
@@ -17,6 +18,18 @@ def Create() -> int:
 
 def Delete(id: int):
     GL.glDeleteTextures(1, [id])
+    State.Forget('texture', id)
+
+
+def ActiveTexture(unit: int):
+    State.Set(('active_texture',), unit, GL.glActiveTexture, int(GL.GL_TEXTURE0) + unit)
+
+
+def GetActiveTexture() -> int:
+    if (unit := State.Get(('active_texture',))) is None:
+        ActiveTexture(0)
+        return 0
+    return unit
 
 
 def TexImage2D(
@@ -79,6 +92,71 @@ def TexSubImage3D(
     )
 
 
+def GetTexImage(
+    pixels: np.ndarray,
+    type: hints.texture_type = 'texture_2d',
+    *,
+    format: hints.texture_format = 'rgba',
+    pixel_type: hints.texture_pixel_type = 'unsigned_byte',
+    level: int = 0,
+    context_version: t.Optional[Types.hints.context_version] = None,
+) -> np.ndarray:
+    '''
+    Считывает содержимое привязанной текстуры в заранее выделенный массив `pixels`.
+    '''
+    GL.glGetTexImage(
+        Convert.ToOpenGLTextureType(type, context_version),
+        level,
+        Convert.ToOpenGLTextureFormat(format, context_version),
+        Convert.ToOpenGLType(pixel_type, context_version),
+        pixels,
+    )
+    return pixels
+
+
+def SupportsCopyImage(context_version: t.Sequence[int]) -> bool:
+    return tuple(context_version) >= (4, 3)
+
+
+def CopyImageSubData(
+    source: int,
+    destination: int,
+    size: Types.hints.size_3d,
+    type: hints.texture_type = 'texture_2d',
+    *,
+    source_offset: Types.hints.offset_3d = (0, 0, 0),
+    destination_offset: Types.hints.offset_3d = (0, 0, 0),
+    level: int = 0,
+    context_version: t.Optional[Types.hints.context_version] = None,
+):
+    '''
+    Копирует область между текстурами на стороне GPU, без привязки. Требует OpenGL 4.3.
+    '''
+    gl_type = Convert.ToOpenGLTextureType(type, context_version)
+    GL.glCopyImageSubData(
+        source,
+        gl_type,
+        level,
+        *source_offset,
+        destination,
+        gl_type,
+        level,
+        *destination_offset,
+        *size,
+    )
+
+
+@functools.cache
+def GetMaxArrayLayers() -> int:
+    '''
+    Требует контекста OpenGL.
+
+    Returns:
+        Предел слоёв `texture_2d_array` драйвера.
+    '''
+    return int(GL.glGetIntegerv(GL.GL_MAX_ARRAY_TEXTURE_LAYERS))
+
+
 def TexParameterWrap(
     type: hints.texture_type,
     wrap_t: hints.texture_wrap,
@@ -124,11 +202,23 @@ _stack = deque[_item]()
 
 
 def _Get(item: _item):
-    GL.glBindTexture(Convert.ToOpenGLTextureType(item[0]), item[1])
+    State.Set(
+        ('texture', GetActiveTexture(), item[0]),
+        item[1],
+        GL.glBindTexture,
+        Convert.ToOpenGLTextureType(item[0]),
+        item[1],
+    )
 
 
 def _Release(item: _item):
-    GL.glBindTexture(Convert.ToOpenGLTextureType(item[0]), 0)
+    State.Set(
+        ('texture', GetActiveTexture(), item[0]),
+        0,
+        GL.glBindTexture,
+        Convert.ToOpenGLTextureType(item[0]),
+        0,
+    )
 
 
 @contextmanager
@@ -139,5 +229,6 @@ def Bind(type: hints.texture_type, id: int):
         _Get,
         _Release,
         name='Texture',
+        lazy=True,
     ):
         yield
@@ -2,9 +2,15 @@ from .Common import (
     Create,
     Delete,
     Bind,
+    ActiveTexture,
+    GetActiveTexture,
     TexImage2D,
     TexStorage3D,
     TexSubImage3D,
+    GetTexImage,
+    GetMaxArrayLayers,
+    SupportsCopyImage,
+    CopyImageSubData,
     TexParameterWrap,
     TexParameterFilter,
 )
@@ -5,7 +5,7 @@ from collections import deque
 from contextlib import contextmanager
 import ctypes
 
-from .. import Binding, hints, Convert
+from .. import Binding, State, hints, Convert
 
 
 def Create() -> int:
@@ -14,6 +14,9 @@ def Create() -> int:
 
 def Delete(*ids: int):
     GL.glDeleteVertexArrays(len(ids), ids)
+    for id in ids:
+        if State.Get(('vao',)) == id:
+            State.Reset(('vao',), ('buffer', 'element_array_buffer'))
 
 
 def VertexAttribPointer(
@@ -102,12 +105,18 @@ def VertexAttribPointer(
 _stack = deque[int]()
 
 
+def _SetVAO(id: int):
+    # привязка индексного буфера - часть состояния VAO
+    if State.Set(('vao',), id, GL.glBindVertexArray, id):
+        State.Reset(('buffer', 'element_array_buffer'))
+
+
 def _Get(id: int):
-    GL.glBindVertexArray(id)
+    _SetVAO(id)
 
 
 def _Release(id: int):
-    GL.glBindVertexArray(0)
+    _SetVAO(0)
 
 
 @contextmanager
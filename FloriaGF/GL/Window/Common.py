@@ -6,7 +6,7 @@ from collections import deque
 from contextlib import contextmanager
 
 from ... import Types
-from .. import Binding
+from .. import Binding, State
 from .. import hints, Convert
 
 
@@ -16,13 +16,18 @@ GLFWWindow = glfw._GLFWwindow  # pyright: ignore[reportPrivateUsage]
 def Create(
     size: Types.hints.size_2d,
     title: str = 'Title',
+    share: t.Optional[GLFWWindow] = None,
 ) -> GLFWWindow:
+    '''
+    Args:
+        share: Окно, с контекстом которого разделяются программы, буферы и текстуры.
+    '''
     if (
         window := glfw.create_window(
             *size,
             title,
             None,
-            None,
+            t.cast(t.Any, share),
         )
     ) is None:
         raise
@@ -32,6 +37,7 @@ def Create(
 def Delete(*windows: GLFWWindow):
     for window in windows:
         glfw.destroy_window(window)
+        State.DropContext(window)
 
 
 def SwapBuffers(*windows: GLFWWindow):
@@ -59,6 +65,7 @@ _stack = deque[GLFWWindow]()
 
 def _Get(window: GLFWWindow):
     glfw.make_context_current(window)
+    State.SetContext(window)
 
 
 def _Release(window: GLFWWindow):
@@ -11,6 +11,8 @@ from . import (
     ShaderProgram,
     hints,
     Convert,
+    State,
+    Layout,
 )
 
 from .State import Enable, Disable
@@ -21,4 +23,5 @@ from .Common import (
     DepthFunc,
     BlendEquation,
     BlendFactors,
+    GetDriverInfo,
 )
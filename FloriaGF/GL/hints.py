@@ -37,6 +37,11 @@ glsl_sampler = t.Literal[
     'sampler2DArray',
 ]
 
+block_layout = t.Literal[
+    'std140',
+    'std430',
+]
+
 glsl_type = t.Union[
     glsl_primitive,
     glsl_vec,
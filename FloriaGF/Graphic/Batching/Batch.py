@@ -1,5 +1,7 @@
 import typing as t
 from uuid import UUID, uuid4
+from contextlib import ExitStack
+import itertools
 import numpy as np
 
 from ... import Abc, Validator, GL
@@ -7,8 +9,13 @@ from ..Objects.FBO import FBO
 from ..Objects.BO import BO
 from ..Objects.VAO import VAO
 from ...Sequences.InstanceObjectSequence import InstanceObjectSequence
+from ..Objects.MeshArena import MeshArena, MeshArenaRange
+from .IndirectBucket import IndirectBucket, SetupInstanceAttributes
 from ...Flag import Flag
+from ...Config import Config
+from ...Core import Core
 from ...Stopwatch import Stopwatch, stopwatch
+from ...AsyncEvent import AsyncEvent
 
 
 class BatchGroup:
@@ -23,11 +30,12 @@ class BatchGroup:
         'material',
         'scheme',
         'instance_dtype',
+        'arena',
+        'arena_range',
         'vao',
-        'vbo_vertices',
-        'vbo_texcoords',
         'vbo_instances',
-        'ebo_indices',
+        'sort_key',
+        'version',
         '_update_all_buffer',
         #
         '_stopwatch_Update_All',
@@ -60,61 +68,45 @@ class BatchGroup:
         self._stopwatch_Update_All = Stopwatch()
         self._stopwatch_Update_Partical = Stopwatch()
 
-        self.vao, self.vbo_vertices, self.vbo_texcoords, self.vbo_instances, self.ebo_indices = self.SetupGroup()
+        self.arena: MeshArena = Core.mesh_manager.GetArena(batch.window, self.mesh)
+        self.arena_range: MeshArenaRange = self.arena.Add(self.mesh)
+
+        self.vao, self.vbo_instances = self.SetupGroup()
+
+        # (program, texture, vao), обновляется при пересборке очереди батча
+        self.sort_key: tuple[int, int, int] = (0, 0, 0)
+        # увеличивается при каждой загрузке данных экземпляров
+        self.version: int = 0
+
+    def GetSortKey(self) -> tuple[int, int, int]:
+        return (*self.material.GetSortKey(), self.vao.id)
+
+    @property
+    def blended(self) -> bool:
+        return self.material.program.blended
 
     @stopwatch
-    def SetupGroup(self) -> tuple[VAO, BO, t.Optional[BO], t.Optional[BO], t.Optional[BO]]:
+    def SetupGroup(self) -> tuple[VAO, t.Optional[BO]]:
+        '''
+        Геометрия берётся из общей арены меша, группа создаёт только VAO и буфер экземпляров.
+        '''
         with self.batch.window.Bind() as window:
             vao = VAO(window)
-            with vao.Bind() as vao:
-                vbo_vertices = BO(window, 'array_buffer')
-                with vbo_vertices.Bind() as vbo:
-                    if (
-                        vertice := next(
-                            (item for item in self.scheme['base'].items() if item[1]['name'] == 'vertice'),
-                            None,
-                        )
-                    ) is None:
-                        raise RuntimeError()
-
-                    vao.VertexAttribPointer(vertice[0], vertice[1]['type'])
-                    vbo.SetData(self.mesh.vertices)
-
-                vbo_texcoords = None
-                if self.mesh.texcoords is not None:
-                    vbo_texcoords = BO(window, 'array_buffer')
-                    with vbo_texcoords.Bind() as vbo:
-                        if (
-                            texcoord := next(
-                                (item for item in self.scheme['base'].items() if item[1]['name'] == 'texcoord'),
-                                None,
-                            )
-                        ) is None:
-                            raise RuntimeError()
-
-                        vao.VertexAttribPointer(texcoord[0], texcoord[1]['type'])
-                        vbo.SetData(self.mesh.texcoords)
-
-                vbo_instances = None
-                if 'instance' in self.scheme:
-                    vbo_instances = BO(window, 'array_buffer')
-                    with vbo_instances.Bind():
-                        for index, item in self.scheme['instance'].items():
-                            vao.VertexAttribPointer(
-                                index,
-                                item['type'],
-                                self.instance_dtype.itemsize,
-                                self.instance_dtype.fields[item['name']][1],  # type: ignore
-                                attrib_divisor=1,
-                            )
+            self.arena.SetupVAO(vao, self.scheme)
 
-                ebo_indices = None
-                if self.mesh.indices is not None:
-                    ebo_indices = BO(window, 'element_array_buffer')
-                    with ebo_indices.Bind() as ebo:
-                        ebo.SetData(self.mesh.indices)
+            vbo_instances = None
+            if 'instance' in self.scheme:
+                vbo_instances = BO(window, 'array_buffer')
+                with vao.Bind(), vbo_instances.Bind():
+                    SetupInstanceAttributes(vao, self.scheme, self.instance_dtype)
 
-        return vao, vbo_vertices, vbo_texcoords, vbo_instances, ebo_indices
+        return vao, vbo_instances
+
+    def Dispose(self):
+        with self.batch.window.Bind():
+            self.vao.Dispose()
+            if self.vbo_instances is not None:
+                self.vbo_instances.Dispose()
 
     def Register(self, obj: Abc.InstanceObject):
         if self._freeze:
@@ -161,6 +153,7 @@ class BatchGroup:
 
                     with self.vbo_instances.Bind() as vbo:
                         vbo.SetData(self._update_all_buffer, 'stream_draw')
+                    self.version += 1
 
                     self.update_all = False
                     self.update_pool.clear()
@@ -191,6 +184,7 @@ class BatchGroup:
                                 current_start_offset * self.instance_dtype.itemsize,
                                 np.array(current_group, dtype=self.instance_dtype),
                             )
+                        self.version += 1
                         current_group.clear()
 
                     for offset, id in sorted_ids:
@@ -205,21 +199,33 @@ class BatchGroup:
 
     @stopwatch
     def Draw(self, camera: Abc.Camera):
-        with self.vao.Bind():
-            with self.material.Bind(camera):
-                if self.mesh.indices is None or self.ebo_indices is None:
-                    GL.Draw.ArraysInstanced(
-                        self.mesh.primitive,
-                        self.mesh.count,
-                        self.count,
-                    )
-                else:
-                    with self.ebo_indices.Bind():
-                        GL.Draw.ElementsInstanced(
-                            self.mesh.primitive,
-                            len(self.mesh.indices),
-                            self.count,
-                        )
+        with self.material.Bind(camera):
+            with self.vao.Bind():
+                self.DrawBound(camera)
+
+    @stopwatch
+    def DrawBound(self, camera: Abc.Camera):
+        '''
+        Рисует группу, считая материал и VAO уже привязанными.
+        '''
+        item = self.arena_range
+
+        if item.index_count == 0:
+            GL.Draw.ArraysInstanced(
+                self.mesh.primitive,
+                item.vertex_count,
+                self.count,
+                item.first_vertex,
+            )
+        else:
+            with self.arena.ebo.Bind():
+                GL.Draw.ElementsInstancedBaseVertex(
+                    self.mesh.primitive,
+                    item.index_count,
+                    self.count,
+                    item.first_index,
+                    item.first_vertex,
+                )
 
     @property
     def count(self) -> int:
@@ -236,11 +242,28 @@ class BatchGroup:
 class Batch(
     Abc.Batch,
 ):
+    '''
+    Слой объектов.
+
+    Без `program_compose` батч рисуется прямо в цель камеры (между слоями очищается только глубина).
+    С `program_compose` (эффектом слоя) батч рисуется в собственный FBO и композируется этой программой.
+
+    Группы без смешивания рисуются в порядке ключа (программа, текстура, VAO), группы со смешиванием - в порядке
+    регистрации; соседние группы с одинаковой частью ключа не перепривязывают её.
+    Программы спрайтов и UI используют смешивание, поэтому их группы не сортируются и экономят привязки
+    только за счёт соседства: `binds_sorted` для них совпадает с `binds_unsorted`.
+    Счётчики привязок последнего кадра - в `stopwatch_render.counters`, `groups_blended` - число несортируемых групп.
+
+    При `indirect` и OpenGL 4.3+ группы с общим состоянием собираются в `IndirectBucket` и рисуются
+    одним `glMultiDraw*Indirect`; на 4.2 используется отрисовка по группам.
+    '''
+
     __slots__ = (
         '_id',
         '_name',
         '_window',
         '_index',
+        '_enabled',
         '_program_compose',
         '_depth_func',
         '_blend_equation',
@@ -249,6 +272,13 @@ class Batch(
         '_vao_quad',
         '_storage',
         '_groups',
+        '_queue',
+        '_queue_binds',
+        '_indirect',
+        '_buckets',
+        '_stopwatch_render',
+        '_on_change_index',
+        '_on_change_enabled',
     )
 
     def __init__(
@@ -257,67 +287,202 @@ class Batch(
         index: int = 0,
         name: t.Optional[str] = None,
         *,
+        enabled: bool = True,
         program_compose: t.Optional[Abc.ComposeShaderProgram] = None,
         vao_quad: t.Optional[VAO] = None,
+        indirect: t.Optional[bool] = None,
     ):
         self._id: UUID = uuid4()
         self._name: t.Optional[str] = name
 
         self._window = Validator.Instance(window, Abc.Window)
         self._index: int = index
+        self._enabled: bool = enabled
 
-        self._program_compose: Abc.ComposeShaderProgram
-        if program_compose is None:
-            from ..ShaderPrograms.ComposeShaderProgram import ComposeShaderProgram
+        self._on_change_index = AsyncEvent[Abc.Batch, int]()
+        self._on_change_enabled = AsyncEvent[Abc.Batch, bool]()
 
-            self._program_compose = ComposeShaderProgram(window)
-        else:
-            self._program_compose = program_compose
+        self._program_compose: t.Optional[Abc.ComposeShaderProgram] = program_compose
 
         self._storage: dict[UUID, Abc.InstanceObject] = {}
         self._groups: dict[int, BatchGroup] = {}
+        self._queue: t.Optional[list[BatchGroup]] = None
+        # (привязок в порядке регистрации, привязок в порядке очереди)
+        # привязки без сортировки, с сортировкой, число групп со смешиванием
+        self._queue_binds: tuple[int, int, int] = (0, 0, 0)
+        self._stopwatch_render = Stopwatch()
 
-        self._vao_quad: VAO
-        if vao_quad is None:
-            with self.window.Bind():
-                self._vao_quad = VAO.NewQuad(window)
-        else:
-            self._vao_quad = vao_quad
+        self._indirect: bool = (
+            Config.BATCH_DRAW_INDIRECT if indirect is None else indirect
+        ) and GL.Draw.SupportsMultiDrawIndirect(self._window.context_version)
+        self._buckets: t.Optional[list[IndirectBucket]] = None
+
+        self._vao_quad: t.Optional[VAO] = vao_quad
 
         self._fbo: t.Optional[FBO] = None
 
     def Dispose(self, *args: t.Any, **kwargs: t.Any):
         self.RemoveAll()
+        self._ReleaseFBO()
+        self._InvalidateQueue()
+
+    def _ReleaseFBO(self):
+        if self._fbo is not None:
+            self.window.render_target_pool.Release(self._fbo)
+            self._fbo = None
+
+    @staticmethod
+    def _CountBinds(groups: t.Iterable[BatchGroup]) -> int:
+        binds = 0
+        prev: t.Optional[tuple[int, int, int]] = None
+        for group in groups:
+            key = group.sort_key
+            if prev is None or key[:2] != prev[:2]:
+                binds += 2
+            elif key[2] != prev[2]:
+                binds += 1
+            prev = key
+        return binds
+
+    def _GetQueue(self) -> list[BatchGroup]:
+        if self._queue is None:
+            for group in self._groups.values():
+                group.sort_key = group.GetSortKey()
+
+            # группы со смешиванием накладываются на уже нарисованное и сохраняют порядок регистрации,
+            # сортируются только непрерывные участки групп без смешивания между ними
+            queue: list[BatchGroup] = []
+            run: list[BatchGroup] = []
+            for group in self._groups.values():
+                if group.blended:
+                    queue.extend(sorted(run, key=lambda group: group.sort_key))
+                    run.clear()
+                    queue.append(group)
+                else:
+                    run.append(group)
+            queue.extend(sorted(run, key=lambda group: group.sort_key))
+
+            self._queue = queue
+            self._queue_binds = (
+                self._CountBinds(self._groups.values()),
+                self._CountBinds(self._queue),
+                sum(1 for group in self._queue if group.blended),
+            )
+
+        return self._queue
+
+    def _InvalidateQueue(self):
+        self._queue = None
+
+        if self._buckets is not None:
+            with self.window.Bind():
+                for bucket in self._buckets:
+                    bucket.Dispose()
+            self._buckets = None
+
+    def _GetBuckets(self) -> list[IndirectBucket]:
+        if self._buckets is None:
+            self._buckets = [
+                IndirectBucket(self.window, groups[0].arena, groups)
+                for groups in (list(groups) for _, groups in itertools.groupby(self._GetQueue(), key=IndirectBucket.GetKey))
+            ]
+        return self._buckets
+
+    def _RenderBuckets(self, camera: Abc.Camera):
+        with self._stopwatch_render as sw, ExitStack() as material_stack:
+            buckets = self._GetBuckets()
+
+            sw.Count('groups', len(self._GetQueue()))
+            sw.Count('buckets', len(buckets))
+
+            prev: t.Optional[tuple[int, ...]] = None
+            for bucket in buckets:
+                for group in bucket.groups:
+                    if group.update_all or len(group.update_pool) > 0:
+                        group.Update()
+                bucket.Update()
+
+                key = bucket.groups[0].sort_key[:2]
+                if key != prev:
+                    material_stack.close()
+                    material_stack.enter_context(bucket.material.Bind(camera))
+                    sw.Count('binds')
+
+                prev = key
+                bucket.Draw()
+
+    def _RenderGroups(self, camera: Abc.Camera):
+        if self._indirect:
+            self._RenderBuckets(camera)
+            return
+
+        with self._stopwatch_render as sw, ExitStack() as material_stack, ExitStack() as vao_stack:
+            queue = self._GetQueue()
+
+            sw.Count('groups', len(queue))
+            sw.Count('groups_blended', self._queue_binds[2])
+            sw.Count('binds_unsorted', self._queue_binds[0])
+            sw.Count('binds_sorted', self._queue_binds[1])
+
+            prev: t.Optional[tuple[int, int, int]] = None
+            for group in queue:
+                if group.update_all or len(group.update_pool) > 0:
+                    group.Update()
+
+                key = group.sort_key
+                if prev is None or key[:2] != prev[:2]:
+                    vao_stack.close()
+                    material_stack.close()
+                    material_stack.enter_context(group.material.Bind(camera))
+                    vao_stack.enter_context(group.vao.Bind())
+                    sw.Count('binds', 2)
+
+                elif key[2] != prev[2]:
+                    vao_stack.close()
+                    vao_stack.enter_context(group.vao.Bind())
+                    sw.Count('binds')
+
+                prev = key
+                group.DrawBound(camera)
 
     @stopwatch
     def Render(self, camera: Abc.Camera):
-        if self._fbo is None or self._fbo.size != self.window.camera.resolution:
-            self._fbo = FBO(self.window, self.window.camera.resolution)
+        if not self.offscreen:
+            # рисуем в уже привязанную цель камеры, слои разделяются только по глубине
+            GL.Clear('depth')
+            self._RenderGroups(camera)
+            self._ReleaseFBO()
+            return
+
+        self._fbo = self.window.render_target_pool.Resize(self._fbo, camera.resolution)
 
         with self.fbo.Bind():
             GL.ClearColor((0, 0, 0, 0))
             GL.Clear('color', 'depth')
 
-            for group in (*self._groups.values(),):
-                if group.update_all or len(group.update_pool) > 0:
-                    group.Update()
-
-                group.Draw(camera)
+            self._RenderGroups(camera)
 
     @stopwatch
     def Draw(self):
-        with self._vao_quad.Bind():
-            with self.program_compose.Bind(self.fbo):
+        if (program_compose := self._program_compose) is None:
+            return
+
+        with (self.window.vao_quad if self._vao_quad is None else self._vao_quad).Bind():
+            with program_compose.Bind(self.fbo):
                 GL.Draw.Arrays('triangle_fan', 4)
 
     def _RegisterGroup[TGroup: BatchGroup](self, group: TGroup) -> TGroup:
         if group.id in self._groups:
             raise RuntimeError()
         self._groups[group.id] = group
+        self._InvalidateQueue()
         return group
 
     def _RemoveGroupByID(self, id: int) -> BatchGroup:
-        return self._groups.pop(id)
+        self._InvalidateQueue()
+        group = self._groups.pop(id)
+        group.Dispose()
+        return group
 
     def _RemoveGroup[TGroup: BatchGroup](self, group: TGroup) -> TGroup:
         self._RemoveGroupByID(group.id)
@@ -353,6 +518,7 @@ class Batch(
     def UpdateMaterial(self, material: Abc.Material[Abc.Graphic.ShaderPrograms.BatchShaderProgram]):
         for group in filter(lambda group: group.material.id == material.id, self._groups.values()):
             group.update_all = True
+        self._InvalidateQueue()
 
     def Register[TObj: Abc.InstanceObject](self, item: TObj) -> TObj:
         if item.id in self._storage:
@@ -408,20 +574,79 @@ class Batch(
             raise RuntimeError()
         return self._fbo
 
+    @property
+    def stopwatch_render(self) -> Stopwatch:
+        '''
+        Время отрисовки групп и счётчики последнего кадра:
+        `groups`, `binds` (выполнено привязок), `binds_unsorted`/`binds_sorted` (без/с сортировкой очереди),
+        `buckets` (вызовов `glMultiDraw*Indirect`).
+        '''
+        return self._stopwatch_render
+
+    @property
+    def indirect(self) -> bool:
+        return self._indirect
+
     def GetName(self) -> str | None:
         return self._name
 
     def GetID(self):
         return self._id
 
-    @property
-    def index(self):
+    def GetIndex(self) -> int:
         return self._index
 
+    def SetIndex(self, value: int):
+        if value == self._index:
+            return
+        self._index = value
+        self.on_change_index.Invoke(self, value)
+
+    @property
+    def index(self) -> int:
+        return self.GetIndex()
+
+    @index.setter
+    def index(self, value: int):
+        self.SetIndex(value)
+
+    def GetEnabled(self) -> bool:
+        return self._enabled
+
+    def SetEnabled(self, value: bool):
+        '''
+        Выключенный батч не рендерится и не отрисовывается.
+        '''
+        if value == self._enabled:
+            return
+        self._enabled = value
+        self.on_change_enabled.Invoke(self, value)
+
+    @property
+    def enabled(self) -> bool:
+        return self.GetEnabled()
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self.SetEnabled(value)
+
+    @property
+    def on_change_index(self):
+        return self._on_change_index
+
     @property
-    def program_compose(self):
+    def on_change_enabled(self):
+        return self._on_change_enabled
+
+    @property
+    def program_compose(self) -> t.Optional[Abc.ComposeShaderProgram]:
         return self._program_compose
 
+    @property
+    def offscreen(self) -> bool:
+        '''Рисуется ли батч через собственный FBO.'''
+        return self._program_compose is not None
+
     @property
     def count(self):
         return len(self._storage)
@@ -0,0 +1,181 @@
+import typing as t
+
+import numpy as np
+
+from ... import Abc, GL
+from ..Objects.BO import BO
+from ..Objects.VAO import VAO
+from ..Objects.MeshArena import MeshArena
+
+if t.TYPE_CHECKING:
+    from .Batch import BatchGroup
+
+
+def SetupInstanceAttributes(vao: VAO, scheme: Abc.Graphic.ShaderPrograms.Scheme, dtype: np.dtype):
+    '''
+    Настраивает атрибуты `instance` привязанных VAO и буфера экземпляров.
+    '''
+    for index, item in scheme.get('instance', {}).items():
+        vao.VertexAttribPointer(
+            index,
+            item['type'],
+            dtype.itemsize,
+            dtype.fields[item['name']][1],  # type: ignore
+            attrib_divisor=1,
+        )
+
+
+class IndirectBucket(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Группы батча с общим состоянием (программа, текстура, раскладка меша, тип экземпляра),
+    отрисовываемые одним `glMultiDraw*Indirect`.
+
+    Геометрия берётся из `MeshArena`, данные экземпляров групп копируются на стороне GPU
+    в общий буфер, а каждая группа становится командой с `base_instance` = смещению её экземпляров.
+    Копируются только группы, данные которых изменились с прошлого кадра.
+    '''
+
+    __slots__ = (
+        '_window',
+        '_arena',
+        '_groups',
+        '_indexed',
+        '_primitive',
+        '_dtype',
+        '_vao',
+        '_vbo_instances',
+        '_bo_commands',
+        '_capacity',
+        '_layout',
+        '_versions',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        arena: MeshArena,
+        groups: t.Sequence['BatchGroup'],
+    ):
+        if len(groups) == 0:
+            raise ValueError()
+
+        self._window = window
+        self._arena: MeshArena = arena
+        self._groups: tuple['BatchGroup', ...] = tuple(groups)
+
+        first = self._groups[0]
+        self._indexed: bool = first.mesh.indices is not None
+        self._primitive: GL.hints.primitive = first.mesh.primitive
+        self._dtype: np.dtype = first.instance_dtype
+
+        for group in self._groups:
+            arena.Add(group.mesh)
+
+        with window.Bind():
+            self._vao = VAO(window)
+            arena.SetupVAO(self._vao, first.scheme)
+
+            self._vbo_instances = BO(window, 'array_buffer')
+            with self._vao.Bind(), self._vbo_instances.Bind():
+                SetupInstanceAttributes(self._vao, first.scheme, self._dtype)
+
+            self._bo_commands = BO(window, 'draw_indirect_buffer')
+
+        self._capacity: int = 0
+        # (group id, count) на момент последней раскладки
+        self._layout: tuple[tuple[int, int], ...] = ()
+        self._versions: dict[int, int] = {}
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        self._vao.Dispose()
+        self._vbo_instances.Dispose()
+        self._bo_commands.Dispose()
+
+    @staticmethod
+    def GetKey(group: 'BatchGroup') -> t.Hashable:
+        return (
+            group.sort_key[:2],
+            MeshArena.GetLayout(group.mesh),
+            group.mesh.primitive,
+            group.mesh.indices is not None,
+            group.instance_dtype,
+        )
+
+    def _Relayout(self):
+        total = sum(group.count for group in self._groups)
+
+        if total > self._capacity:
+            self._capacity = max(total, self._capacity * 2, 1)
+            with self._vbo_instances.Bind() as vbo:
+                vbo.SetData(np.zeros(self._capacity, dtype=self._dtype), 'stream_draw')
+
+        if self._indexed:
+            commands = np.zeros(len(self._groups), dtype=GL.Draw.ELEMENTS_INDIRECT_COMMAND)
+        else:
+            commands = np.zeros(len(self._groups), dtype=GL.Draw.ARRAYS_INDIRECT_COMMAND)
+
+        base_instance = 0
+        for i, group in enumerate(self._groups):
+            item = self._arena.Add(group.mesh)
+
+            if self._indexed:
+                commands[i] = (item.index_count, group.count, item.first_index, item.first_vertex, base_instance)
+            else:
+                commands[i] = (item.vertex_count, group.count, item.first_vertex, base_instance)
+
+            base_instance += group.count
+
+        with self._bo_commands.Bind() as bo:
+            bo.SetData(commands, 'dynamic_draw')
+
+        self._layout = tuple((group.id, group.count) for group in self._groups)
+        self._versions.clear()
+
+    def Update(self):
+        '''
+        Копирует изменившиеся данные экземпляров групп в общий буфер. Требует контекста OpenGL.
+        '''
+        self._arena.Upload()
+
+        if self._layout != tuple((group.id, group.count) for group in self._groups):
+            self._Relayout()
+
+        offset = 0
+        itemsize = self._dtype.itemsize
+        for group in self._groups:
+            if group.vbo_instances is not None and group.count > 0 and self._versions.get(group.id) != group.version:
+                GL.Buffer.CopySubData(
+                    group.vbo_instances.id,
+                    self._vbo_instances.id,
+                    0,
+                    offset * itemsize,
+                    group.count * itemsize,
+                )
+                self._versions[group.id] = group.version
+
+            offset += group.count
+
+    def Draw(self):
+        '''
+        Требует привязанного материала и OpenGL 4.3.
+        '''
+        with self._vao.Bind(), self._bo_commands.Bind():
+            if self._indexed:
+                with self._arena.ebo.Bind():
+                    GL.Draw.MultiElementsIndirect(self._primitive, len(self._groups))
+            else:
+                GL.Draw.MultiArraysIndirect(self._primitive, len(self._groups))
+
+    @property
+    def groups(self) -> tuple['BatchGroup', ...]:
+        return self._groups
+
+    @property
+    def material(self) -> Abc.Material:
+        return self._groups[0].material
+
+    @property
+    def window(self):
+        return self._window
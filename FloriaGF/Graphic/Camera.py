@@ -5,9 +5,9 @@ import numpy as np
 
 from .. import Abc, Types, Utils, GL
 from ..Config import Config
-from .Objects.BO import BO
 from .Objects.FBO import FBO
 from .Objects.VAO import VAO
+from .Objects.UniformRingBuffer import UniformRingBuffer
 from ..Managers.BatchObjectManager import BatchObjectManager
 from .ShaderPrograms.ComposeShaderProgram import ComposeShaderProgram
 from ..Stopwatch import stopwatch
@@ -66,11 +66,10 @@ class Camera(
         self._window = window
 
         with self.window.Bind():
-            self._vao: VAO = VAO.NewQuad(window) if vao_quad is None else vao_quad
-            self._ubo = BO(window, 'uniform_buffer')
+            self._vao: VAO = window.vao_quad if vao_quad is None else vao_quad
 
         self._compose_program: Abc.ComposeShaderProgram = (
-            ComposeShaderProgram(window) if program_compose is None else program_compose
+            ComposeShaderProgram.New(window) if program_compose is None else program_compose
         )
         self._fbo: t.Optional[FBO] = None
         self._batch_manager: BatchObjectManager = BatchObjectManager(self.window)
@@ -104,6 +103,14 @@ class Camera(
 
         self._instance_dtype_cache: t.Optional[np.dtype] = None
 
+        # блок камеры - слот общего кольца окна и его копия в памяти
+        self._ubo_ring: UniformRingBuffer = window.GetUniformRing(self.instance_dtype.itemsize)
+        self._ubo_slot: int = self._ubo_ring.Allocate()
+        self._ubo_record: np.ndarray = np.zeros(1, dtype=self.instance_dtype)
+        # устаревшие поля каждого региона кольца
+        self._ubo_dirty: list[set[Camera.ATTRIBS]] = [set() for _ in range(self._ubo_ring.frames)]
+        self._ubo_generation: int = -1
+
         if projection_orthographic is None and projection_perspective is None:
             self.SetProjectionOrthographic()
 
@@ -130,20 +137,39 @@ class Camera(
 
     def Dispose(self, *args: t.Any, **kwargs: t.Any):
         self._batch_manager.Dispose()
-        self._ubo.Dispose()
+        self._ubo_ring.Free(self._ubo_slot)
         if self._fbo is not None:
-            self._fbo.Dispose()
+            self.window.render_target_pool.Release(self._fbo)
+            self._fbo = None
 
     @stopwatch
     def Update(self, *args: t.Any, **kwargs: t.Any):
-        with self.ubo.Bind() as ubo:
-            ubo.SetData(
-                np.array(
-                    tuple(self.GetInstanceData().values()),
-                    dtype=self.instance_dtype,
-                ),
-                'dynamic_draw',
-            )
+        for name, value in self.GetInstanceDataUpdates().items():
+            name = t.cast(Camera.ATTRIBS, name)
+            self._ubo_record[name] = value
+
+            for dirty in self._ubo_dirty:
+                dirty.add(name)
+
+    def BindUBO(self, binding: int):
+        ring = self._ubo_ring
+        ring.Reserve()
+
+        if self._ubo_generation != ring.generation:
+            # хранилище пересоздано: все регионы пусты
+            for dirty in self._ubo_dirty:
+                dirty.update(t.cast(tuple[Camera.ATTRIBS, ...], self.instance_dtype.names or ()))
+            self._ubo_generation = ring.generation
+
+        if len(dirty := self._ubo_dirty[ring.frame]) > 0:
+            fields = self.instance_dtype.fields or {}
+            start = min(fields[name][1] for name in dirty)
+            end = max(fields[name][1] + fields[name][0].itemsize for name in dirty)
+
+            ring.Write(self._ubo_slot, start, self._ubo_record.view(np.uint8)[start:end])
+            dirty.clear()
+
+        ring.BindRange(binding, self._ubo_slot)
 
     def UpdateViewport(self, *args: t.Any, **kwargs: t.Any):
         window_size = self.window.size
@@ -199,8 +225,7 @@ class Camera(
         if self.request_intance_update:
             self.Update()
 
-        if self._fbo is None or self._fbo.size != self.resolution:
-            self._fbo = FBO(self.window, self.resolution)
+        self._fbo = self.window.render_target_pool.Resize(self._fbo, self.resolution)
 
         with self.fbo.Bind():
             GL.ClearColor(self.window.background_color)
@@ -301,6 +326,10 @@ class Camera(
             rotation_glm * (0.0, 1.0, 0.0),
         ).to_tuple()
 
+    def GetInstanceDType(self) -> np.dtype:
+        # запись блока Camera в раскладке std140
+        return GL.Layout.GetBlockDType(self.GetIntanceAttributeItems(), 'std140')
+
     def GetIntanceAttributeItems(self) -> tuple[Abc.Graphic.ShaderPrograms.SchemeItem[Camera.ATTRIBS], ...]:
         return (
             {
@@ -376,7 +405,7 @@ class Camera(
 
     @property
     def ubo(self):
-        return self._ubo
+        return self._ubo_ring.bo
 
     def GetResolution(self):
         return self._resolution
@@ -3,6 +3,10 @@ from contextlib import contextmanager
 from uuid import UUID, uuid4
 
 from ... import Abc, Validator
+from ..ShaderPrograms.CameraSupportShaderProgram import MATERIAL_BLOCK_BINDING
+
+if t.TYPE_CHECKING:
+    from ..Objects.UniformBlockBuffer import UniformBlockBuffer
 
 
 class Material[
@@ -14,39 +18,61 @@ class Material[
         '_id',
         '_name',
         '_program',
+        '_uniforms',
     )
 
     def __init__(
         self,
         program: TProgram,
         name: t.Optional[str] = None,
+        *,
+        uniforms: t.Optional['UniformBlockBuffer'] = None,
     ):
+        '''
+        Args:
+            uniforms: Блок материала, привязываемый к `MATERIAL_BLOCK_BINDING`. Загружается только после изменений
+                и разделяется всеми группами с этим материалом. Материал не владеет блоком.
+        '''
         self._id: UUID = uuid4()
         self._name: t.Optional[str] = name
 
         self._program: TProgram = t.cast(TProgram, Validator.Instance(program, Abc.ShaderProgram))
+        self._uniforms: t.Optional['UniformBlockBuffer'] = uniforms
 
     class Modify_Kwargs(
         t.TypedDict,
         total=False,
     ):
         name: t.Optional[str]
+        uniforms: t.Optional['UniformBlockBuffer']
 
     def Modify(self, **kwargs: t.Unpack[Modify_Kwargs]):
         return self.__class__(
             self.program,
             kwargs.get('name', self.name),
+            uniforms=kwargs.get('uniforms', self.uniforms),
         )
 
     @contextmanager
     def Bind(self, camera: Abc.Camera, *args: t.Any, **kwargs: t.Any):
         with self.program.Bind(camera):
+            if self._uniforms is not None:
+                self._uniforms.BindBase(MATERIAL_BLOCK_BINDING)
+
             yield self
 
     @property
     def program(self) -> TProgram:
         return self._program
 
+    @property
+    def uniforms(self) -> t.Optional['UniformBlockBuffer']:
+        return self._uniforms
+
+    @property
+    def uniforms_id(self) -> int:
+        return 0 if self._uniforms is None else self._uniforms.id
+
     def GetID(self):
         return self._id
 
@@ -54,4 +80,12 @@ class Material[
         return self._name
 
     def GetSignature(self) -> int:
-        return hash((self.program.id,))
+        return hash((self.program.id, self.uniforms_id))
+
+    def GetSortKey(self) -> tuple[int, int]:
+        '''
+        Материал может привязывать в `Bind` своё состояние, поэтому по умолчанию привязка пропускается
+        только для того же материала. Наследники, состояние которых определяется программой и текстурой,
+        переопределяют ключ.
+        '''
+        return (self.program.id, hash((self.id, self.uniforms_id)))
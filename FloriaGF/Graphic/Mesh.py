@@ -11,6 +11,11 @@ if t.TYPE_CHECKING:
 class Mesh(
     Abc.Graphic.Mesh,
 ):
+    '''
+    Неизменяемая геометрия: массивы доступны только для чтения, потому что меш загружается в `MeshArena` один раз.
+    Для другой геометрии создаётся новый меш.
+    '''
+
     def __init__(
         self,
         primitive: 'GL.hints.primitive',
@@ -28,15 +33,20 @@ class Mesh(
 
         self._id: UUID = uuid4()
 
-        self._vertices = np.array(vertices, dtype=np.float32)
-        self._texcoords = None if texcoords is None else np.array(texcoords, dtype=np.float32)
-        self._indices = None if indices is None else np.array(indices, dtype=np.uint32)
+        self._vertices = self._ReadOnly(np.array(vertices, dtype=np.float32))
+        self._texcoords = None if texcoords is None else self._ReadOnly(np.array(texcoords, dtype=np.float32))
+        self._indices = None if indices is None else self._ReadOnly(np.array(indices, dtype=np.uint32))
         self._primitive: 'GL.hints.primitive' = primitive
         self._vertice_size = vertice_size
         self._texcoord_size = texcoord_size
 
         self._name: t.Optional[str] = name
 
+    @staticmethod
+    def _ReadOnly(array: np.ndarray) -> np.ndarray:
+        array.flags.writeable = False
+        return array
+
     @property
     def vertices(self):
         return self._vertices
@@ -18,6 +18,7 @@ class FBO(
     __slots__ = (
         '_window',
         '_size',
+        '_format',
         '_id',
         '_texture',
         '_depth_texture',
@@ -28,18 +29,20 @@ class FBO(
         window: Abc.Window,
         size: Types.hints.size_2d,
         *args: t.Any,
+        format: GL.hints.texture_internal_format = 'rgba',
         depth: bool = True,
         **kwargs: t.Any,
     ):
         self._window = window
 
         self._size: tuple[int, int] = Types.Vec2[int].New(size)
+        self._format: GL.hints.texture_internal_format = format
         self._id: int = GL.Framebuffer.Create()
 
         with self.Bind():
             self._texture: Texture = Texture(window)
             with self._texture.Bind():
-                self._texture.TexImage2D(size)
+                self._texture.TexImage2D(size, internal_format=format)
             GL.Framebuffer.AttachTexture2D(self._texture, 'color_attachment_0')
 
             self._depth_texture: t.Optional[Texture] = Texture(window) if depth else None
@@ -83,6 +86,10 @@ class FBO(
     def size(self):
         return self._size
 
+    @property
+    def format(self):
+        return self._format
+
     @property
     def window(self):
         return self._window
@@ -0,0 +1,251 @@
+import typing as t
+from uuid import UUID
+
+import numpy as np
+
+from ... import Abc
+from .BO import BO
+from .VAO import VAO
+
+
+class MeshArenaRange(t.NamedTuple):
+    '''Место меша в общих буферах арены.'''
+
+    first_vertex: int
+    '''Смещение первой вершины (`base_vertex` для индексированной отрисовки, `first` для обычной).'''
+    vertex_count: int
+    first_index: int
+    index_count: int
+
+
+class MeshArena(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Общие буферы вершин, текстурных координат и индексов для мешей одной раскладки.
+
+    Каждый меш загружается один раз и получает `MeshArenaRange`; индексы хранятся относительно меша
+    и сдвигаются через `base_vertex`. Меши считаются неизменяемыми (`Mesh` отдаёт массивы только для чтения)
+    и не удаляются из арены: место освобождается вместе с ареной при удалении группы контекстов.
+    Удаление из `MeshManager` не затрагивает арены: группы батчей могут ещё рисовать меш.
+
+    Добавление не требует контекста OpenGL: данные копятся в памяти до `Upload`, который при росте ёмкости
+    пересоздаёт хранилище буферов (их id не меняются, поэтому настроенные VAO остаются действительными).
+    '''
+
+    __slots__ = (
+        '_window',
+        '_vertice_size',
+        '_texcoord_size',
+        '_ranges',
+        '_vertices',
+        '_texcoords',
+        '_indices',
+        '_vertex_count',
+        '_index_count',
+        '_uploaded',
+        '_buffer_capacity',
+        '_vbo_vertices',
+        '_vbo_texcoords',
+        '_ebo',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        vertice_size: int,
+        texcoord_size: t.Optional[int] = None,
+        capacity: int = 1024,
+    ):
+        self._window = window
+        self._vertice_size: int = vertice_size
+        self._texcoord_size: t.Optional[int] = texcoord_size
+
+        self._ranges: dict[UUID, MeshArenaRange] = {}
+
+        self._vertices: np.ndarray = np.zeros(capacity * vertice_size, dtype=np.float32)
+        self._texcoords: t.Optional[np.ndarray] = (
+            None if texcoord_size is None else np.zeros(capacity * texcoord_size, dtype=np.float32)
+        )
+        self._indices: np.ndarray = np.zeros(capacity, dtype=np.uint32)
+
+        self._vertex_count: int = 0
+        self._index_count: int = 0
+        # (вершин, индексов) уже в буферах
+        self._uploaded: tuple[int, int] = (0, 0)
+        # (вершин, индексов) - размер хранилищ буферов
+        self._buffer_capacity: tuple[int, int] = (0, 0)
+
+        self._vbo_vertices: t.Optional[BO] = None
+        self._vbo_texcoords: t.Optional[BO] = None
+        self._ebo: t.Optional[BO] = None
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        for bo in (self._vbo_vertices, self._vbo_texcoords, self._ebo):
+            if bo is not None:
+                bo.Dispose()
+
+        self._vbo_vertices = self._vbo_texcoords = self._ebo = None
+        self._uploaded = self._buffer_capacity = (0, 0)
+
+    @staticmethod
+    def GetLayout(mesh: Abc.Mesh) -> tuple[int, t.Optional[int]]:
+        return (mesh.vertice_size, mesh.texcoord_size)
+
+    @staticmethod
+    def _Reserve(array: np.ndarray, size: int) -> np.ndarray:
+        if size <= array.shape[0]:
+            return array
+
+        capacity = max(array.shape[0], 1)
+        while capacity < size:
+            capacity *= 2
+
+        result = np.zeros(capacity, dtype=array.dtype)
+        result[: array.shape[0]] = array
+        return result
+
+    def Add(self, mesh: Abc.Mesh) -> MeshArenaRange:
+        if (item := self._ranges.get(mesh.id)) is not None:
+            return item
+
+        if self.GetLayout(mesh) != self.layout:
+            raise ValueError()
+
+        vertex_count = mesh.count
+        index_count = 0 if mesh.indices is None else len(mesh.indices)
+
+        item = MeshArenaRange(self._vertex_count, vertex_count, self._index_count, index_count)
+
+        vertex_end = self._vertex_count + vertex_count
+        self._vertices = self._Reserve(self._vertices, vertex_end * self._vertice_size)
+        self._vertices[self._vertex_count * self._vertice_size : vertex_end * self._vertice_size] = mesh.vertices
+
+        if self._texcoords is not None and self._texcoord_size is not None and mesh.texcoords is not None:
+            self._texcoords = self._Reserve(self._texcoords, vertex_end * self._texcoord_size)
+            self._texcoords[self._vertex_count * self._texcoord_size : vertex_end * self._texcoord_size] = mesh.texcoords
+
+        if mesh.indices is not None:
+            self._indices = self._Reserve(self._indices, self._index_count + index_count)
+            self._indices[self._index_count : self._index_count + index_count] = mesh.indices
+
+        self._vertex_count = vertex_end
+        self._index_count += index_count
+        self._ranges[mesh.id] = item
+
+        return item
+
+    def Get(self, mesh: Abc.Mesh) -> t.Optional[MeshArenaRange]:
+        return self._ranges.get(mesh.id)
+
+    def Has(self, mesh: Abc.Mesh) -> bool:
+        return mesh.id in self._ranges
+
+    @staticmethod
+    def _UploadBuffer(bo: BO, data: np.ndarray, start: int, end: int, realloc: bool):
+        with bo.Bind():
+            if realloc:
+                bo.SetData(data, 'static_draw')
+            elif end > start:
+                bo.SetSubData(start * data.itemsize, data[start:end])
+
+    def Upload(self):
+        '''
+        Загружает добавленные меши. Требует контекста OpenGL.
+        '''
+        if self._vbo_vertices is None:
+            self._vbo_vertices = BO(self._window, 'array_buffer')
+            self._vbo_texcoords = None if self._texcoords is None else BO(self._window, 'array_buffer')
+            self._ebo = BO(self._window, 'element_array_buffer')
+
+        if self._uploaded == (self._vertex_count, self._index_count):
+            return
+
+        uploaded_vertices, uploaded_indices = self._uploaded
+        realloc_vertices = self._buffer_capacity[0] * self._vertice_size < self._vertices.shape[0]
+        realloc_indices = self._buffer_capacity[1] < self._indices.shape[0]
+
+        self._UploadBuffer(
+            self._vbo_vertices,
+            self._vertices,
+            uploaded_vertices * self._vertice_size,
+            self._vertex_count * self._vertice_size,
+            realloc_vertices,
+        )
+
+        if self._vbo_texcoords is not None and self._texcoords is not None and self._texcoord_size is not None:
+            self._UploadBuffer(
+                self._vbo_texcoords,
+                self._texcoords,
+                uploaded_vertices * self._texcoord_size,
+                self._vertex_count * self._texcoord_size,
+                realloc_vertices,
+            )
+
+        if self._ebo is not None:
+            self._UploadBuffer(self._ebo, self._indices, uploaded_indices, self._index_count, realloc_indices)
+
+        self._buffer_capacity = (self._vertices.shape[0] // self._vertice_size, self._indices.shape[0])
+        self._uploaded = (self._vertex_count, self._index_count)
+
+    def SetupVAO(self, vao: VAO, scheme: Abc.Graphic.ShaderPrograms.Scheme):
+        '''
+        Настраивает атрибуты `vertice` и `texcoord` VAO на буферы арены. Требует контекста OpenGL.
+        '''
+        if not any(item['name'] == 'vertice' for item in scheme['base'].values()):
+            raise RuntimeError()
+
+        self.Upload()
+
+        with vao.Bind():
+            for index, item in scheme['base'].items():
+                if item['name'] == 'vertice':
+                    bo = self._vbo_vertices
+                elif item['name'] == 'texcoord':
+                    bo = self._vbo_texcoords
+                else:
+                    continue
+
+                if bo is None:
+                    continue
+
+                with bo.Bind():
+                    vao.VertexAttribPointer(index, item['type'])
+
+    @property
+    def layout(self) -> tuple[int, t.Optional[int]]:
+        return (self._vertice_size, self._texcoord_size)
+
+    @property
+    def vbo_vertices(self) -> BO:
+        if self._vbo_vertices is None:
+            raise RuntimeError()
+        return self._vbo_vertices
+
+    @property
+    def vbo_texcoords(self) -> t.Optional[BO]:
+        return self._vbo_texcoords
+
+    @property
+    def ebo(self) -> BO:
+        if self._ebo is None:
+            raise RuntimeError()
+        return self._ebo
+
+    @property
+    def vertex_count(self) -> int:
+        return self._vertex_count
+
+    @property
+    def index_count(self) -> int:
+        return self._index_count
+
+    @property
+    def window(self):
+        return self._window
+
+    def __contains__(self, mesh: Abc.Mesh) -> bool:
+        return self.Has(mesh)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
@@ -0,0 +1,148 @@
+import typing as t
+
+from ... import Abc, GL, Types
+from ...Config import Config
+from .FBO import FBO
+
+
+TRenderTargetKey = tuple[tuple[int, int], GL.hints.texture_internal_format, bool]
+
+
+class RenderTargetPool(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Общий пул FBO окна, сгруппированных по (размер, формат, глубина).
+
+    Цели выдаются через `Acquire` и возвращаются через `Release`; одну цель могут делить
+    несколько владельцев (`Retain`). Возвращённая цель попадает в список свободных и
+    переиспользуется следующим запросом того же ключа, поэтому изменение размера окна
+    или переключение камер не пересоздаёт FBO каждый раз.
+
+    Свободные цели, не востребованные дольше `max_idle_frames` кадров, удаляются в `Tick`.
+    '''
+
+    __slots__ = (
+        '_window',
+        '_max_idle_frames',
+        '_frame',
+        '_free',
+        '_borrowed',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        max_idle_frames: t.Optional[int] = None,
+    ):
+        self._window = window
+        self._max_idle_frames: int = Config.RENDER_TARGET_IDLE_FRAMES if max_idle_frames is None else max_idle_frames
+        self._frame: int = 0
+
+        # key: [(fbo, frame of release)]
+        self._free: dict[TRenderTargetKey, list[tuple[FBO, int]]] = {}
+        # fbo id: (fbo, key, refs)
+        self._borrowed: dict[int, tuple[FBO, TRenderTargetKey, int]] = {}
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        for targets in self._free.values():
+            for fbo, _ in targets:
+                fbo.Dispose()
+        for fbo, _, _ in self._borrowed.values():
+            fbo.Dispose()
+
+        self._free.clear()
+        self._borrowed.clear()
+
+    def Acquire(
+        self,
+        size: Types.hints.size_2d,
+        format: GL.hints.texture_internal_format = 'rgba',
+        depth: bool = True,
+    ) -> FBO:
+        '''
+        Выдаёт свободную цель нужного ключа или создаёт новую. Требует контекста OpenGL.
+        '''
+        key: TRenderTargetKey = ((int(size[0]), int(size[1])), format, depth)
+
+        if (targets := self._free.get(key)) is not None and len(targets) > 0:
+            fbo, _ = targets.pop()
+        else:
+            fbo = FBO(self._window, key[0], format=format, depth=depth)
+
+        self._borrowed[fbo.id] = (fbo, key, 1)
+        return fbo
+
+    def Retain(self, fbo: FBO) -> FBO:
+        if (item := self._borrowed.get(fbo.id)) is None:
+            raise RuntimeError()
+
+        self._borrowed[fbo.id] = (item[0], item[1], item[2] + 1)
+        return fbo
+
+    def Release(self, fbo: FBO):
+        '''
+        Возвращает цель в пул, когда освобождена последняя ссылка на неё.
+        '''
+        if (item := self._borrowed.get(fbo.id)) is None:
+            raise RuntimeError()
+
+        _, key, refs = item
+        if refs > 1:
+            self._borrowed[fbo.id] = (fbo, key, refs - 1)
+            return
+
+        self._borrowed.pop(fbo.id)
+        self._free.setdefault(key, []).append((fbo, self._frame))
+
+    def Resize(
+        self,
+        fbo: t.Optional[FBO],
+        size: Types.hints.size_2d,
+        format: GL.hints.texture_internal_format = 'rgba',
+        depth: bool = True,
+    ) -> FBO:
+        '''
+        Возвращает `fbo`, если он подходит под ключ, иначе освобождает его и выдаёт подходящую цель.
+        '''
+        if fbo is not None:
+            if (item := self._borrowed.get(fbo.id)) is not None and item[1] == (
+                (int(size[0]), int(size[1])),
+                format,
+                depth,
+            ):
+                return fbo
+            self.Release(fbo)
+
+        return self.Acquire(size, format, depth)
+
+    def Tick(self):
+        '''
+        Завершает кадр пула и удаляет давно не использованные свободные цели.
+        '''
+        self._frame += 1
+
+        for key, targets in tuple(self._free.items()):
+            keep: list[tuple[FBO, int]] = []
+            for fbo, frame in targets:
+                if self._frame - frame > self._max_idle_frames:
+                    fbo.Dispose()
+                else:
+                    keep.append((fbo, frame))
+
+            if len(keep) > 0:
+                self._free[key] = keep
+            else:
+                self._free.pop(key)
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def borrowed_count(self) -> int:
+        return len(self._borrowed)
+
+    @property
+    def free_count(self) -> int:
+        return sum(len(targets) for targets in self._free.values())
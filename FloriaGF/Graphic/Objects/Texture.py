@@ -101,20 +101,34 @@ class Texture(
         self._size = Types.Vec2[int].New(size)
         self._depth = 1
 
-    def TexStorage3D(self, layers: t.Sequence['Image.Image']):
+    def TexStorage3D(self, layers: 'np.ndarray | t.Sequence[Image.Image]'):
+        '''
+        Args:
+            layers: массив формы (depth, height, width, 4) загружается одним вызовом без копирования,
+                последовательность изображений предварительно собирается в такой массив.
+        '''
         if self.type != 'texture_2d_array':
             raise RuntimeError()
 
-        width, height = layers[0].size
-        depth = len(layers)
+        if isinstance(layers, np.ndarray):
+            if layers.ndim != 4 or layers.shape[3] != 4:
+                raise ValueError()
+            pixels = np.ascontiguousarray(layers, dtype=np.uint8)
+
+        else:
+            if len(layers) == 0:
+                raise ValueError()
+
+            width, height = layers[0].size
+            pixels = np.empty((len(layers), height, width, 4), dtype=np.uint8)
+            for i, layer in enumerate(layers):
+                pixels[i] = np.asarray(layer)
+
+        depth, height, width = pixels.shape[:3]
 
         if depth == 0:
             raise ValueError()
 
-        pixels = np.empty((depth, height, width, 4), dtype=np.uint8)
-        for i, layer in enumerate(layers):
-            pixels[i] = np.array(layer)
-
         size_3d = (width, height, depth)
 
         GL.Texture.TexStorage3D(size_3d, self.type)
@@ -123,6 +137,76 @@ class Texture(
         self._size = Types.Vec2(width, height)
         self._depth = depth
 
+    def AllocateStorage3D(
+        self,
+        size: Types.hints.size_2d,
+        depth: int,
+        format: GL.hints.texture_internal_format = 'rgba8',
+    ):
+        '''
+        Выделяет неизменяемое хранилище массива текстур без загрузки данных.
+        '''
+        if self.type != 'texture_2d_array':
+            raise RuntimeError()
+
+        if depth <= 0:
+            raise ValueError()
+
+        width, height = size
+
+        GL.Texture.TexStorage3D((width, height, depth), self.type, format)
+
+        self._size = Types.Vec2(width, height)
+        self._depth = depth
+
+    def CopyLayers(self, source: 'Texture', depth: t.Optional[int] = None):
+        '''
+        Копирует первые `depth` слоёв `source` того же размера. На OpenGL 4.3+ копирование идёт на GPU,
+        иначе - через чтение `source` в память.
+        '''
+        if self.type != 'texture_2d_array' or source.type != 'texture_2d_array':
+            raise RuntimeError()
+
+        depth = min(self.depth, source.depth) if depth is None else depth
+        if depth <= 0:
+            return
+
+        if GL.Texture.SupportsCopyImage(self.window.context_version):
+            GL.Texture.CopyImageSubData(source.id, self.id, (self.size.x, self.size.y, depth), self.type)
+            return
+
+        with source.Bind():
+            pixels = source.GetImage3D()
+        with self.Bind():
+            self.SubImage3D(pixels[:depth])
+
+    def SubImage3D(self, pixels: np.ndarray, offset: Types.hints.offset_3d = (0, 0, 0)):
+        '''
+        Загружает область `pixels` формы (depth, height, width, 4) в уже выделенное хранилище.
+        '''
+        if self.type != 'texture_2d_array':
+            raise RuntimeError()
+
+        depth, height, width = pixels.shape[:3]
+
+        GL.Texture.TexSubImage3D((width, height, depth), pixels, self.type, offset=offset)
+
+    def GetImage3D(self) -> np.ndarray:
+        '''
+        Считывает всё хранилище массива текстур в массив формы (depth, height, width, 4).
+        '''
+        if self.type != 'texture_2d_array':
+            raise RuntimeError()
+
+        return GL.Texture.GetTexImage(
+            np.empty((self.depth, self.size.y, self.size.x, 4), dtype=np.uint8),
+            self.type,
+        )
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
     def GetID(self):
         return self._id
 
@@ -0,0 +1,119 @@
+import typing as t
+
+import numpy as np
+
+from ... import Abc, GL
+from .BO import BO
+
+
+class UniformBlockBuffer(
+    Abc.Mixins.ID[int],
+    Abc.Mixins.Disposable,
+):
+    '''
+    UBO с копией блока в памяти.
+
+    Поля меняются через `Set` без обращения к OpenGL, а буфер загружается одним вызовом при `BindBase`
+    и только если запись изменилась. Один буфер привязывается всеми группами, которые его используют.
+    '''
+
+    __slots__ = (
+        '_window',
+        '_dtype',
+        '_record',
+        '_ubo',
+        '_allocated',
+        '_dirty',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        fields: t.Sequence[Abc.Graphic.ShaderPrograms.SchemeItem],
+        *,
+        layout: GL.hints.block_layout = 'std140',
+        **values: t.Any,
+    ):
+        self._window = window
+
+        self._dtype: np.dtype = GL.Layout.GetBlockDType(fields, layout)
+        self._record: np.ndarray = np.zeros(1, dtype=self._dtype)
+
+        with window.Bind():
+            self._ubo = BO(window, 'uniform_buffer')
+
+        self._allocated: bool = False
+        self._dirty: bool = True
+
+        for name, value in values.items():
+            self.Set(name, value)
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        self._ubo.Dispose()
+
+    def Set(self, name: str, value: t.Any):
+        '''
+        Записывает значение прямо в запись. Значения меньше поля (`mat3` в дополненные столбцы) пишутся в его начало.
+        '''
+        target = self._record[name][0]
+        if (shape := np.shape(value)) != target.shape and len(shape) == target.ndim:
+            target = target[tuple(slice(0, size) for size in shape)]
+
+        if np.array_equal(target, value):
+            return
+
+        target[...] = value
+        self._dirty = True
+
+    def Get(self, name: str) -> t.Any:
+        return self._record[name][0]
+
+    def Invalidate(self):
+        self._dirty = True
+
+    def Upload(self) -> bool:
+        '''
+        Требует контекста OpenGL.
+
+        Returns:
+            Был ли загружен буфер.
+        '''
+        if not self._dirty:
+            return False
+
+        with self._ubo.Bind() as ubo:
+            if self._allocated:
+                ubo.SetSubData(0, self._record)
+            else:
+                ubo.SetData(self._record, 'dynamic_draw')
+                self._allocated = True
+
+        self._dirty = False
+        return True
+
+    def BindBase(self, binding: int):
+        '''
+        Загружает изменения и привязывает буфер к точке `binding`. Требует контекста OpenGL.
+        '''
+        self.Upload()
+        GL.Buffer.BindBase('uniform_buffer', binding, self._ubo.id)
+
+    def GetID(self):
+        return self._ubo.id
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def record(self) -> np.ndarray:
+        '''Запись блока. После прямой записи в неё нужно вызвать `Invalidate`.'''
+        return self._record
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def window(self):
+        return self._window
@@ -0,0 +1,160 @@
+import typing as t
+
+import numpy as np
+
+from ... import Abc, GL
+from ...Config import Config
+from .BO import BO
+
+
+class UniformRingBuffer(
+    Abc.Mixins.ID[int],
+    Abc.Mixins.Disposable,
+):
+    '''
+    Общий UBO для записей одного размера (например, камер окна) с выравненными слотами.
+
+    Буфер разделён на `frames` регионов по `capacity` слотов. Каждый кадр запись идёт в следующий регион,
+    поэтому обновление не ждёт GPU, который ещё читает регион прошлого кадра. Владелец слота отслеживает,
+    какие поля каждого региона устарели, и дописывает только их.
+
+    При росте хранилище пересоздаётся и `generation` увеличивается - владельцы слотов записывают данные заново.
+    '''
+
+    __slots__ = (
+        '_window',
+        '_itemsize',
+        '_frames',
+        '_frame',
+        '_capacity',
+        '_free',
+        '_next',
+        '_stride',
+        '_bo',
+        '_allocated',
+        '_generation',
+    )
+
+    def __init__(
+        self,
+        window: Abc.Window,
+        itemsize: int,
+        frames: t.Optional[int] = None,
+        capacity: int = 4,
+    ):
+        self._window = window
+        self._itemsize: int = itemsize
+        self._frames: int = max(1, Config.UNIFORM_RING_FRAMES if frames is None else frames)
+        self._frame: int = 0
+
+        self._capacity: int = max(1, capacity)
+        self._free: list[int] = []
+        self._next: int = 0
+
+        with window.Bind():
+            alignment = GL.Buffer.GetUniformOffsetAlignment()
+            self._stride: int = -(-itemsize // alignment) * alignment
+            self._bo = BO(window, 'uniform_buffer')
+
+        # ёмкость текущего хранилища в слотах
+        self._allocated: int = 0
+        self._generation: int = 0
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        self._bo.Dispose()
+
+    def Allocate(self) -> int:
+        '''
+        Returns:
+            Слот. Не требует контекста OpenGL: хранилище растёт при следующей записи.
+        '''
+        if len(self._free) > 0:
+            return self._free.pop()
+
+        slot = self._next
+        self._next += 1
+
+        while self._next > self._capacity:
+            self._capacity *= 2
+
+        return slot
+
+    def Free(self, slot: int):
+        self._free.append(slot)
+
+    def Reserve(self):
+        '''
+        Пересоздаёт хранилище, если выросла ёмкость. Требует контекста OpenGL.
+        '''
+        if self._allocated == self._capacity:
+            return
+
+        with self._bo.Bind() as bo:
+            bo.SetData(np.zeros(self._stride * self._capacity * self._frames, dtype=np.uint8), 'dynamic_draw')
+
+        self._allocated = self._capacity
+        self._generation += 1
+
+    def GetOffset(self, slot: int, frame: t.Optional[int] = None) -> int:
+        return ((self._frame if frame is None else frame) * self._capacity + slot) * self._stride
+
+    def Write(self, slot: int, offset: int, data: np.ndarray):
+        '''
+        Записывает `data` со смещения `offset` внутри слота текущего региона. Требует контекста OpenGL.
+        '''
+        if offset + data.nbytes > self._itemsize:
+            raise ValueError()
+
+        self.Reserve()
+
+        with self._bo.Bind() as bo:
+            bo.SetSubData(self.GetOffset(slot) + offset, data)
+
+    def BindRange(self, binding: int, slot: int):
+        '''
+        Привязывает слот текущего региона к точке `binding`. Требует контекста OpenGL.
+        '''
+        self.Reserve()
+        # диапазон - весь слот: драйвер может требовать блок больше записи из-за выравнивания
+        GL.Buffer.BindRange('uniform_buffer', binding, self._bo.id, self.GetOffset(slot), self._stride)
+
+    def Advance(self):
+        '''
+        Переходит к региону следующего кадра.
+        '''
+        self._frame = (self._frame + 1) % self._frames
+
+    def GetID(self):
+        return self._bo.id
+
+    @property
+    def bo(self) -> BO:
+        return self._bo
+
+    @property
+    def itemsize(self) -> int:
+        return self._itemsize
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def window(self):
+        return self._window
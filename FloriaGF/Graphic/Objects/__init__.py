@@ -2,3 +2,7 @@ from .BO import BO
 from .VAO import VAO
 from .FBO import FBO
 from .Texture import Texture
+from .RenderTargetPool import RenderTargetPool
+from .MeshArena import MeshArena, MeshArenaRange
+from .UniformBlockBuffer import UniformBlockBuffer
+from .UniformRingBuffer import UniformRingBuffer
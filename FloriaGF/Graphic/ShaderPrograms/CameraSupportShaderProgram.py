@@ -1,12 +1,17 @@
 import typing as t
 
-from OpenGL import GL
 from contextlib import contextmanager
 
 from ... import Abc
 from .ShaderProgram import ShaderProgram, ShaderConstuct, C
 
 
+CAMERA_BLOCK_BINDING: t.Final = 0
+'''Точка привязки блока `Camera`, общая для всех программ - смена программы не требует перепривязки UBO.'''
+MATERIAL_BLOCK_BINDING: t.Final = 1
+'''Точка привязки блока материала (`Material.uniforms`).'''
+
+
 class CameraVertexShader(ShaderConstuct):
     camera = C.UniformBlock(
         'Camera',
@@ -15,6 +20,7 @@ class CameraVertexShader(ShaderConstuct):
             {'name': 'view', 'type': 'mat4'},
             {'name': 'resolution', 'type': 'vec2'},
         ),
+        binding=CAMERA_BLOCK_BINDING,
     )
 
 
@@ -27,11 +33,7 @@ class CameraShaderProgram(
     @contextmanager
     def Bind(self, camera: Abc.Camera, *args: t.Any, **kwargs: t.Any):
         with super().Bind():
-            GL.glBindBufferBase(
-                GL.GL_UNIFORM_BUFFER,
-                self.GetUniformBlockLocation('Camera'),
-                camera.ubo.id,
-            )
+            camera.BindUBO(CAMERA_BLOCK_BINDING)
 
             yield self
 
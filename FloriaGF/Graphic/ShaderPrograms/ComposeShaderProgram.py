@@ -45,6 +45,8 @@ class ComposeShaderProgram(
     ShaderProgram,
     Abc.ComposeShaderProgram,
 ):
+    PROGRAM_NAME = 'compose-program'
+
     __vertex__ = ComposeVertexShader
     __fragment__ = ComposeFragmentShader
 
@@ -52,6 +54,16 @@ class ComposeShaderProgram(
     __blend_equation__ = 'func_add'
     __blend_factors__ = ('src_alpha', 'one_minus_src_alpha')
 
+    @classmethod
+    def New(cls, window: Abc.Window) -> 'ComposeShaderProgram':
+        '''
+        Общая программа композиции окна (и всех окон его группы контекстов).
+        '''
+        return window.shader_manager.sequence.OfType(cls).GetByNameOrDefaultLazy(
+            cls.PROGRAM_NAME,
+            lambda: window.shader_manager.Register(cls(window, cls.PROGRAM_NAME)),
+        )
+
     @contextmanager
     def Bind(self, fbo: 'FBO', *args: t.Any, **kwargs: t.Any):
         with super().Bind():
@@ -1,4 +1,5 @@
 import typing as t
+import numpy as np
 
 from .Base import ComponentNamed
 from ..... import GL, Abc
@@ -39,6 +40,15 @@ class UniformBlock(ComponentNamed):
     def GetScheme(self) -> tuple[Abc.Graphic.ShaderPrograms.SchemeItem, ...]:
         return self.fields
 
+    def GetDType(self) -> np.dtype:
+        '''
+        dtype записи блока по правилам его раскладки (без `layout` - std140).
+        '''
+        if self.layout not in (None, 'std140', 'std430'):
+            raise ValueError(self.layout)
+
+        return GL.Layout.GetBlockDType(self.fields, t.cast(GL.hints.block_layout, self.layout or 'std140'))
+
     def GetSource(self) -> str:
         return f'''
         {
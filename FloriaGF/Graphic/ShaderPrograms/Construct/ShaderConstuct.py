@@ -161,6 +161,16 @@ class ShaderConstuct(metaclass=ShaderConstuctMeta):
 
         return Abc.Graphic.ShaderPrograms.Scheme(**scheme_kwargs)
 
+    @classmethod
+    def GetUniformBlocks(cls) -> tuple[C.UniformBlock, ...]:
+        return tuple(
+            var
+            for base in cls.mro()[::-1]
+            if base is not object
+            for var in base.__dict__.values()
+            if isinstance(var, C.UniformBlock)
+        )
+
     @classmethod
     def GetSource(cls, rebuild: bool = False) -> str:
         if cls.__source is None or rebuild:
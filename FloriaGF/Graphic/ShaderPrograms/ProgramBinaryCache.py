@@ -0,0 +1,98 @@
+import typing as t
+import os
+import pathlib
+import struct
+import hashlib
+import threading
+
+from ...Config import Config
+
+
+class ProgramBinaryCache:
+    '''
+    Дисковый кэш бинарников шейдерных программ (`glGetProgramBinary`).
+
+    Ключ - хэш исходников вершинного и фрагментного шейдеров вместе с производителем,
+    устройством и версией драйвера, поэтому после обновления драйвера программы компилируются заново.
+
+    Файл `<key>.bin`: формат бинарника (uint32) и сам бинарник.
+    '''
+
+    HEADER: t.Final = struct.Struct('<I')
+
+    __slots__ = (
+        '_dir',
+        '_lock',
+    )
+
+    _default: t.ClassVar[t.Optional['ProgramBinaryCache']] = None
+    _default_dir: t.ClassVar[t.Optional[str]] = None
+
+    def __init__(self, dir: str | pathlib.Path):
+        self._dir: pathlib.Path = pathlib.Path(dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+    @classmethod
+    def GetDefault(cls) -> t.Optional['ProgramBinaryCache']:
+        '''
+        Кэш в `Config.SHADER_CACHE_DIR` или None, если он не задан.
+        '''
+        if Config.SHADER_CACHE_DIR is None:
+            return None
+
+        if cls._default is None or cls._default_dir != Config.SHADER_CACHE_DIR:
+            cls._default = cls(Config.SHADER_CACHE_DIR)
+            cls._default_dir = Config.SHADER_CACHE_DIR
+
+        return cls._default
+
+    @staticmethod
+    def GetKey(sources: t.Iterable[str], driver: t.Iterable[str]) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        for item in (*sources, *driver):
+            digest.update(item.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _GetPath(self, key: str) -> pathlib.Path:
+        return self._dir / f'{key}.bin'
+
+    def Load(self, key: str) -> t.Optional[tuple[int, bytes]]:
+        '''
+        Returns:
+            (формат, бинарник) или None при промахе.
+        '''
+        try:
+            with open(self._GetPath(key), 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) <= self.HEADER.size:
+            return None
+
+        (format,) = self.HEADER.unpack_from(data)
+        return format, data[self.HEADER.size :]
+
+    def Save(self, key: str, format: int, binary: bytes):
+        path = self._GetPath(key)
+        temp = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+
+        with self._lock:
+            with open(temp, 'wb') as file:
+                file.write(self.HEADER.pack(format))
+                file.write(binary)
+            os.replace(temp, path)
+
+    def Remove(self, key: str):
+        self._GetPath(key).unlink(missing_ok=True)
+
+    def Clear(self):
+        for path in self._dir.glob('*.bin'):
+            path.unlink(missing_ok=True)
+
+    @property
+    def dir(self) -> pathlib.Path:
+        return self._dir
@@ -3,10 +3,16 @@ import typing as t
 from OpenGL import GL as _GL
 from contextlib import contextmanager, asynccontextmanager
 import functools
+from time import perf_counter
+
+import numpy as np
 
 from ... import Abc, Utils, Convert, Validator, GL
 from ...Core import Core
+from ...Loggers import shader_logger
+from ...Stopwatch import stopwatch
 from .Construct import ShaderConstuct, C
+from .ProgramBinaryCache import ProgramBinaryCache
 
 if t.TYPE_CHECKING:
     from ... import Assets, Types
@@ -17,6 +23,32 @@ class BaseVertexShader(ShaderConstuct):
     pass
 
 
+_UNSET: t.Final = object()
+
+# (тип элемента, компонентов): glUniform*v
+_UNIFORM_VECTOR_FUNCS: t.Final[dict[tuple[type, int], t.Callable[..., t.Any]]] = {
+    (np.float32, 1): _GL.glUniform1fv,
+    (np.float32, 2): _GL.glUniform2fv,
+    (np.float32, 3): _GL.glUniform3fv,
+    (np.float32, 4): _GL.glUniform4fv,
+    (np.int32, 1): _GL.glUniform1iv,
+    (np.int32, 2): _GL.glUniform2iv,
+    (np.int32, 3): _GL.glUniform3iv,
+    (np.int32, 4): _GL.glUniform4iv,
+    (np.uint32, 1): _GL.glUniform1uiv,
+    (np.uint32, 2): _GL.glUniform2uiv,
+    (np.uint32, 3): _GL.glUniform3uiv,
+    (np.uint32, 4): _GL.glUniform4uiv,
+}
+
+# размер стороны: glUniformMatrix*fv
+_UNIFORM_MATRIX_FUNCS: t.Final[dict[int, t.Callable[..., t.Any]]] = {
+    2: _GL.glUniformMatrix2fv,
+    3: _GL.glUniformMatrix3fv,
+    4: _GL.glUniformMatrix4fv,
+}
+
+
 class ShaderProgram(Abc.Graphic.ShaderPrograms.ShaderProgram):
     __vertex__: t.Optional[str | t.Type[ShaderConstuct]] = None
 
@@ -39,24 +71,8 @@ class ShaderProgram(Abc.Graphic.ShaderPrograms.ShaderProgram):
             self._id: int = GL.ShaderProgram.Create()
             self._name: t.Optional[str] = name
 
-            vertex_id = GL.Shader.Create('vertex', self._GetVertexSource())
-            fragment_id = GL.Shader.Create('fragment', self._GetFragmentSource())
-
-            GL.ShaderProgram.Attach(
-                self.id,
-                vertex_id,
-                fragment_id,
-            )
-
-            try:
-                GL.ShaderProgram.Link(self.id)
-                GL.ShaderProgram.Validate(self.id)
-
-            finally:
-                GL.Shader.Delete(
-                    vertex_id,
-                    fragment_id,
-                )
+            self._Build()
+            self.ValidateUniformBlocks()
 
         self._uniform_cache: dict[str, t.Any] = {}
         self._uniform_ids_cache: dict[str, int] = {}
@@ -65,6 +81,68 @@ class ShaderProgram(Abc.Graphic.ShaderPrograms.ShaderProgram):
     def Dispose(self, *args: t.Any, **kwargs: t.Any):
         GL.ShaderProgram.Delete(self.id)
 
+    @stopwatch
+    def _Build(self):
+        '''
+        Загружает программу из `ProgramBinaryCache` или компилирует исходники. Требует контекста OpenGL.
+        '''
+        start = perf_counter()
+
+        cache = ProgramBinaryCache.GetDefault() if GL.ShaderProgram.SupportsBinary() else None
+        key = None if cache is None else cache.GetKey((self._GetVertexSource(), self._GetFragmentSource()), GL.GetDriverInfo())
+
+        if cache is not None and key is not None and (binary := cache.Load(key)) is not None:
+            if GL.ShaderProgram.LoadBinary(self.id, *binary):
+                shader_logger.debug(f'{self.__class__.__name__}: loaded from cache for {perf_counter() - start:.4f} sec')
+                return
+
+            # драйвер отверг бинарник: программа остаётся пустой и линкуется из исходников
+            shader_logger.info(f'{self.__class__.__name__}: cached binary rejected, compiling')
+            cache.Remove(key)
+
+        self._Compile(retrievable=cache is not None)
+
+        if cache is not None and key is not None:
+            self._SaveBinary(cache, key)
+
+        shader_logger.debug(f'{self.__class__.__name__}: compiled for {perf_counter() - start:.4f} sec')
+
+    def _SaveBinary(self, cache: ProgramBinaryCache, key: str):
+        '''
+        Ошибки кэша не мешают работе программы: она уже слинкована и просто не попадает в кэш.
+        '''
+        if (binary := GL.ShaderProgram.GetBinary(self.id)) is None:
+            shader_logger.warning(f'{self.__class__.__name__}: driver returned no program binary, not cached')
+            return
+
+        try:
+            cache.Save(key, *binary)
+        except OSError:
+            shader_logger.warning(f'{self.__class__.__name__}: failed to save program binary', exc_info=True)
+
+    def _Compile(self, retrievable: bool = False):
+        vertex_id = GL.Shader.Create('vertex', self._GetVertexSource())
+        fragment_id = GL.Shader.Create('fragment', self._GetFragmentSource())
+
+        GL.ShaderProgram.Attach(
+            self.id,
+            vertex_id,
+            fragment_id,
+        )
+
+        if retrievable:
+            GL.ShaderProgram.SetBinaryRetrievable(self.id)
+
+        try:
+            GL.ShaderProgram.Link(self.id)
+            GL.ShaderProgram.Validate(self.id)
+
+        finally:
+            GL.Shader.Delete(
+                vertex_id,
+                fragment_id,
+            )
+
     @classmethod
     @functools.lru_cache(1)
     def _GetVertexSource(cls) -> str:
@@ -109,6 +187,40 @@ class ShaderProgram(Abc.Graphic.ShaderPrograms.ShaderProgram):
 
         return Validator.NotNone(scheme)
 
+    @classmethod
+    @functools.lru_cache(1)
+    def _GetUniformBlocks(cls) -> tuple[C.UniformBlock, ...]:
+        blocks: dict[str, C.UniformBlock] = {}
+
+        for attrib in ('__vertex__', '__fragment__'):
+            construct = Utils.GetClassAttrib(cls, attrib)
+            if isinstance(construct, type) and issubclass(construct, ShaderConstuct):
+                for block in construct.GetUniformBlocks():
+                    blocks.setdefault(block.block_name, block)
+
+        return tuple(blocks.values())
+
+    def ValidateUniformBlocks(self):
+        '''
+        Сверяет смещения полей блоков из `Construct` с раскладкой драйвера. Требует контекста OpenGL.
+
+        Raises:
+            ValueError: dtype блока не совпадает с раскладкой программы.
+        '''
+        for block in self._GetUniformBlocks():
+            if (layout := GL.ShaderProgram.GetUniformBlockLayout(self.id, block.block_name)) is None:
+                continue
+
+            size, offsets = layout
+            dtype = block.GetDType()
+            expected = {name: dtype.fields[name][1] for name in dtype.names or ()}  # type: ignore
+
+            if size > dtype.itemsize or any(expected.get(name) != offset for name, offset in offsets.items()):
+                raise ValueError(
+                    f'{self.__class__.__name__}: block {block.block_name} layout mismatch: '
+                    f'driver {offsets} ({size} bytes), expected {expected} ({dtype.itemsize} bytes)'
+                )
+
     def GetUniformLocation(self, name: str) -> int:
         if (loc := self._uniform_ids_cache.get(name)) is None:
             if (loc := GL.ShaderProgram.GetUniformLocation(self.id, name)) < 0:
@@ -121,34 +233,78 @@ class ShaderProgram(Abc.Graphic.ShaderPrograms.ShaderProgram):
             self._uniform_block_ids_cache[name] = loc = GL.ShaderProgram.GetUniformBlockIndex(self.id, name)
         return loc
 
-    # def CheckUniformCache(self, name: str, value: t.Any) -> bool:
-    #     if name in self._uniform_cache and self._uniform_cache[name] == value:
-    #         return True
-    #     self._uniform_cache[name] = value
-    #     return False
+    def _SetUniform(self, name: str, value: t.Any, func: t.Callable[..., t.Any], *args: t.Any) -> bool:
+        '''
+        Вызывает `func(location, *args)`, только если значение отличается от загруженного ранее.
+        Значения uniform-переменных - состояние программы, поэтому кэш общий для всех контекстов.
+
+        Returns:
+            Было ли загружено значение.
+        '''
+        key = value.tobytes() if isinstance(value, np.ndarray) else value
+        if self._uniform_cache.get(name, _UNSET) == key:
+            return False
+
+        func(self.GetUniformLocation(name), *args)
+        self._uniform_cache[name] = key
+        return True
 
     def SetUniformFloat(self, name: str, value: float):
-        _GL.glUniform1f(
-            self.GetUniformLocation(name),
-            value,
-        )
+        self._SetUniform(name, value, _GL.glUniform1f, value)
+
+    def SetUniformInt(self, name: str, value: int):
+        self._SetUniform(name, value, _GL.glUniform1i, value)
+
+    def SetUniformVector(self, name: str, value: tuple[float, ...] | np.ndarray):
+        '''
+        Args:
+            value: Кортеж или массив формы `(n,)` / `(count, n)` типа float32, int32 или uint32 -
+                массив загружается одним вызовом без преобразования.
+        '''
+        if isinstance(value, np.ndarray):
+            if (func := _UNIFORM_VECTOR_FUNCS.get((value.dtype.type, value.shape[-1]))) is None or value.ndim > 2:
+                raise ValueError(value.dtype, value.shape)
+
+            data = np.ascontiguousarray(value)
+            self._SetUniform(name, data, func, 1 if data.ndim == 1 else data.shape[0], data)
+            return
 
-    def SetUniformVector(self, name: str, value: tuple[float, ...]):
         count = len(value)
-        loc = self.GetUniformLocation(name)
 
         if count == 2:
-            _GL.glUniform2f(loc, *value)
+            self._SetUniform(name, value, _GL.glUniform2f, *value)
 
         elif count == 3:
-            _GL.glUniform3f(loc, *value)
+            self._SetUniform(name, value, _GL.glUniform3f, *value)
 
         elif count == 4:
-            _GL.glUniform4f(loc, *value)
+            self._SetUniform(name, value, _GL.glUniform4f, *value)
 
         else:
             raise
 
+    def SetUniformMatrix(self, name: str, value: np.ndarray, transpose: bool = False):
+        '''
+        Args:
+            value: Матрица `(n, n)` или массив матриц `(count, n, n)`, n - 2, 3 или 4.
+        '''
+        if (
+            value.ndim not in (2, 3)
+            or value.shape[-1] != value.shape[-2]
+            or (func := _UNIFORM_MATRIX_FUNCS.get(value.shape[-1])) is None
+        ):
+            raise ValueError(value.shape)
+
+        data = np.ascontiguousarray(value, dtype=np.float32)
+        self._SetUniform(
+            name,
+            (data.tobytes(), transpose),
+            func,
+            1 if data.ndim == 2 else data.shape[0],
+            transpose,
+            data,
+        )
+
     @contextmanager
     def Bind(self, *args: t.Any, **kwargs: t.Any):
         with GL.ShaderProgram.Bind(self.id):
@@ -196,3 +352,7 @@ class ShaderProgram(Abc.Graphic.ShaderPrograms.ShaderProgram):
     @property
     def blend_factors(self) -> t.Optional[tuple['GL.hints.blend_factor', 'GL.hints.blend_factor']]:
         return self.__class__.__blend_factors__
+
+    @property
+    def blended(self) -> bool:
+        return self.blend_equation is not None or self.blend_factors is not None
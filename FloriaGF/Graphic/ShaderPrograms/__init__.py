@@ -2,5 +2,10 @@ from . import Construct
 
 from .ShaderProgram import ShaderProgram, BaseVertexShader
 
-from .CameraSupportShaderProgram import CameraShaderProgram, CameraVertexShader
+from .CameraSupportShaderProgram import (
+    CameraShaderProgram,
+    CameraVertexShader,
+    CAMERA_BLOCK_BINDING,
+    MATERIAL_BLOCK_BINDING,
+)
 from .ComposeShaderProgram import ComposeShaderProgram
@@ -0,0 +1,132 @@
+import typing as t
+from uuid import UUID, uuid4
+
+from ... import Abc, Managers, GL, Utils
+from ...AsyncEvent import AsyncEvent
+
+
+class ShareGroup(
+    Abc.Mixins.ID[UUID],
+    Abc.Mixins.Disposable,
+):
+    '''
+    Окна с общими (shared) контекстами OpenGL.
+
+    Программы, текстуры и буферы видны во всех контекстах группы, поэтому создаются один раз:
+    группа владеет общим `ShaderManager`, а кэши ресурсов ключуются по `id` группы и освобождаются
+    в `on_dispose`. VAO и FBO не разделяются между контекстами и остаются у окон.
+
+    Объекты создаются в контексте конкретного окна и освобождаются в нём же, поэтому контекст удалённого окна
+    не уничтожается, пока в группе есть другие окна: окно скрывается и "паркуется" вместе со своим контекстом
+    до удаления группы. Группа удаляется вместе с последним окном, пока его контекст ещё жив.
+    '''
+
+    __slots__ = (
+        '_id',
+        '_windows',
+        '_parked',
+        '_shader_manager',
+        '_on_dispose',
+    )
+
+    _default: t.ClassVar[t.Optional['ShareGroup']] = None
+
+    def __init__(self):
+        self._id: UUID = uuid4()
+        self._windows: list[Abc.Window] = []
+        # окно, его контекст
+        self._parked: list[tuple[Abc.Window, GL.Window.GLFWWindow]] = []
+        self._shader_manager: t.Optional[Managers.ShaderManager] = None
+
+        self._on_dispose = AsyncEvent[ShareGroup]()
+
+    @classmethod
+    def GetDefault(cls) -> 'ShareGroup':
+        '''
+        Общая группа процесса для окон без явного `share`.
+        '''
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        context = self.GetContext()
+
+        # общие объекты удаляются в любом живом контексте группы
+        with GL.Window.Bind(context) if context is not None else Utils.EmptyBind():
+            self.on_dispose.Invoke(self)
+
+            if self._shader_manager is not None:
+                self._shader_manager.Dispose()
+                self._shader_manager = None
+
+        GL.Window.Delete(*(context for _, context in self._parked))
+        self._parked.clear()
+
+        if ShareGroup._default is self:
+            ShareGroup._default = None
+
+    def Attach(self, window: Abc.Window):
+        if window in self._windows:
+            raise RuntimeError()
+
+        self._windows.append(window)
+        if self._shader_manager is None:
+            self._shader_manager = Managers.ShaderManager(window)
+
+    def Detach(self, window: Abc.Window) -> bool:
+        '''
+        Returns:
+            Может ли окно уничтожить свой контекст. Если нет - контекст уничтожит группа.
+        '''
+        self._windows.remove(window)
+
+        if len(self._windows) > 0:
+            if (context := window.GetGLFWWindow()) is not None:
+                self._parked.append((window, context))
+            return False
+
+        # контекст последнего окна ещё жив
+        with window.Bind():
+            self.Dispose()
+        return True
+
+    def GetContext(self) -> t.Optional[GL.Window.GLFWWindow]:
+        '''
+        Returns:
+            Живой контекст группы: окна группы или припаркованного окна.
+        '''
+        if (context := self.GetShareContext()) is not None:
+            return context
+        return next((context for _, context in self._parked), None)
+
+    def GetShareContext(self) -> t.Optional[GL.Window.GLFWWindow]:
+        '''
+        Returns:
+            Контекст, с которым разделяется новое окно группы, или None для первого окна.
+        '''
+        return next(
+            (context for window in self._windows if (context := window.GetGLFWWindow()) is not None),
+            None,
+        )
+
+    def GetID(self):
+        return self._id
+
+    @property
+    def shader_manager(self) -> Managers.ShaderManager:
+        if self._shader_manager is None:
+            raise RuntimeError()
+        return self._shader_manager
+
+    @property
+    def windows(self) -> tuple[Abc.Window, ...]:
+        return tuple(self._windows)
+
+    @property
+    def parked_count(self) -> int:
+        return len(self._parked)
+
+    @property
+    def on_dispose(self) -> AsyncEvent['ShareGroup']:
+        return self._on_dispose
@@ -7,8 +7,11 @@ from contextlib import contextmanager
 from ... import Abc, Utils, Managers, Convert, GL, Types
 from ...Config import Config
 from ..Objects.VAO import VAO
+from ..Objects.RenderTargetPool import RenderTargetPool
+from ..Objects.UniformRingBuffer import UniformRingBuffer
 from ...AsyncEvent import AsyncEvent
 from ..Camera import Camera
+from .ShareGroup import ShareGroup
 from ...Stopwatch import stopwatch
 
 
@@ -27,8 +30,14 @@ class Window(Abc.Graphic.Windows.Window):
         vsync: t.Optional[GL.hints.vsync] = None,
         background_color: Types.hints.rgb = (255, 255, 255),
         double_buffer: bool = True,
+        share: t.Optional[Abc.Window | ShareGroup] = None,
         **kwargs: t.Any,
     ):
+        '''
+        Args:
+            share: Окно или группа, с которыми разделяется контекст OpenGL.
+                По умолчанию - собственный контекст или общая группа процесса при `Config.SHARE_CONTEXTS`.
+        '''
         super().__init__()
 
         self._id: UUID = uuid4()
@@ -36,8 +45,9 @@ class Window(Abc.Graphic.Windows.Window):
 
         self._vsync: GL.hints.vsync = Config.VSYNC if vsync is None else vsync
         self._background_color = Types.RGB.New(background_color)
-        self._context_version: tuple[int, int] = (4, 2)
+        self._context_version: tuple[int, int] = Config.CONTEXT_VERSIONS
         self._double_buffer: bool = double_buffer
+        self._gl_call_stats: GL.State.CallStats = GL.State.CallStats(0, 0)
 
         glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, self.context_version[0])
         glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, self.context_version[1])
@@ -50,7 +60,20 @@ class Window(Abc.Graphic.Windows.Window):
         glfw.window_hint(glfw.DECORATED, decorated)
         glfw.window_hint(glfw.FLOATING, floating)
 
-        self._window: t.Optional[GL.Window.GLFWWindow] = GL.Window.Create(size, title)
+        if isinstance(share, ShareGroup):
+            self._share_group: ShareGroup = share
+        elif share is not None:
+            self._share_group = share.share_group
+        else:
+            self._share_group = ShareGroup.GetDefault() if Config.SHARE_CONTEXTS else ShareGroup()
+
+        self._window: t.Optional[GL.Window.GLFWWindow] = GL.Window.Create(
+            size,
+            title,
+            self._share_group.GetShareContext(),
+        )
+        self._share_group.Attach(self)
+        self._vao_quad: t.Optional[VAO] = None
 
         self._on_simulate = AsyncEvent[Abc.Window]()
         self._on_simulated = AsyncEvent[Abc.Window]()
@@ -59,8 +82,10 @@ class Window(Abc.Graphic.Windows.Window):
         self._on_resize = AsyncEvent[Abc.Window, Types.Vec2[int]]()
 
         self._input_manager: Managers.InputManager = Managers.InputManager(self)
-        self._shader_manager: Managers.ShaderManager = Managers.ShaderManager(self)
         self._material_manager: Managers.MaterialManager = Managers.MaterialManager(self)
+        self._render_target_pool: RenderTargetPool = RenderTargetPool(self)
+        # размер записи: кольцо
+        self._uniform_rings: dict[int, UniformRingBuffer] = {}
 
         with self.Bind():
             self._camera: Abc.Camera = Camera(
@@ -86,12 +111,24 @@ class Window(Abc.Graphic.Windows.Window):
     def Dispose(self, *args: t.Any, **kwargs: t.Any):
         with self.Bind():
             self.input_manager.Dispose()
-            self.shader_manager.Dispose()
             self.material_manager.Dispose()
             self.camera.Dispose()
+            self.render_target_pool.Dispose()
+
+            for ring in self._uniform_rings.values():
+                ring.Dispose()
+            self._uniform_rings.clear()
 
-        GL.Window.Delete(self.glfw_window)
-        self._window = None
+            if self._vao_quad is not None:
+                self._vao_quad.Dispose()
+                self._vao_quad = None
+
+        self.visible = False
+        # контекст припаркованного окна остаётся у окна, чтобы созданные в нём общие объекты освобождались в нём же;
+        # его уничтожит группа
+        if self.share_group.Detach(self):
+            GL.Window.Delete(self.glfw_window)
+            self._window = None
 
     def _SizeCallback(self, window: GL.Window.GLFWWindow, width: int, height: int):
         self.on_resize.Invoke(self, Types.Vec2(width, height))
@@ -114,6 +151,8 @@ class Window(Abc.Graphic.Windows.Window):
             self.Simulation()
             GL.Window.SwapBuffers(self.glfw_window)
 
+            self._gl_call_stats = GL.State.EndFrame()
+
         self.on_simulated.Invoke(self)
 
     @stopwatch
@@ -123,6 +162,11 @@ class Window(Abc.Graphic.Windows.Window):
         self.camera.Render()
         self.camera.Draw()
 
+        self.render_target_pool.Tick()
+
+        for ring in self._uniform_rings.values():
+            ring.Advance()
+
     def _PerformClose(self):
         self.on_close.Invoke(self)
 
@@ -153,14 +197,34 @@ class Window(Abc.Graphic.Windows.Window):
     def GetGLFWWindow(self):
         return self._window
 
+    def GetUniformRing(self, itemsize: int) -> UniformRingBuffer:
+        '''
+        Общий UBO окна для записей размера `itemsize` (камеры разделённого экрана получают в нём слоты).
+        '''
+        if (ring := self._uniform_rings.get(itemsize)) is None:
+            ring = self._uniform_rings[itemsize] = UniformRingBuffer(self, itemsize)
+        return ring
+
     @contextmanager
     def Bind(self):
         with GL.Window.Bind(self.glfw_window):
             yield self
 
+    @property
+    def share_group(self) -> ShareGroup:
+        return self._share_group
+
     @property
     def shader_manager(self):
-        return self._shader_manager
+        return self.share_group.shader_manager
+
+    @property
+    def vao_quad(self) -> VAO:
+        '''Полноэкранный прямоугольник для композиции. VAO не разделяются между контекстами, поэтому он свой у окна.'''
+        if self._vao_quad is None:
+            with self.Bind():
+                self._vao_quad = VAO.NewQuad(self)
+        return self._vao_quad
 
     @property
     def material_manager(self):
@@ -170,6 +234,10 @@ class Window(Abc.Graphic.Windows.Window):
     def input_manager(self):
         return self._input_manager
 
+    @property
+    def render_target_pool(self):
+        return self._render_target_pool
+
     @property
     def should_close(self) -> bool:
         return GL.Window.ShouldClose(self._window)
@@ -186,6 +254,11 @@ class Window(Abc.Graphic.Windows.Window):
     def double_buffer(self) -> bool:
         return self._double_buffer
 
+    @property
+    def gl_call_stats(self) -> GL.State.CallStats:
+        '''Выполненные и отброшенные вызовы OpenGL за последний кадр окна.'''
+        return self._gl_call_stats
+
     def GetCamera(self) -> Abc.Camera:
         return self._camera
 
@@ -1 +1,2 @@
 from .Window import Window
+from .ShareGroup import ShareGroup
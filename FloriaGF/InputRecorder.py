@@ -0,0 +1,131 @@
+import typing as t
+import struct
+import pathlib
+from enum import IntEnum
+
+from . import Abc
+
+
+class InputRecordKind(IntEnum):
+    KEY = 0
+    MOUSE = 1
+    CURSOR = 2
+    SCROLL = 3
+
+
+class InputRecord(t.NamedTuple):
+    '''Один вызов GLFW-колбэка ввода.'''
+
+    tick: int
+    '''Номер кадра `InputManager.Simulate` от начала записи, в котором событие попадает в ввод.'''
+    kind: InputRecordKind
+    action: int = 0
+    mods: int = 0
+    code: int = 0
+    '''Код клавиши или кнопки мыши.'''
+    x: float = 0
+    '''Позиция курсора или смещение прокрутки.'''
+    y: float = 0
+
+
+class InputRecorder(
+    Abc.Mixins.Disposable,
+):
+    '''
+    Пишет события ввода в двоичный журнал: заголовок `HEADER` и записи фиксированного размера `RECORD`.
+    '''
+
+    MAGIC: t.Final = b'FGIR'
+    VERSION: t.Final = 1
+
+    HEADER: t.Final = struct.Struct('<4sH')
+    # tick, kind, action, mods, code, x, y
+    RECORD: t.Final = struct.Struct('<IBBhidd')
+
+    __slots__ = (
+        '_file',
+        '_count',
+    )
+
+    def __init__(self, path: str | pathlib.Path):
+        self._file: t.Optional[t.BinaryIO] = open(path, 'wb')
+        self._file.write(self.HEADER.pack(self.MAGIC, self.VERSION))
+
+        self._count: int = 0
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        self.Close()
+
+    def Write(self, record: InputRecord):
+        if self._file is None:
+            raise RuntimeError()
+
+        self._file.write(self.RECORD.pack(*record))
+        self._count += 1
+
+    def Close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @classmethod
+    def Load(cls, path: str | pathlib.Path) -> tuple[InputRecord, ...]:
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        magic, version = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(magic, version)
+
+        return tuple(
+            InputRecord(tick, InputRecordKind(kind), action, mods, code, x, y)
+            for tick, kind, action, mods, code, x, y in cls.RECORD.iter_unpack(
+                memoryview(data)[cls.HEADER.size : len(data) - (len(data) - cls.HEADER.size) % cls.RECORD.size]
+            )
+        )
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+
+class InputReplay:
+    '''
+    Воспроизведение журнала `InputRecorder`: события выдаются, когда номер кадра от начала воспроизведения достигает их такта.
+    '''
+
+    __slots__ = (
+        '_records',
+        '_index',
+    )
+
+    def __init__(self, records: t.Sequence[InputRecord]):
+        self._records: t.Sequence[InputRecord] = records
+        self._index: int = 0
+
+    @classmethod
+    def Load(cls, path: str | pathlib.Path) -> 'InputReplay':
+        return cls(InputRecorder.Load(path))
+
+    def Pop(self, tick: int) -> t.Iterator[InputRecord]:
+        '''
+        События с тактом не больше `tick`, в порядке записи.
+        '''
+        while self._index < len(self._records) and (record := self._records[self._index]).tick <= tick:
+            self._index += 1
+            yield record
+
+    @property
+    def finished(self) -> bool:
+        return self._index >= len(self._records)
+
+    @property
+    def position(self) -> int:
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,128 @@
+import typing as t
+import glfw
+import numpy as np
+
+from .Types.Vec import Vec2
+
+
+class InputState:
+    '''
+    Снимок ввода окна за кадр, собирается в `InputManager.Simulate`.
+
+    Клавиши и кнопки мыши (коды кнопок 0-7 не пересекаются с кодами клавиш) хранятся в массивах bool,
+    поэтому проверка "зажата / нажата / отпущена в этом кадре" - одно обращение по индексу.
+    Массивы `down`, `pressed`, `released` доступны только для чтения и подходят для векторных проверок систем.
+    '''
+
+    KEY_COUNT: t.Final = glfw.KEY_LAST + 1
+
+    __slots__ = (
+        '_down',
+        '_pressed',
+        '_released',
+        '_down_view',
+        '_pressed_view',
+        '_released_view',
+        '_cursor',
+        '_cursor_delta',
+        '_scroll',
+        '_frame',
+    )
+
+    def __init__(self):
+        self._down: np.ndarray = np.zeros(self.KEY_COUNT, dtype=np.bool_)
+        self._pressed: np.ndarray = np.zeros(self.KEY_COUNT, dtype=np.bool_)
+        self._released: np.ndarray = np.zeros(self.KEY_COUNT, dtype=np.bool_)
+
+        self._down_view: np.ndarray = self._ReadOnly(self._down)
+        self._pressed_view: np.ndarray = self._ReadOnly(self._pressed)
+        self._released_view: np.ndarray = self._ReadOnly(self._released)
+
+        self._cursor: t.Optional[Vec2[float]] = None
+        self._cursor_delta: Vec2[float] = Vec2[float](0, 0)
+        self._scroll: Vec2[float] = Vec2[float](0, 0)
+
+        self._frame: int = 0
+
+    @staticmethod
+    def _ReadOnly(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def BeginFrame(self):
+        '''
+        Сбрасывает данные прошлого кадра: нажатия, отпускания, смещение курсора и прокрутку.
+        '''
+        self._pressed.fill(False)
+        self._released.fill(False)
+        self._cursor_delta = Vec2[float](0, 0)
+        self._scroll = Vec2[float](0, 0)
+        self._frame += 1
+
+    def ApplyKey(self, key: int, action: int):
+        if not 0 <= key < self.KEY_COUNT:
+            return
+
+        if action == glfw.PRESS:
+            self._down[key] = True
+            self._pressed[key] = True
+
+        elif action == glfw.RELEASE:
+            self._down[key] = False
+            self._released[key] = True
+
+    def ApplyCursor(self, position: Vec2[float]):
+        if self._cursor is not None:
+            self._cursor_delta = Vec2[float](
+                self._cursor_delta[0] + position[0] - self._cursor[0],
+                self._cursor_delta[1] + position[1] - self._cursor[1],
+            )
+        self._cursor = position
+
+    def ApplyScroll(self, offset: Vec2[float]):
+        self._scroll = Vec2[float](self._scroll[0] + offset[0], self._scroll[1] + offset[1])
+
+    def Reset(self):
+        '''
+        Отпускает все клавиши без событий, например при потере фокуса окном.
+        '''
+        self._down.fill(False)
+
+    def IsDown(self, key: int) -> bool:
+        return bool(self._down[key])
+
+    def IsPressed(self, key: int) -> bool:
+        return bool(self._pressed[key])
+
+    def IsReleased(self, key: int) -> bool:
+        return bool(self._released[key])
+
+    @property
+    def down(self) -> np.ndarray:
+        return self._down_view
+
+    @property
+    def pressed(self) -> np.ndarray:
+        return self._pressed_view
+
+    @property
+    def released(self) -> np.ndarray:
+        return self._released_view
+
+    @property
+    def cursor(self) -> t.Optional[Vec2[float]]:
+        return self._cursor
+
+    @property
+    def cursor_delta(self) -> Vec2[float]:
+        return self._cursor_delta
+
+    @property
+    def scroll(self) -> Vec2[float]:
+        return self._scroll
+
+    @property
+    def frame(self) -> int:
+        '''Номер кадра снимка.'''
+        return self._frame
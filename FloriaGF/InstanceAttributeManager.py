@@ -126,6 +126,25 @@ class InstanceAttributeManager[
 
         return dict(self.__data_cache)
 
+    @stopwatch
+    def GetInstanceDataUpdates(self) -> dict[TName, t.Any]:
+        """Возвращает только изменившиеся атрибуты инстанса.
+
+        Returns:
+            Словарь атрибутов, помеченных через _UpdateInstanceAttributes() с прошлого вызова,
+            или всех атрибутов, если кэш пуст.
+
+        Side Effects:
+            Те же, что у GetInstanceData().
+        """
+
+        if self.__data_cache is None:
+            return self.GetInstanceData()
+
+        names = tuple(self.__update_names)
+        data = self.GetInstanceData()
+        return {name: data[name] for name in names}
+
     def GetInstanceDType(self) -> np.dtype:
         """Создает numpy dtype для передачи данных в OpenGL буфер.
 
@@ -1,7 +1,11 @@
 import typing as t
 import pathlib
+import asyncio
+
+from uuid import UUID
 
 from .. import Abc, Assets, Utils
+from ..Config import Config
 from .Manager import Manager
 from ..Sequences import AssetSequence
 from ..Loggers import asset_manager_logger
@@ -22,6 +26,11 @@ class AssetManager(
     def on_loaded(self) -> AsyncEvent['AssetManager', pathlib.Path, 'Asset']:
         return self._on_loaded
 
+    @property
+    def on_progress(self) -> AsyncEvent['AssetManager', int, int]:
+        '''(загружено, всего)'''
+        return self._on_progress
+
     def __init__(
         self,
         asset_types: t.Optional[
@@ -30,9 +39,12 @@ class AssetManager(
                 t.Type['Asset'],
             ]
         ] = None,
+        loader: t.Optional[Assets.AssetLoader] = None,
     ):
         super().__init__()
 
+        self.loader: Assets.AssetLoader = Assets.AssetLoader() if loader is None else loader
+
         self.asset_types: dict[tuple[str, ...], t.Type['Asset']] = {
             ('.png', '.jpg', '.jpeg'): Assets.Image,
             ('.txt', '.log'): Assets.Text,
@@ -43,6 +55,20 @@ class AssetManager(
 
         self._on_load = AsyncEvent['AssetManager', pathlib.Path]()
         self._on_loaded = AsyncEvent['AssetManager', pathlib.Path, 'Asset']()
+        self._on_progress = AsyncEvent['AssetManager', int, int]()
+
+        # resolved path: asset
+        self._path_index: dict[pathlib.Path, 'Asset'] = {}
+        # suffix: {asset.id: asset}
+        self._extension_index: dict[str, dict[UUID, 'Asset']] = {}
+        # asset.id: resolved path на момент регистрации
+        self._indexed_paths: dict[UUID, pathlib.Path] = {}
+        # resolved path: загрузка в процессе
+        self._loading: dict[pathlib.Path, asyncio.Task['Asset']] = {}
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        super().Dispose(*args, **kwargs)
+        self.loader.Dispose()
 
     def GetAssetTypeByExtension(
         self,
@@ -54,37 +80,143 @@ class AssetManager(
                 return type
         return default
 
+    def GetByPath(self, path: str | pathlib.Path) -> t.Optional['Asset']:
+        '''
+        Ищет ассет по пути через индекс.
+        '''
+        resolved = Utils.ResolvePath(path)
+
+        if (asset := self._path_index.get(resolved)) is None:
+            return None
+
+        # путь ассета мог смениться после регистрации
+        if (asset_path := asset.path) is None or Utils.ResolvePath(asset_path) != resolved:
+            self._Unindex(asset)
+            self._Index(asset)
+            return self._path_index.get(resolved)
+
+        return asset
+
+    def GetByExtension(self, suffix: str) -> AssetSequence['Asset']:
+        return AssetSequence(self._extension_index.get(suffix.lower(), {}).values())
+
+    def GetByType[T: 'Asset'](self, type: t.Type[T]) -> AssetSequence[T]:
+        return self.sequence.OfType(type)
+
+    def _Index(self, asset: 'Asset'):
+        if (path := asset.path) is None:
+            return
+
+        resolved = Utils.ResolvePath(path)
+        self._indexed_paths[asset.id] = resolved
+        self._path_index.setdefault(resolved, asset)
+        self._extension_index.setdefault(resolved.suffix.lower(), {})[asset.id] = asset
+
+    def _Unindex(self, asset: 'Asset'):
+        if (resolved := self._indexed_paths.pop(asset.id, None)) is None:
+            return
+
+        if self._path_index.get(resolved) is asset:
+            self._path_index.pop(resolved)
+        if (assets := self._extension_index.get(resolved.suffix.lower())) is not None:
+            assets.pop(asset.id, None)
+
     @t.overload
     async def LoadFile(self, path: str | pathlib.Path, /) -> 'Asset': ...
     @t.overload
     async def LoadFile[T: 'Asset'](self, path: str | pathlib.Path, type: t.Type[T]) -> T: ...
 
     async def LoadFile(self, path: str | pathlib.Path, type: t.Optional[t.Type['Asset']] = None):
+        '''
+        Одновременные загрузки одного пути ожидают общую задачу.
+        '''
         if isinstance(path, str):
             path = pathlib.Path(path)
 
         self.on_load.Invoke(self, path)
 
-        asset_cache = self.sequence.WithPath(path).FirstOrDefault()
+        asset_cache = self.GetByPath(path)
         if asset_cache is not None and (type is None or isinstance(asset_cache, type)):
-            asset = asset_cache
+            return asset_cache
 
-        else:
-            if not path.exists():
-                raise ValueError()
+        resolved = Utils.ResolvePath(path)
 
-            if type is None:
-                type = self.GetAssetTypeByExtension(path.suffix)
+        if (task := self._loading.get(resolved)) is not None:
+            asset = await asyncio.shield(task)
+            if type is None or isinstance(asset, type):
+                return asset
 
-            asset = self.Register(await type.Load(path))
+        task = asyncio.ensure_future(self._LoadFile(path, type))
+        self._loading[resolved] = task
+        try:
+            return await asyncio.shield(task)
 
-            asset_manager_logger.info(f'LoadFile "{path}"\ttype=\'{type.__module__}.{type.__qualname__}\'')
+        finally:
+            if self._loading.get(resolved) is task:
+                self._loading.pop(resolved)
 
-            self.on_loaded.Invoke(self, path, asset)
+    async def _LoadFile(self, path: pathlib.Path, type: t.Optional[t.Type['Asset']]) -> 'Asset':
+        if not path.exists():
+            raise ValueError()
+
+        if type is None:
+            type = self.GetAssetTypeByExtension(path.suffix)
+
+        asset = self.Register(await type.Load(path, self.loader))
+
+        asset_manager_logger.info(f'LoadFile "{path}"\ttype=\'{type.__module__}.{type.__qualname__}\'')
+
+        self.on_loaded.Invoke(self, path, asset)
 
         return asset
 
-    async def LoadDir(self, dir: str | pathlib.Path, depth_or_pattern: bool | str = False):
+    async def LoadIter(
+        self,
+        paths: t.Iterable[str | pathlib.Path],
+        limit: t.Optional[int] = None,
+    ) -> t.AsyncIterator['Asset']:
+        '''
+        Загружает файлы не более чем по `limit` одновременно и отдаёт ассеты по мере готовности.
+
+        Новые файлы начинают загружаться только когда потребитель забирает готовые ассеты.
+        '''
+        if limit is None:
+            limit = Config.ASSET_LOAD_LIMIT
+        if limit <= 0:
+            raise ValueError()
+
+        paths = tuple(paths)
+        iterator = iter(paths)
+        pending: set[asyncio.Task['Asset']] = set()
+        loaded: int = 0
+
+        try:
+            while True:
+                while len(pending) < limit and (path := next(iterator, None)) is not None:
+                    pending.add(asyncio.ensure_future(self.LoadFile(path)))
+
+                if len(pending) == 0:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    loaded += 1
+                    self.on_progress.Invoke(self, loaded, len(paths))
+                    yield task.result()
+
+            await self.loader.Flush()
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def LoadDir(
+        self,
+        dir: str | pathlib.Path,
+        depth_or_pattern: bool | str = False,
+        limit: t.Optional[int] = None,
+    ) -> list['Asset']:
         asset_manager_logger.info(
             f'''LoadDir "{dir}" {
             f'depth={depth_or_pattern}' 
@@ -106,7 +238,7 @@ class AssetManager(
         else:
             matches = dir.glob(depth_or_pattern)
 
-        await Utils.WaitCors(self.LoadFile(path) for path in matches if path.is_file())
+        return [asset async for asset in self.LoadIter((path for path in matches if path.is_file()), limit)]
 
     async def Load(self, path_or_dir: str | pathlib.Path):
         asset_manager_logger.info(f'Load "{path_or_dir}"...')
@@ -125,16 +257,18 @@ class AssetManager(
 
     @property
     def sequence(self) -> AssetSequence[Asset]:
-        return AssetSequence(self._storage.values())
+        return AssetSequence(self._storage.values(), self._GetSequenceIndex())
 
     async def Clear(self):
         asset_manager_logger.info(f'Clear {self.count} assets')
 
-        for asset in (*self.sequence,):
+        for asset in self.GetSnapshot():
             self.Remove(asset)
 
     def Register[T: Asset](self, item: T) -> T:
-        return t.cast(T, super().Register(item))
+        super().Register(item)
+        self._Index(item)
+        return item
 
     @t.overload
     def Remove[T: 'Asset'](self, item: T, /) -> T: ...
@@ -142,4 +276,11 @@ class AssetManager(
     def Remove[T: 'Asset', TDefault: t.Any](self, item: T, default: TDefault, /) -> T | TDefault: ...
 
     def Remove(self, *args: t.Any):
-        return super().Remove(*args)
+        item = t.cast('Asset', args[0])
+        registered = self._GetKey(item) in self._storage
+
+        result = super().Remove(*args)
+        if registered:
+            self._Unindex(item)
+
+        return result
@@ -1,4 +1,5 @@
 import typing as t
+from uuid import UUID
 
 from .. import Abc, Utils
 from .Manager import Manager
@@ -13,9 +14,33 @@ class BatchObjectManager(
 
         self._window = window
 
+        self._render_list: t.Optional[tuple[Abc.Graphic.Batching.Batch, ...]] = None
+        # batch.id: (on_change_index id, on_change_enabled id)
+        self._batch_events: dict[UUID, tuple[int, int]] = {}
+
+    @staticmethod
+    def _GetBatchIndex(batch: Abc.Graphic.Batching.Batch) -> int:
+        return batch.index
+
+    def _Invalidate(self):
+        super()._Invalidate()
+        self._render_list = None
+
+    def _OnBatchChange(self, batch: Abc.Graphic.Batching.Batch, value: t.Any):
+        self._Invalidate()
+
+    def GetRenderList(self) -> tuple[Abc.Graphic.Batching.Batch, ...]:
+        '''
+        Включённые батчи в порядке `index`. Пересобирается только при регистрации, удалении,
+        смене индекса или включения батча.
+        '''
+        if self._render_list is None:
+            self._render_list = tuple(batch for batch in self.GetSortedSnapshot(self._GetBatchIndex) if batch.enabled)
+        return self._render_list
+
     @stopwatch
     def Draw(self, camera: Abc.Camera):
-        for batch in self.sequence.Sort(lambda batch: batch.index):
+        for batch in self.GetRenderList():
             batch.Render(camera)
             batch.Draw()
 
@@ -24,7 +49,14 @@ class BatchObjectManager(
         return self._window
 
     def Register[T: Abc.Graphic.Batching.Batch](self, item: T) -> T:
-        return t.cast(T, super().Register(item))
+        super().Register(item)
+
+        self._batch_events[item.id] = (
+            item.on_change_index.Register(self._OnBatchChange),
+            item.on_change_enabled.Register(self._OnBatchChange),
+        )
+
+        return item
 
     @t.overload
     def Remove[T: Abc.Graphic.Batching.Batch](self, item: T, /) -> T: ...
@@ -32,4 +64,10 @@ class BatchObjectManager(
     def Remove[T: Abc.Graphic.Batching.Batch, TDefault: t.Any](self, item: T, default: TDefault, /) -> T | TDefault: ...
 
     def Remove(self, *args: t.Any):
+        item = t.cast(Abc.Graphic.Batching.Batch, args[0])
+
+        if (events := self._batch_events.pop(item.id, None)) is not None:
+            item.on_change_index.Remove(events[0])
+            item.on_change_enabled.Remove(events[1])
+
         return super().Remove(*args)
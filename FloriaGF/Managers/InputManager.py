@@ -5,8 +5,9 @@ import glfw
 from collections import deque
 from time import perf_counter
 import math
+import pathlib
 
-from .. import Abc, Utils, Convert
+from .. import Abc, Utils, Convert, Validator
 from ..TimeoutScheduler import TimeoutScheduler
 from ..AsyncEvent import AsyncEvent
 from ..Types.Vec import Vec2
@@ -14,6 +15,8 @@ from ..Types.Angle import Angle2D
 from ..Types.Direction import Direction
 from ..Core import Core
 from ..Loggers import input_manager_logger
+from ..InputState import InputState
+from ..InputRecorder import InputRecorder, InputReplay, InputRecord, InputRecordKind
 
 
 class Key(t.NamedTuple):
@@ -51,6 +54,17 @@ class Action(t.TypedDict):
     type: action_type
 
 
+def _ToSet[T](value: t.Optional[T | t.Collection[T]]) -> t.Optional[frozenset[T]]:
+    '''
+    Значение или коллекция значений из описания действия в множество для проверки за O(1).
+    '''
+    if value is None:
+        return None
+    if isinstance(value, t.Collection) and not isinstance(value, str):
+        return frozenset(t.cast(t.Collection[T], value))
+    return frozenset((t.cast(T, value),))
+
+
 class ActionData[
     TAction: Action,
     TEvent: AsyncEvent[...],
@@ -77,6 +91,12 @@ class KeyActionData[
     @abstractmethod
     def Processing(self, event: TEvent, key: Key) -> t.Any: ...
 
+    @abstractmethod
+    def GetKeys(self) -> frozenset[int]:
+        '''
+        Коды клавиш, события которых обрабатывает действие. По ним строится таблица диспетчеризации `InputManager`.
+        '''
+
     @staticmethod
     def KeyActionToStage(action: int) -> press_stage:
         match action:
@@ -139,23 +159,25 @@ class ActionClickData(
 
         self.sch_id: t.Optional[int] = None
 
+        self.keys: frozenset[int] = _ToSet(action['key']) or frozenset()
+        self.stages: t.Optional[frozenset[press_stage]] = _ToSet(action.get('stages'))
+        self.mods: t.Optional[frozenset[press_mod]] = _ToSet(action.get('mods'))
+
+    def GetKeys(self) -> frozenset[int]:
+        return self.keys
+
     def Processing(
         self,
         event: AsyncEvent[press_stage, press_mod],
         key: Key,
     ):
-        action_key = self.action['key']
-
-        if key.key not in (action_key if isinstance(action_key, t.Collection) else (action_key,)):
+        if key.key not in self.keys:
             return
 
         stage = self.KeyActionToStage(key.action)
         mod = self.KeyModToMods(key.mod)
 
-        if (
-            (stages := self.action.get('stages')) is not None
-            and (stage != stages if isinstance(stages, str) else stage not in stages)
-        ) or ((mods := self.action.get('mods')) is not None and (mod != mods if isinstance(mods, str) else mod not in mods)):
+        if (self.stages is not None and stage not in self.stages) or (self.mods is not None and mod not in self.mods):
             return
 
         event.Invoke(stage, mod)
@@ -177,21 +199,21 @@ class ActionDoubleClickData(
 
         self.last: float = perf_counter()
 
+        self.keys: frozenset[int] = _ToSet(action['key']) or frozenset()
+        self.mods: t.Optional[frozenset[press_mod]] = _ToSet(action.get('mods'))
+
+    def GetKeys(self) -> frozenset[int]:
+        return self.keys
+
     def Processing(
         self,
         event: AsyncEvent[...],
         key: Key,
     ):
-        stage = self.KeyActionToStage(key.action)
-        mod = self.KeyModToMods(key.mod)
-
-        action_key = self.action['key']
+        if key.key not in self.keys or self.KeyActionToStage(key.action) != 'press':
+            return
 
-        if (
-            key.key not in (action_key if isinstance(action_key, t.Collection) else (action_key,))
-            or stage != 'press'
-            or ((mods := self.action.get('mods')) is not None and (mod != mods if isinstance(mods, str) else mod not in mods))
-        ):
+        if self.mods is not None and self.KeyModToMods(key.mod) not in self.mods:
             return
 
         now = perf_counter()
@@ -214,38 +236,38 @@ class ActionVector2D(
 class ActionVector2DData(
     KeyActionData[ActionVector2D, AsyncEvent[Angle2D]],
 ):
+    DIRECTIONS: t.Final[tuple[t.Literal['up', 'left', 'down', 'right'], ...]] = ('up', 'left', 'down', 'right')
+
     def __init__(self, action: ActionVector2D) -> None:
         super().__init__(action)
 
         self.direction = Direction()
         self.angle: t.Optional[float] = None
 
+        self.directions: dict[t.Literal['up', 'left', 'down', 'right'], frozenset[int]] = {
+            direct: _ToSet(action[direct]) or frozenset() for direct in self.DIRECTIONS
+        }
+        self.mods: t.Optional[frozenset[press_mod]] = _ToSet(action.get('mods'))
+
+    def GetKeys(self) -> frozenset[int]:
+        return frozenset().union(*self.directions.values())
+
     def Processing(
         self,
         event: AsyncEvent[Angle2D],
         key: Key,
     ):
         stage = self.KeyActionToStage(key.action)
-        mod = self.KeyModToMods(key.mod)
 
-        if stage not in ['press', 'release'] or (
-            stage == 'press'
-            and (mods := self.action.get('mods')) is not None
-            and (mod != mods if isinstance(mods, str) else mod not in mods)
+        if stage not in ('press', 'release') or (
+            stage == 'press' and self.mods is not None and self.KeyModToMods(key.mod) not in self.mods
         ):
             return
 
         is_press = stage == 'press'
         direction: dict[t.Literal['up', 'left', 'down', 'right'], bool] = {
-            'up': False,
-            'left': False,
-            'down': False,
-            'right': False,
+            direct: is_press and key.key in keys for direct, keys in self.directions.items()
         }
-        for direct in direction.keys():
-            action_key = self.action[direct]
-            if len(keys := (action_key if isinstance(action_key, t.Collection) else (action_key,))) > 0 and key.key in keys:
-                direction[direct] = is_press
 
         self.direction = Direction(**direction)
 
@@ -269,6 +291,9 @@ class ActionHoldData(
 
         self.sch_id: t.Optional[int] = None
 
+    def GetKeys(self) -> frozenset[int]:
+        return frozenset((self.action['key'],))
+
     def Processing(
         self,
         event: AsyncEvent[press_stage],
@@ -332,6 +357,14 @@ actions = t.Union[
 
 
 class InputManager(Abc.Mixins.Disposable):
+    '''
+    События окна копятся в очередях и обрабатываются в `Simulate` в порядке поступления.
+
+    Действия включённых карт, на события которых есть подписка, собираются в таблицу
+    "код клавиши -> обработчики", поэтому событие стоит O(привязанных к клавише обработчиков).
+    Таблица пересобирается только при изменении карт, их включения или появлении нового события действия.
+    '''
+
     def __init__(self, window: Abc.Graphic.Windows.Window) -> None:
         super().__init__()
 
@@ -341,6 +374,10 @@ class InputManager(Abc.Mixins.Disposable):
         self._event_maps: dict[str, dict[str, dict[t.Optional[action_type], AsyncEvent[...]]]] = {}
         self._disabled_maps: set[str] = set()
 
+        # код клавиши: (действие, событие) в порядке карт и действий
+        self._key_table: t.Optional[dict[int, tuple[tuple[KeyActionData[t.Any, AsyncEvent[...]], AsyncEvent[...]], ...]]] = None
+        self._scroll_table: tuple[tuple[ScrollActionData[t.Any, AsyncEvent[...]], AsyncEvent[...]], ...] = ()
+
         glfw.set_key_callback(window.glfw_window, self._KeyCallback)
         glfw.set_mouse_button_callback(window.glfw_window, self._MouseCallback)
         self._key_pool = deque[Key]()
@@ -352,9 +389,16 @@ class InputManager(Abc.Mixins.Disposable):
         glfw.set_scroll_callback(window.glfw_window, self._ScrollCallback)
         self._scroll_pool = deque[Vec2[float]]()
 
+        self._state = InputState()
+
+        self._recorder: t.Optional[InputRecorder] = None
+        self._replay: t.Optional[InputReplay] = None
+        # кадры `state` на момент начала записи и воспроизведения
+        self._recorder_frame: int = 0
+        self._replay_frame: int = 0
+
     def Dispose(self, *args: t.Any, **kwargs: t.Any):
-        pass
-        # return super().Delete()
+        self.StopRecording()
 
     def SetMap(self, name: str, map: dict[str, actions], /, enable: bool = True):
         if name not in self._maps:
@@ -385,54 +429,159 @@ class InputManager(Abc.Mixins.Disposable):
 
             self._maps[name][action_name][action['type']] = cls(action)  # pyright: ignore[reportArgumentType]
 
+        self._InvalidateTables()
+
         if not enable:
             self.DisableMap(name)
 
     def SetMaps(self, maps: dict[str, dict[str, actions]]):
         self._maps.clear()
+        self._InvalidateTables()
         for map_name, map in maps.items():
             self.SetMap(map_name, map)
 
     def EnabledMap(self, name: str):
         if name in self._disabled_maps:
             self._disabled_maps.remove(name)
+            self._InvalidateTables()
 
     def DisableMap(self, name: str):
         if name not in self._maps:
             raise ValueError()
-        self._disabled_maps.add(name)
+        if name not in self._disabled_maps:
+            self._disabled_maps.add(name)
+            self._InvalidateTables()
+
+    def _InvalidateTables(self):
+        self._key_table = None
+
+    def _GetKeyTable(self):
+        if self._key_table is None:
+            self._BuildTables()
+        return t.cast(dict[int, tuple[tuple[KeyActionData[t.Any, AsyncEvent[...]], AsyncEvent[...]], ...]], self._key_table)
+
+    def _BuildTables(self):
+        key_table: dict[int, list[tuple[KeyActionData[t.Any, AsyncEvent[...]], AsyncEvent[...]]]] = {}
+        scroll_table: list[tuple[ScrollActionData[t.Any, AsyncEvent[...]], AsyncEvent[...]]] = []
+
+        for map_name, map in self._maps.items():
+            if map_name in self._disabled_maps or (event_map := self._event_maps.get(map_name)) is None:
+                continue
+
+            for action_name, types_action in map.items():
+                if (types_event := event_map.get(action_name)) is None:
+                    continue
+
+                for data in types_action.values():
+                    if (event := types_event.get(data.type)) is None:
+                        continue
+
+                    if isinstance(data, KeyActionData):
+                        for key in data.GetKeys():
+                            key_table.setdefault(key, []).append((data, event))
+
+                    elif isinstance(data, ScrollActionData):
+                        scroll_table.append((data, event))
+
+        self._key_table = {key: tuple(items) for key, items in key_table.items()}
+        self._scroll_table = tuple(scroll_table)
+
+        input_manager_logger.debug(
+            f'Input tables rebuilt: {len(self._key_table)} keys, {len(self._scroll_table)} scroll handlers'
+        )
 
     def _KeyCallback(self, glfw_window: t.Any, key: int, scancode: int, action: int, mods: int):
-        self._key_pool.append(Key(key, action, mods if mods != 0 else None))
+        if self._replay is None:
+            self._Push(InputRecord(self._GetRecordFrame(), InputRecordKind.KEY, action, mods, key))
 
     def _MouseCallback(self, glfw_window: t.Any, button: int, action: int, mods: int):
-        self._key_pool.append(Key(button, action, mods if mods != 0 else None))
+        if self._replay is None:
+            self._Push(InputRecord(self._GetRecordFrame(), InputRecordKind.MOUSE, action, mods, button))
 
     def _CursorPosCallback(self, glfw_window: t.Any, x: float, y: float):
-        self._cursor_pos_pool.append(Vec2[float](x, y))
+        if self._replay is None:
+            self._Push(InputRecord(self._GetRecordFrame(), InputRecordKind.CURSOR, x=x, y=y))
 
     def _ScrollCallback(self, glfw_window: t.Any, x_offset: float, y_offset: float):
-        self._scroll_pool.append(Vec2[float](x_offset, y_offset))
+        if self._replay is None:
+            self._Push(InputRecord(self._GetRecordFrame(), InputRecordKind.SCROLL, x=x_offset, y=y_offset))
+
+    def _Push(self, record: InputRecord):
+        if self._recorder is not None:
+            self._recorder.Write(record)
+
+        match record.kind:
+            case InputRecordKind.KEY | InputRecordKind.MOUSE:
+                self._key_pool.append(Key(record.code, record.action, record.mods if record.mods != 0 else None))
+
+            case InputRecordKind.CURSOR:
+                self._cursor_pos_pool.append(Vec2[float](record.x, record.y))
+
+            case InputRecordKind.SCROLL:
+                self._scroll_pool.append(Vec2[float](record.x, record.y))
+
+    def _GetRecordFrame(self) -> int:
+        '''
+        Returns:
+            Номер кадра `Simulate` от начала записи, в котором событие попадёт в `state`.
+        '''
+        return self._state.frame - self._recorder_frame
+
+    def StartRecording(self, path: str | pathlib.Path) -> InputRecorder:
+        '''
+        Пишет все события ввода окна с номером кадра `Simulate` в журнал `path`.
+        '''
+        self.StopRecording()
+        self._recorder = InputRecorder(path)
+        self._recorder_frame = self._state.frame
+        return self._recorder
+
+    def StopRecording(self):
+        if self._recorder is not None:
+            self._recorder.Close()
+            self._recorder = None
+
+    def StartReplay(self, replay: InputReplay | str | pathlib.Path) -> InputReplay:
+        '''
+        Подменяет ввод окна событиями журнала: они выдаются в тот же по счёту кадр `Simulate`, что и при записи,
+        а события GLFW игнорируются до `StopReplay`. Вместе с фиксированным шагом симуляции даёт повторяемый прогон.
+        '''
+        self._replay = InputReplay.Load(replay) if isinstance(replay, (str, pathlib.Path)) else replay
+        self._replay_frame = self._state.frame
+        return self._replay
+
+    def StopReplay(self):
+        self._replay = None
 
     def Simulate(self):
-        def SimulateItem(action_data: t.Type[ActionData[Action, AsyncEvent[...]]], *args: t.Any):
-            for map_name, map in self._maps.items():
-                if map_name in self._disabled_maps or (event_map := self._event_maps.get(map_name)) is None:
-                    continue
+        if self._replay is not None:
+            for record in self._replay.Pop(self._state.frame - self._replay_frame):
+                self._Push(record)
 
-                for action_name, types_action in map.items():
-                    if (types_event := event_map.get(action_name)) is None:
-                        continue
-
-                    for data in types_action.values():
-                        if (event := types_event.get(data.type)) is not None and isinstance(data, action_data):
-                            data.Processing(event, *args)
+        state = self._state
+        state.BeginFrame()
 
+        # обработчики могут менять карты: таблица берётся заново для каждого события
         while len(self._key_pool) > 0:
-            SimulateItem(KeyActionData, self._key_pool.pop())
+            key = self._key_pool.popleft()
+            state.ApplyKey(key.key, key.action)
+
+            for data, event in self._GetKeyTable().get(key.key, ()):
+                data.Processing(event, key)
+
+        if len(self._cursor_pos_pool) > 0:
+            while len(self._cursor_pos_pool) > 0:
+                state.ApplyCursor(self._cursor_pos_pool.popleft())
+
+            self._cursor_pos_event.Invoke(Validator.NotNone(state.cursor))
 
         while len(self._scroll_pool) > 0:
-            SimulateItem(ScrollActionData, self._scroll_pool.pop())
+            offset = self._scroll_pool.popleft()
+            state.ApplyScroll(offset)
+
+            self._GetKeyTable()
+            for data, event in self._scroll_table:
+                data.Processing(event, offset)
 
     def GetActionEvent(self, map: str, action: str, type: t.Optional[action_type] = None) -> AsyncEvent[...]:
         if map not in self._event_maps:
@@ -441,6 +590,7 @@ class InputManager(Abc.Mixins.Disposable):
             self._event_maps[map][action] = {}
         if type not in self._event_maps[map][action]:
             self._event_maps[map][action][type] = AsyncEvent()
+            self._InvalidateTables()
         return self._event_maps[map][action][type]
 
     def GetClick(self, map: str, action: str):
@@ -456,11 +606,27 @@ class InputManager(Abc.Mixins.Disposable):
         return t.cast(AsyncEvent[press_stage], self.GetActionEvent(map, action, 'hold'))
 
     def GetCursorPos(self):
+        '''
+        Событие с последней позицией курсора, вызывается не чаще раза за кадр.
+        '''
         return self._cursor_pos_event
 
     def GetScroll(self, map: str, action: str):
         return t.cast(AsyncEvent[Vec2[float]], self.GetActionEvent(map, action, 'scroll'))
 
+    @property
+    def recorder(self) -> t.Optional[InputRecorder]:
+        return self._recorder
+
+    @property
+    def replay(self) -> t.Optional[InputReplay]:
+        return self._replay
+
+    @property
+    def state(self) -> InputState:
+        '''Снимок ввода текущего кадра.'''
+        return self._state
+
     @property
     def window(self):
         return self._window
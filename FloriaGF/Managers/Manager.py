@@ -1,7 +1,8 @@
 import typing as t
 
 from .. import Abc, Protocols
-from ..Sequences import Sequence
+from ..Sequences import Sequence, ManagerIndex, SequenceIndex
+from ..Sequences.SequenceIndex import TIndexName
 
 
 class Manager[
@@ -9,8 +10,14 @@ class Manager[
 ](
     Abc.Managers.Manager[TItem],
 ):
+    INDEXES: t.ClassVar[tuple[TIndexName, ...]] = ('name', 'type')
+    '''Вторичные индексы, используемые последовательностями менеджера. Пустой кортеж отключает индексацию.'''
+
     __slots__ = (
         '_storage',
+        '_index',
+        '_snapshot',
+        '_sorted_snapshots',
         *Abc.Managers.Manager.__slots__,
     )
 
@@ -18,6 +25,13 @@ class Manager[
         super().__init__()
 
         self._storage: dict[t.Any, TItem] = {}
+        self._index: t.Optional[ManagerIndex[TItem]] = (
+            ManagerIndex(self._storage, self.INDEXES) if len(self.INDEXES) > 0 else None
+        )
+
+        self._snapshot: t.Optional[tuple[TItem, ...]] = None
+        # (key, reversed): sorted items
+        self._sorted_snapshots: dict[tuple[t.Callable[[TItem], t.Any], bool], tuple[TItem, ...]] = {}
 
     def Dispose(self, *args: t.Any, **kwargs: t.Any):
         self.RemoveAll()
@@ -29,6 +43,9 @@ class Manager[
             raise ValueError()
 
         self._storage[key] = item
+        if self._index is not None:
+            self._index.Add(key, item)
+        self._Invalidate()
 
         return item
 
@@ -45,6 +62,10 @@ class Manager[
                 return args[1]
             raise ValueError()
 
+        if self._index is not None:
+            self._index.Remove(key, item)
+        self._Invalidate()
+
         return self._storage.pop(key)
 
     def RemoveAll(self):
@@ -52,6 +73,47 @@ class Manager[
             if (del_item := self.Remove(item, None)) is not None and isinstance(del_item, Abc.Mixins.Disposable):
                 del_item.Dispose()
 
+    def Reindex(self, item: TItem):
+        '''
+        Обновляет индексы объекта после изменения его имени или сигнатуры.
+        '''
+        key = self._GetKey(item)
+
+        if self._index is None or key not in self._storage:
+            return
+
+        self._index.Reindex(key, item)
+
+    def _Invalidate(self):
+        '''
+        Сбрасывает снимки после изменения содержимого менеджера.
+        '''
+        self._snapshot = None
+        self._sorted_snapshots.clear()
+
+    def GetSnapshot(self) -> tuple[TItem, ...]:
+        '''
+        Кортеж объектов менеджера, кэшируемый до следующего `Register`/`Remove`.
+        '''
+        if self._snapshot is None:
+            self._snapshot = tuple(self._storage.values())
+        return self._snapshot
+
+    def GetSortedSnapshot(self, key: t.Callable[[TItem], t.Any], reversed: bool = False) -> tuple[TItem, ...]:
+        '''
+        Отсортированный снимок, кэшируемый по функции `key` до следующего `Register`/`Remove`.
+
+        `key` должна быть одним и тем же объектом между вызовами (не lambda в месте вызова),
+        а значение ключа не должно меняться без перерегистрации объекта.
+        '''
+        if (items := self._sorted_snapshots.get((key, reversed))) is None:
+            items = tuple(sorted(self._storage.values(), key=key, reverse=reversed))
+            self._sorted_snapshots[(key, reversed)] = items
+        return items
+
+    def _GetSequenceIndex(self) -> t.Optional[SequenceIndex[TItem]]:
+        return None if self._index is None else self._index.View()
+
     def Has(self, item: TItem) -> bool:
         return item in self._storage
 
@@ -66,7 +128,7 @@ class Manager[
 
     @property
     def sequence(self) -> Sequence[TItem]:
-        return Sequence(self._storage.values())
+        return Sequence(self._storage.values(), self._GetSequenceIndex())
 
     @property
     def count(self) -> int:
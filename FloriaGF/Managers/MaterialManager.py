@@ -19,7 +19,7 @@ class MaterialManager(
 
     @property
     def sequence(self) -> MaterialSequence[Abc.Material]:
-        return MaterialSequence(self._storage.values())
+        return MaterialSequence(self._storage.values(), self._GetSequenceIndex())
 
     def Register[T: Abc.Graphic.Materials.Material](self, item: T) -> T:
         return t.cast(T, super().Register(item))
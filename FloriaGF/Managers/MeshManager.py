@@ -1,16 +1,69 @@
 import typing as t
+from uuid import UUID
 
 from .. import Abc
 from .Manager import Manager
 from ..Sequences import MeshSequence
 
+if t.TYPE_CHECKING:
+    from ..Graphic.Objects.MeshArena import MeshArena
+    from ..Graphic.Windows.ShareGroup import ShareGroup
+
 
 class MeshManager(
     Manager[Abc.Graphic.Mesh],
 ):
+    '''
+    Меши ядра и их общие буферы на GPU.
+
+    Для каждой группы контекстов окон (`ShareGroup`) и раскладки вершин (`MeshArena.GetLayout`) заводится
+    одна `MeshArena`, в которую каждый меш загружается один раз. Меши неизменяемы и остаются в арене
+    до удаления группы, вместе с которой удаляется и арена.
+    '''
+
+    INDEXES = ('name', 'type', 'signature')
+
+    def __init__(self):
+        super().__init__()
+
+        # (share group id, layout): arena
+        self._arenas: dict[tuple[UUID, tuple[int, t.Optional[int]]], 'MeshArena'] = {}
+
+    def Dispose(self, *args: t.Any, **kwargs: t.Any):
+        super().Dispose()
+        # к этому моменту контексты окон уже уничтожены вместе с буферами
+        self._arenas.clear()
+
+    def GetArena(self, window: Abc.Window, mesh: Abc.Mesh) -> 'MeshArena':
+        '''
+        Арена группы контекстов окна для раскладки меша, меш в неё уже добавлен.
+        '''
+        from ..Graphic.Objects.MeshArena import MeshArena
+
+        share_group = window.share_group
+        key = (share_group.id, MeshArena.GetLayout(mesh))
+
+        if (arena := self._arenas.get(key)) is None:
+            if not any(group_id == share_group.id for group_id, _ in self._arenas):
+                share_group.on_dispose.Register(self._OnShareGroupDispose)
+
+            arena = self._arenas[key] = MeshArena(window, *key[1])
+
+        arena.Add(mesh)
+        return arena
+
+    def _OnShareGroupDispose(self, share_group: 'ShareGroup'):
+        for key in [key for key in self._arenas if key[0] == share_group.id]:
+            # группа вызывает событие в своём живом контексте, буферы арены привязывают окно-создателя сами
+            self._arenas.pop(key).Dispose()
+
+    @property
+    def arenas(self) -> tuple['MeshArena', ...]:
+        return tuple(self._arenas.values())
+
     @property
     def sequence(self) -> MeshSequence[Abc.Mesh]:
-        return MeshSequence(self._storage.values())
+        return MeshSequence(self._storage.values(), self._GetSequenceIndex())
 
     def Register[T: Abc.Mesh](self, item: T) -> T:
         return t.cast(T, super().Register(item))
@@ -19,7 +19,7 @@ class ShaderManager(
 
     @property
     def sequence(self) -> ShaderSequence[Abc.ShaderProgram]:
-        return ShaderSequence(self._storage.values())
+        return ShaderSequence(self._storage.values(), self._GetSequenceIndex())
 
     def Register[T: Abc.Graphic.ShaderPrograms.ShaderProgram](self, item: T) -> T:
         return t.cast(T, super().Register(item))
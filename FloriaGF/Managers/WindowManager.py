@@ -57,7 +57,7 @@ class WindowManager(
 
         self._simulate_time = perf_counter()
 
-        for window in self.sequence:
+        for window in self.GetSnapshot():
             window.Simulate()
 
         self.on_simulated.Invoke(self)
@@ -86,18 +86,18 @@ class WindowManager(
         if self.count > 0:
             window_manager_logger.info('Close...')
 
-            for window in (*self.sequence,):
+            for window in self.GetSnapshot():
                 self.Remove(window).Close().Dispose()
 
             self.on_closed.Invoke(self)
 
     async def _RemoveClosedWindows(self):
-        for window in (*self.sequence.Filter(lambda window: window.should_close),):
+        for window in self.sequence.Filter(lambda window: window.should_close).Materialize():
             self.Remove(window).Dispose()
 
     @property
     def sequence(self) -> WindowSequence[Abc.Window]:
-        return WindowSequence(self._storage.values())
+        return WindowSequence(self._storage.values(), self._GetSequenceIndex())
 
     @property
     def simulate_time(self) -> float:
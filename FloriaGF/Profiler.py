@@ -0,0 +1,290 @@
+import typing as t
+import json
+import math
+import pathlib
+from time import perf_counter
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class ProfilerEvent(t.NamedTuple):
+    '''Завершённая область кадра.'''
+
+    id: int
+    '''Порядковый номер входа в область внутри кадра.'''
+    name: str
+    start: float
+    '''Начало в секундах `perf_counter`.'''
+    duration: float
+    depth: int
+    parent: int
+    '''`id` родительской области или -1.'''
+
+
+class ProfilerFrame(t.NamedTuple):
+    frame: int
+    '''Номер кадра профилировщика.'''
+    start: float
+    duration: float
+    events: tuple[ProfilerEvent, ...]
+    '''Области в порядке входа: дерево задаётся `parent` и `depth`.'''
+
+
+class ProfilerStats(t.NamedTuple):
+    samples: int
+    '''Количество замеров.'''
+    min: float
+    avg: float
+    p99: float
+    max: float
+    total: float
+
+
+class Profiler:
+    """Иерархический профилировщик кадров.
+
+    Области открываются декоратором `stopwatch` (и `Scope`) и складываются в дерево текущего кадра.
+    Повторный и рекурсивный вход в одну функцию даёт вложенную область, а не ошибку.
+    Для каждого пути в дереве ("Window.Simulate/Camera.Render/...") копятся длительности вызовов
+    для min/avg/p99, последние кадры экспортируются в формат Chrome trace (chrome://tracing, Perfetto).
+
+    Пока профилировщик выключен, декорированные функции проверяют только флаг `enabled`.
+    Записываются только области контекста, открывшего кадр (`BeginFrame`), и задач, созданных в нём:
+    области других задач, например цикла симуляции в режиме 'concurent', в кадр не попадают.
+
+    Example::
+
+        profiler.Enable()
+        ...
+        profiler.ExportChromeTrace('trace.json')
+    """
+
+    __slots__ = (
+        '_enabled',
+        '_max_frames',
+        '_max_samples',
+        '_frame_index',
+        '_frame_start',
+        '_frame_context',
+        '_next_id',
+        '_events',
+        '_open',
+        '_stack',
+        '_frames',
+        '_samples',
+    )
+
+    def __init__(self, max_frames: int = 300, max_samples: int = 1000):
+        """
+        Args:
+            max_frames (int, optional): Сколько последних кадров хранить для экспорта.
+            max_samples (int, optional): Сколько последних длительностей хранить на путь для статистики.
+        """
+        self._enabled: bool = False
+        self._max_frames: int = max_frames
+        self._max_samples: int = max_samples
+
+        self._frame_index: int = 0
+        self._frame_start: t.Optional[float] = None
+        # начало кадра, открытого в текущем контексте
+        self._frame_context: ContextVar[t.Optional[float]] = ContextVar('profiler_frame', default=None)
+
+        self._next_id: int = 0
+        self._events: list[ProfilerEvent] = []
+        # id: (name, start, depth, parent, path) открытых областей кадра
+        self._open: dict[int, tuple[str, float, int, int, str]] = {}
+        self._stack: list[int] = []
+
+        self._frames: deque[ProfilerFrame] = deque(maxlen=max_frames)
+        self._samples: dict[str, deque[float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def Enable(self):
+        self._enabled = True
+
+    def Disable(self):
+        self._enabled = False
+        self._frame_start = None
+        self._ClearFrame()
+
+    def Reset(self):
+        self._frames.clear()
+        self._samples.clear()
+
+    def _ClearFrame(self):
+        self._next_id = 0
+        self._events = []
+        self._open.clear()
+        self._stack.clear()
+
+    def BeginFrame(self):
+        if not self._enabled:
+            return
+
+        if self._frame_start is not None:
+            self.EndFrame()
+
+        self._frame_start = perf_counter()
+        self._frame_context.set(self._frame_start)
+
+    def EndFrame(self):
+        """Закрывает кадр: незакрытые области отбрасываются, кадр без областей не сохраняется."""
+        if not self._enabled or self._frame_start is None:
+            return
+
+        end = perf_counter()
+
+        if len(self._events) == 0:
+            self._frame_start = None
+            self._ClearFrame()
+            return
+
+        self._frames.append(
+            ProfilerFrame(
+                self._frame_index,
+                self._frame_start,
+                end - self._frame_start,
+                tuple(sorted(self._events, key=lambda event: event.id)),
+            )
+        )
+
+        self._frame_index += 1
+        self._frame_start = None
+        self._ClearFrame()
+
+    def Begin(self, name: str) -> int:
+        """
+        Returns:
+            Токен области для `End` или -1, если кадр не открыт в текущем контексте.
+        """
+        if self._frame_start is None or self._frame_context.get() != self._frame_start:
+            return -1
+
+        parent = self._stack[-1] if len(self._stack) > 0 else -1
+        parent_path = self._open[parent][4] if parent != -1 else ''
+
+        token = self._next_id
+        self._next_id += 1
+
+        self._open[token] = (name, perf_counter(), len(self._stack), parent, f'{parent_path}/{name}' if parent_path else name)
+        self._stack.append(token)
+        return token
+
+    def End(self, token: int):
+        end = perf_counter()
+
+        if (item := self._open.pop(token, None)) is None:
+            # область вне кадра, кадр закрыт или профилировщик выключен, пока область была открыта
+            return
+
+        name, start, depth, parent, path = item
+        duration = end - start
+
+        if len(self._stack) > 0 and self._stack[-1] == token:
+            self._stack.pop()
+        elif token in self._stack:
+            self._stack.remove(token)
+
+        self._events.append(ProfilerEvent(token, name, start, duration, depth, parent))
+
+        if (samples := self._samples.get(path)) is None:
+            samples = self._samples[path] = deque(maxlen=self._max_samples)
+        samples.append(duration)
+
+    @contextmanager
+    def Scope(self, name: str):
+        if not self._enabled:
+            yield
+            return
+
+        token = self.Begin(name)
+        try:
+            yield
+        finally:
+            self.End(token)
+
+    @staticmethod
+    def _GetStats(samples: t.Iterable[float]) -> ProfilerStats:
+        values = sorted(samples)
+        count = len(values)
+        total = sum(values)
+        return ProfilerStats(
+            count,
+            values[0],
+            total / count,
+            values[min(count - 1, math.ceil(count * 0.99) - 1)],
+            values[-1],
+            total,
+        )
+
+    def GetStats(self) -> dict[str, ProfilerStats]:
+        """
+        Returns:
+            Статистика длительностей вызовов (в секундах) по путям областей.
+        """
+        return {path: self._GetStats(samples) for path, samples in self._samples.items() if len(samples) > 0}
+
+    def GetFrameStats(self) -> t.Optional[ProfilerStats]:
+        if len(self._frames) == 0:
+            return None
+        return self._GetStats(frame.duration for frame in self._frames)
+
+    def GetChromeTrace(self, frames: t.Optional[t.Iterable[ProfilerFrame]] = None) -> dict[str, t.Any]:
+        """
+        Returns:
+            Объект trace-event формата: каждая область и кадр - событие "X" с временем в микросекундах.
+        """
+        frames = tuple(self._frames if frames is None else frames)
+        origin = frames[0].start if len(frames) > 0 else 0
+
+        events: list[dict[str, t.Any]] = []
+        for frame in frames:
+            events.append(
+                {
+                    'name': f'Frame {frame.frame}',
+                    'cat': 'frame',
+                    'ph': 'X',
+                    'ts': (frame.start - origin) * 1e6,
+                    'dur': frame.duration * 1e6,
+                    'pid': 0,
+                    'tid': 0,
+                }
+            )
+            events.extend(
+                {
+                    'name': event.name,
+                    'cat': 'scope',
+                    'ph': 'X',
+                    'ts': (event.start - origin) * 1e6,
+                    'dur': event.duration * 1e6,
+                    'pid': 0,
+                    'tid': 0,
+                }
+                for event in frame.events
+            )
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def ExportChromeTrace(self, path: str | pathlib.Path, frames: t.Optional[t.Iterable[ProfilerFrame]] = None):
+        with open(path, 'w') as file:
+            json.dump(self.GetChromeTrace(frames), file)
+
+    @property
+    def frames(self) -> tuple[ProfilerFrame, ...]:
+        return tuple(self._frames)
+
+    @property
+    def frame_index(self) -> int:
+        return self._frame_index
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+
+profiler = Profiler()
+'''Общий профилировщик процесса, в него пишет декоратор `stopwatch`.'''
@@ -6,6 +6,7 @@ from .Sequence import Sequence
 from .TypeSequence import TypeSequence
 
 if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
     from ..Assets import Asset
 
 
@@ -20,8 +21,8 @@ class AssetSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return AssetSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return AssetSequence(source, index)
 
     def WithPath(self, path: Types.hints.path):
         return self._Create(
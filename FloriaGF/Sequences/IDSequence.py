@@ -4,6 +4,7 @@ from uuid import UUID
 from .Sequence import Sequence
 
 if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
     from ..Protocols import ID
 
 
@@ -18,10 +19,12 @@ class IDSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return IDSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return IDSequence(source, index)
 
     def WithID(self, id: TID):
+        if self._index is not None:
+            return self._Create(() if (item := self._index.GetByKey(id)) is None or item.id != id else (item,))
         return self._Create(filter(lambda item: item.id == id, self._source))
 
     def WithIDS(self, ids: t.Iterable[TID]):
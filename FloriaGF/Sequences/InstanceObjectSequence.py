@@ -6,6 +6,9 @@ from .Sequence import Sequence
 from .TypeSequence import TypeSequence
 from .IDSequence import IDSequence, TID
 
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
+
 
 TItem = t.TypeVar('TItem', bound=Abc.InstanceObject, covariant=True)
 
@@ -18,8 +21,8 @@ class InstanceObjectSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return InstanceObjectSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return InstanceObjectSequence(source, index)
 
     if t.TYPE_CHECKING:
 
@@ -6,6 +6,10 @@ from .Sequence import Sequence
 from .IDSequence import IDSequence, TID
 from .NameSequence import NameSequence, TName
 from .TypeSequence import TypeSequence
+from .SignatureSequence import SignatureSequence
+
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
 
 
 TItem = t.TypeVar('TItem', bound='Abc.Material', covariant=True)
@@ -15,14 +19,15 @@ class MaterialSequence(
     NameSequence[TItem],
     IDSequence[TItem],
     TypeSequence[TItem],
+    SignatureSequence[TItem],
     Sequence[TItem],
     t.Generic[TItem],
 ):
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return MaterialSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return MaterialSequence(source, index)
 
     if t.TYPE_CHECKING:
 
@@ -66,3 +71,8 @@ class MaterialSequence(
 
         def WithNames(self, names: t.Iterable[TName]):
             return t.cast(MaterialSequence[TItem], super().WithNames(names))
+
+        # signature
+
+        def WithSignature(self, signature: int):
+            return t.cast(MaterialSequence[TItem], super().WithSignature(signature))
@@ -3,8 +3,12 @@ import typing as t
 from .. import Abc, Utils
 from .NameSequence import NameSequence, TName
 from .TypeSequence import TypeSequence
+from .SignatureSequence import SignatureSequence
 from .Sequence import Sequence
 
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
+
 
 TItem = t.TypeVar('TItem', bound=Abc.Mesh, covariant=True)
 
@@ -12,14 +16,15 @@ TItem = t.TypeVar('TItem', bound=Abc.Mesh, covariant=True)
 class MeshSequence(
     NameSequence[TItem],
     TypeSequence[TItem],
+    SignatureSequence[TItem],
     Sequence[TItem],
     t.Generic[TItem],
 ):
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return MeshSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return MeshSequence(source, index)
 
     if t.TYPE_CHECKING:
 
@@ -55,3 +60,8 @@ class MeshSequence(
 
         def WithNames(self, names: t.Iterable[TName]):
             return t.cast(MeshSequence[TItem], super().WithNames(names))
+
+        # signature
+
+        def WithSignature(self, signature: int):
+            return t.cast(MeshSequence[TItem], super().WithSignature(signature))
@@ -3,6 +3,7 @@ import typing as t
 from .Sequence import Sequence
 
 if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
     from ..Protocols import Named
 
 
@@ -17,10 +18,12 @@ class NameSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return NameSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return NameSequence(source, index)
 
     def WithName(self, name: TName):
+        if self._index is not None and (items := self._index.WithName(name)) is not None:
+            return self._Create(items)
         return self._Create(filter(lambda item: item.name is not None and item.name == name, self._source))
 
     def WithNames(self, names: t.Iterable[TName]):
@@ -1,6 +1,8 @@
 import typing as t
 import itertools
-import functools
+
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
 
 
 TItem = t.TypeVar('TItem', bound=t.Any, covariant=True)
@@ -9,16 +11,22 @@ TItem = t.TypeVar('TItem', bound=t.Any, covariant=True)
 class Sequence(
     t.Generic[TItem],
 ):
-    __slots__ = ('_source',)
+    __slots__ = ('_source', '_index')
 
-    def __init__(self, source: t.Iterable[TItem]):
+    def __init__(
+        self,
+        source: t.Iterable[TItem],
+        index: t.Optional['SequenceIndex[TItem]'] = None,
+    ):
         super().__init__()
 
         self._source: t.Iterable[TItem] = source
+        self._index: t.Optional['SequenceIndex[TItem]'] = index
+        '''Индексы менеджера. Есть только у последовательностей, совпадающих с содержимым менеджера.'''
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return Sequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return Sequence(source, index)
 
     def Filter(self, predicate: t.Callable[[TItem], bool]):
         return self._Create(filter(predicate, self._source))
@@ -30,14 +38,33 @@ class Sequence(
         return self._Create(item_transformed for item in self._source for item_transformed in transform(item))
 
     def Take(self, n: int):
+        if isinstance(self._source, (tuple, list)):
+            return self._Create(self._source[:n])
         return self._Create(itertools.islice(self._source, n))
 
     def Skip(self, n: int):
+        if isinstance(self._source, (tuple, list)):
+            return self._Create(self._source[n:])
         return self._Create(itertools.islice(self._source, n, None))
 
     def Sort(self, key: t.Callable[[TItem], t.Any], reversed: bool = False):
         return self._Create(sorted(self._source, key=key, reverse=reversed))
 
+    def _Materialized(self) -> tuple[TItem, ...] | list[TItem]:
+        if not isinstance(self._source, (tuple, list)):
+            self._source = tuple(self._source)
+        return self._source
+
+    def Materialize(self):
+        '''
+        Собирает источник в кортеж: длина и индексация за O(1), последовательность можно обходить повторно.
+        '''
+        return self._Create(self._Materialized(), self._index)
+
+    @property
+    def is_materialized(self) -> bool:
+        return isinstance(self._source, (tuple, list))
+
     def ToList(self) -> list[TItem]:
         return list(self._source)
 
@@ -47,14 +74,30 @@ class Sequence(
     def ToSet(self) -> set[TItem]:
         return set(self._source)
 
-    @functools.cached_property
+    @property
     def count(self) -> int:
-        return sum(1 for _ in self)
-
-    @functools.cached_property
+        '''
+        Для источников без длины (генераторов) источник материализуется.
+        '''
+        if isinstance(self._source, t.Sized):
+            return len(self._source)
+        return len(self._Materialized())
+
+    @property
     def is_empty(self) -> bool:
-        for _ in self._source:
+        '''
+        Проверяет только первый элемент: ленивый источник не материализуется.
+        '''
+        if isinstance(self._source, t.Sized):
+            return len(self._source) == 0
+
+        iterator = iter(self._source)
+        for first in iterator:
+            # возвращаем прочитанный элемент в начало источника
+            self._source = itertools.chain((first,), iterator)
             return False
+
+        self._source = ()
         return True
 
     def First(self, predicat: t.Optional[t.Callable[[TItem], bool]] = None) -> TItem:
@@ -103,11 +146,15 @@ class Sequence(
 
     def __getitem__(self, key: slice | int):
         if isinstance(key, slice):
-            return Sequence(itertools.islice(self._source, key.start, key.stop, key.step))
+            if isinstance(self._source, (tuple, list)) or any(
+                value is not None and value < 0 for value in (key.start, key.stop, key.step)
+            ):
+                return self._Create(self._Materialized()[key])
+            return self._Create(itertools.islice(self._source, key.start, key.stop, key.step))
 
         elif isinstance(key, int):
-            if key < 0:
-                return tuple(self._source)[key]
+            if key < 0 or isinstance(self._source, (tuple, list)):
+                return self._Materialized()[key]
 
             else:
                 for i, item in enumerate(self._source):
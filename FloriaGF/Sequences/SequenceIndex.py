@@ -0,0 +1,168 @@
+import typing as t
+
+from .. import Abc
+
+
+TIndexName = t.Literal['name', 'type', 'signature']
+
+
+class ManagerIndex[TItem: t.Any]:
+    '''
+    Вторичные индексы менеджера (имя, тип, сигнатура).
+
+    Обновляются в `Manager.Register`/`Manager.Remove`. Значения запоминаются в момент регистрации,
+    поэтому после смены имени или сигнатуры объект нужно переиндексировать (`Manager.Reindex`).
+    Поиск доверяет индексу: промах не приводит к проходу по всем объектам.
+    '''
+
+    __slots__ = (
+        '_indexes',
+        '_storage',
+        '_names',
+        '_types',
+        '_signatures',
+        '_entries',
+    )
+
+    def __init__(
+        self,
+        storage: dict[t.Any, TItem],
+        indexes: t.Iterable[TIndexName] = ('name', 'type'),
+    ):
+        self._indexes: frozenset[TIndexName] = frozenset(indexes)
+        self._storage: dict[t.Any, TItem] = storage
+
+        self._names: dict[t.Optional[str], dict[t.Any, TItem]] = {}
+        self._types: dict[type, dict[t.Any, TItem]] = {}
+        self._signatures: dict[int, dict[t.Any, TItem]] = {}
+        # key: (name, signature)
+        self._entries: dict[t.Any, tuple[t.Optional[str], t.Optional[int]]] = {}
+
+    def Add(self, key: t.Any, item: TItem):
+        name: t.Optional[str] = None
+        signature: t.Optional[int] = None
+
+        if 'name' in self._indexes and (name := getattr(item, 'name', None)) is not None:
+            self._names.setdefault(name, {})[key] = item
+
+        if 'type' in self._indexes:
+            self._types.setdefault(item.__class__, {})[key] = item
+
+        if 'signature' in self._indexes and isinstance(item, Abc.Mixins.Signaturable):
+            signature = item.GetSignature()
+            self._signatures.setdefault(signature, {})[key] = t.cast(TItem, item)
+
+        self._entries[key] = (name, signature)
+
+    def Remove(self, key: t.Any, item: TItem):
+        if (entry := self._entries.pop(key, None)) is None:
+            return
+
+        name, signature = entry
+
+        if name is not None and (items := self._names.get(name)) is not None:
+            items.pop(key, None)
+            if len(items) == 0:
+                self._names.pop(name)
+
+        if (items := self._types.get(item.__class__)) is not None:
+            items.pop(key, None)
+            if len(items) == 0:
+                self._types.pop(item.__class__)
+
+        if signature is not None and (items := self._signatures.get(signature)) is not None:
+            items.pop(key, None)
+            if len(items) == 0:
+                self._signatures.pop(signature)
+
+    def Reindex(self, key: t.Any, item: TItem):
+        self.Remove(key, item)
+        self.Add(key, item)
+
+    def GetByName(self, name: t.Optional[str]) -> tuple[TItem, ...]:
+        '''
+        Объекты с текущим именем `name`. Записи объектов, переименованных без `Manager.Reindex`,
+        исправляются при обращении к их старому имени.
+        '''
+        if (items := self._names.get(name)) is None:
+            return ()
+
+        found: list[TItem] = []
+        for key, item in tuple(items.items()):
+            if getattr(item, 'name', None) == name:
+                found.append(item)
+            else:
+                self.Reindex(key, item)
+
+        return tuple(found)
+
+    def Has(self, index: TIndexName) -> bool:
+        return index in self._indexes
+
+    def View(self) -> 'SequenceIndex[TItem]':
+        return SequenceIndex(self)
+
+
+class SequenceIndex[TItem: t.Any]:
+    '''
+    Представление индексов менеджера для последовательности, суженное по типам.
+
+    Передаётся в последовательность, полученную напрямую из менеджера, и в результаты `OfType`.
+    Остальные операции (`Filter`, `Map`, ...) индекс отбрасывают.
+    '''
+
+    __slots__ = (
+        '_index',
+        '_types',
+    )
+
+    def __init__(
+        self,
+        index: ManagerIndex[TItem],
+        types: tuple[type, ...] = (),
+    ):
+        self._index = index
+        self._types: tuple[type, ...] = types
+
+    def _Check(self, item: t.Any) -> bool:
+        return all(isinstance(item, type) for type in self._types)
+
+    def OfType[U: t.Any](self, type: t.Type[U]) -> t.Optional['SequenceIndex[U]']:
+        if not self._index.Has('type'):
+            return None
+        return SequenceIndex(t.cast(ManagerIndex[U], self._index), (*self._types, type))
+
+    def Items(self) -> t.Iterable[TItem]:
+        if len(self._types) == 0:
+            return self._index._storage.values()
+
+        if not self._index.Has('type'):
+            return filter(self._Check, self._index._storage.values())
+
+        return (
+            item
+            for item_type, items in tuple(self._index._types.items())
+            if all(issubclass(item_type, type) for type in self._types)
+            for item in tuple(items.values())
+        )
+
+    def WithName(self, name: t.Optional[str]) -> t.Optional[t.Iterable[TItem]]:
+        '''
+        Returns:
+            Объекты с именем или None, если индекса имён нет.
+        '''
+        if not self._index.Has('name'):
+            return None
+
+        return tuple(item for item in self._index.GetByName(name) if self._Check(item))
+
+    def WithSignature(self, signature: int) -> t.Optional[t.Iterable[TItem]]:
+        if not self._index.Has('signature'):
+            return None
+
+        return tuple(item for item in self._index._signatures.get(signature, {}).values() if self._Check(item))
+
+    def GetByKey(self, key: t.Any) -> t.Optional[TItem]:
+        if (item := self._index._storage.get(key)) is None or not self._Check(item):
+            return None
+        return item
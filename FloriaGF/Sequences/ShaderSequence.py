@@ -5,6 +5,9 @@ from .NameSequence import NameSequence, TName
 from .TypeSequence import TypeSequence
 from .Sequence import Sequence
 
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
+
 
 TItem = t.TypeVar('TItem', bound=Abc.ShaderProgram, covariant=True)
 
@@ -17,8 +20,8 @@ class ShaderSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return ShaderSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return ShaderSequence(source, index)
 
     if t.TYPE_CHECKING:
 
@@ -0,0 +1,67 @@
+import typing as t
+
+from .Sequence import Sequence
+
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
+
+
+TItem = t.TypeVar('TItem', bound=t.Any, covariant=True)
+
+
+class SignatureSequence(
+    Sequence[TItem],
+    t.Generic[TItem],
+):
+    __slots__ = ()
+
+    @classmethod
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return SignatureSequence(source, index)
+
+    def WithSignature(self, signature: int):
+        if self._index is not None and (items := self._index.WithSignature(signature)) is not None:
+            return self._Create(items)
+        return self._Create(filter(lambda item: item.GetSignature() == signature, self._source))
+
+    def GetBySignatureOrDefault[TDefault: t.Optional[t.Any]](
+        self,
+        signature: int,
+        default: TDefault = None,
+    ) -> TItem | TDefault:
+        for item in self.WithSignature(signature):
+            return item
+        return default
+
+    if t.TYPE_CHECKING:
+
+        # base
+
+        def Filter(self, predicate: t.Callable[[TItem], bool]):
+            return t.cast(SignatureSequence[TItem], super().Filter(predicate))
+
+        def Map[U: t.Any](self, transform: t.Callable[[TItem], U]):
+            return t.cast(SignatureSequence[U], super().Map(transform))
+
+        def FlatMap[U: t.Any](self, transform: t.Callable[[TItem], t.Iterable[U]]):
+            return t.cast(SignatureSequence[U], super().FlatMap(transform))
+
+        def Take(self, n: int):
+            return t.cast(SignatureSequence[TItem], super().Take(n))
+
+        def Skip(self, n: int):
+            return t.cast(SignatureSequence[TItem], super().Skip(n))
+
+        def Sort(self, key: t.Callable[[TItem], t.Any], reversed: bool = False):
+            return t.cast(SignatureSequence[TItem], super().Sort(key, reversed))
+
+
+if t.TYPE_CHECKING:
+
+    class Example(SignatureSequence[TItem], t.Generic[TItem]):
+        if t.TYPE_CHECKING:
+
+            # signature
+
+            def WithSignature(self, signature: int):
+                return t.cast(Example[TItem], super().WithSignature(signature))
@@ -2,6 +2,9 @@ import typing as t
 
 from .Sequence import Sequence
 
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
+
 
 TItem = t.TypeVar('TItem', bound=t.Any, covariant=True)
 
@@ -13,10 +16,12 @@ class TypeSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return TypeSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return TypeSequence(source, index)
 
     def OfType[U: t.Any](self, type: t.Type[U]):
+        if self._index is not None and (index := self._index.OfType(type)) is not None:
+            return self._Create(index.Items(), index)
         return self._Create((item for item in self._source if isinstance(item, type)))
 
     if t.TYPE_CHECKING:
@@ -6,6 +6,9 @@ from .IDSequence import IDSequence, TID
 from .TypeSequence import TypeSequence
 from .Sequence import Sequence
 
+if t.TYPE_CHECKING:
+    from .SequenceIndex import SequenceIndex
+
 
 TItem = t.TypeVar('TItem', bound=Abc.Window, covariant=True)
 
@@ -20,8 +23,8 @@ class WindowSequence(
     __slots__ = ()
 
     @classmethod
-    def _Create[U: t.Any](cls, source: t.Iterable[U]):
-        return WindowSequence(source)
+    def _Create[U: t.Any](cls, source: t.Iterable[U], index: t.Optional['SequenceIndex[U]'] = None):
+        return WindowSequence(source, index)
 
     if t.TYPE_CHECKING:
 
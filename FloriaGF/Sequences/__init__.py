@@ -1,5 +1,8 @@
 from .Sequence import Sequence
 from .NameSequence import NameSequence
+from .TypeSequence import TypeSequence
+from .SignatureSequence import SignatureSequence
+from .SequenceIndex import ManagerIndex, SequenceIndex
 from .IDSequence import IDSequence
 from .AssetSequence import AssetSequence
 from .MeshSequence import MeshSequence
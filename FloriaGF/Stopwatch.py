@@ -1,10 +1,14 @@
 import typing as t
 import types as ts
+import sys
 from contextlib import contextmanager
 from time import perf_counter
 from collections import deque
 import functools
 
+from .Profiler import profiler
+from .Config import Config
+
 if t.TYPE_CHECKING:
     from . import Protocols
 
@@ -24,6 +28,8 @@ class Stopwatch:
         '_start_time',
         '_last_value',
         '_samples',
+        '_counters',
+        '_last_counters',
     )
 
     def __init__(self, max_samples: int = 10):
@@ -37,6 +43,9 @@ class Stopwatch:
         self._last_value: t.Optional[float] = None
         self._samples: deque[float] = deque(maxlen=max_samples)
 
+        self._counters: dict[str, int] = {}
+        self._last_counters: dict[str, int] = {}
+
     def __enter__(self, *args: t.Any, **kwargs: t.Any):
         """Запуск таймера при входе в контекст."""
         self.Start()
@@ -65,6 +74,7 @@ class Stopwatch:
         """
         if self._start_time is not None:
             raise RuntimeError('Stopwatch is already running')
+        self._counters = {}
         self._start_time = perf_counter()
 
     def Stop(self) -> float:
@@ -82,6 +92,7 @@ class Stopwatch:
 
         self._last_value = perf_counter() - self._start_time
         self._samples.append(self._last_value)
+        self._last_counters = self._counters
 
         self._start_time = None
         return self._last_value
@@ -101,10 +112,22 @@ class Stopwatch:
 
         return perf_counter() - self._start_time
 
+    def Count(self, name: str, value: int = 1):
+        """
+        Увеличить счётчик текущего замера.
+
+        Args:
+            name (str): Имя счётчика.
+            value (int, optional): Приращение. По умолчанию 1.
+        """
+        self._counters[name] = self._counters.get(name, 0) + value
+
     def Reset(self):
         """Сброс всех замеров и текущего значения."""
         self._samples.clear()
         self._last_value = None
+        self._counters = {}
+        self._last_counters = {}
 
     @property
     def is_running(self) -> bool:
@@ -140,6 +163,11 @@ class Stopwatch:
         """Сумма всех сохранённых замеров."""
         return sum(self._samples)
 
+    @property
+    def counters(self) -> dict[str, int]:
+        """Счётчики последнего завершённого замера."""
+        return self._last_counters
+
     @property
     def count(self) -> int:
         """Количество сохранённых замеров."""
@@ -154,21 +182,131 @@ class Stopwatch:
         return self.__repr__()
 
 
+class StopwatchEntry(t.NamedTuple):
+    func: t.Callable[..., t.Any]
+    wrapper: t.Callable[..., t.Any]
+    stopwatch: Stopwatch
+
+
+_registry: dict[str, StopwatchEntry] = {}
+'''`module:qualname` -> функции, декорированные `stopwatch`.'''
+_instrumentation: bool = Config.STOPWATCH_ENABLED
+_sample_every: int = max(1, Config.STOPWATCH_SAMPLE_EVERY)
+
+
 def stopwatch[
     TFunc: Protocols.Functions.SyncCallable[...],
 ](
     func: TFunc,
     stopwatch: t.Optional[Stopwatch] = None,
 ) -> TFunc:
-    """Декоратор для измерения времени выполнения функций и методов."""
+    """Декоратор для измерения времени выполнения функций и методов.
+
+    Вызов также открывает область `profiler` с именем `__qualname__` функции, если профилировщик включён.
+    При повторном входе (рекурсия, вызов из обработчика) замер ведёт внешний вызов,
+    а в профилировщике появляется вложенная область.
+
+    Если инструментирование выключено (`Config.STOPWATCH_ENABLED`), возвращается сама функция без обёртки.
+    Функция регистрируется в любом случае, чтобы `SetInstrumentation` мог подменить её позже.
+    """
 
     stopwatch = Stopwatch() if stopwatch is None else stopwatch
+    name: str = getattr(func, '__qualname__', repr(func))
+    calls: int = 0
 
     @functools.wraps(func)
     def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
-        with stopwatch:
-            return func(*args, **kwargs)
+        nonlocal calls
+
+        token = profiler.Begin(name) if profiler.enabled else None
+
+        try:
+            calls += 1
+            if calls < _sample_every or stopwatch.is_running:
+                return func(*args, **kwargs)
+
+            calls = 0
+            with stopwatch:
+                return func(*args, **kwargs)
+
+        finally:
+            if token is not None:
+                profiler.End(token)
 
     wrapper.__stopwatch__ = stopwatch  # pyright: ignore[reportAttributeAccessIssue]
+    # func может быть любым вызываемым объектом, а не только функцией
+    setattr(func, '__stopwatch__', stopwatch)
+
+    _registry[f'{func.__module__}:{name}'] = StopwatchEntry(func, wrapper, stopwatch)
 
-    return t.cast(TFunc, wrapper)
+    return t.cast(TFunc, wrapper if _instrumentation else func)
+
+
+def _GetOwner(func: t.Callable[..., t.Any]) -> t.Optional[tuple[t.Any, str]]:
+    """
+    Returns:
+        (модуль или класс, имя атрибута), где определена функция, или None для локальных функций.
+    """
+    *path, attr = func.__qualname__.split('.')
+
+    owner = sys.modules.get(func.__module__)
+    for part in path:
+        if owner is None or part == '<locals>':
+            return None
+        owner = getattr(owner, part, None)
+
+    if owner is None:
+        return None
+    return owner, attr
+
+
+def SetInstrumentation(enabled: bool) -> int:
+    """Подменяет функции `@stopwatch` в их классах и модулях на обёртки или исходные функции.
+
+    `staticmethod` и `classmethod` над `@stopwatch` сохраняются: подменяется обёрнутая ими функция.
+    Атрибуты, обёрнутые после декорирования ещё раз, и уже взятые ссылки (связанные методы,
+    подписки на события) не меняются.
+
+    Returns:
+        Количество подменённых атрибутов.
+    """
+    global _instrumentation
+    _instrumentation = enabled
+
+    count = 0
+    for entry in _registry.values():
+        if (owner := _GetOwner(entry.func)) is None:
+            continue
+
+        target, attr = owner
+        current = vars(target).get(attr)
+        descriptor = type(current) if isinstance(current, (staticmethod, classmethod)) else None
+        func = current.__func__ if isinstance(current, (staticmethod, classmethod)) else current
+        if func is not entry.func and func is not entry.wrapper:
+            continue
+
+        if func is not (value := entry.wrapper if enabled else entry.func):
+            setattr(target, attr, value if descriptor is None else descriptor(value))
+            count += 1
+
+    return count
+
+
+def SetSampling(every: int):
+    """Замерять каждый `every`-й вызов функций `@stopwatch`. Профилировщик получает все вызовы."""
+    global _sample_every
+    if every < 1:
+        raise ValueError(every)
+    _sample_every = every
+
+
+def IsInstrumentationEnabled() -> bool:
+    return _instrumentation
+
+
+def GetStopwatches() -> dict[str, Stopwatch]:
+    """
+    Returns:
+        `module:qualname` -> замеры функций `@stopwatch`.
+    """
+    return {key: entry.stopwatch for key, entry in _registry.items()}
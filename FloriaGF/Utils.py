@@ -129,13 +129,18 @@ def RemoveKeys(data: dict[str, t.Any], *keys: str) -> dict[str, t.Any]:
     return {key: value for key, value in data.items() if key not in keys}
 
 
-def ComparePath(path1: Types.hints.path, path2: Types.hints.path) -> bool:
-    if isinstance(path1, str):
-        path1 = pathlib.Path(path1)
-    if isinstance(path2, str):
-        path2 = pathlib.Path(path2)
+def ResolvePath(path: Types.hints.path) -> pathlib.Path:
+    '''
+    Абсолютный путь с раскрытой папкой (сам файл не разыменовывается).
+    '''
+    if isinstance(path, str):
+        path = pathlib.Path(path)
 
-    return path1.parent.resolve().joinpath(path1.name) == path2.parent.resolve().joinpath(path2.name)
+    return path.parent.resolve().joinpath(path.name)
+
+
+def ComparePath(path1: Types.hints.path, path2: Types.hints.path) -> bool:
+    return ResolvePath(path1) == ResolvePath(path2)
 
 
 def DirectoryContainsFile(dir: Types.hints.path, file: Types.hints.path) -> bool:
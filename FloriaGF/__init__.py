@@ -17,9 +17,20 @@ from .Avg import Avg
 from .PerSecond import PerSecond
 from .PeriodicTrigger import PeriodicTrigger
 from .Flag import Flag
-from .Stopwatch import Stopwatch, stopwatch
+from .Stopwatch import (
+    Stopwatch,
+    stopwatch,
+    StopwatchEntry,
+    SetInstrumentation,
+    SetSampling,
+    IsInstrumentationEnabled,
+    GetStopwatches,
+)
+from .Profiler import Profiler, ProfilerEvent, ProfilerFrame, ProfilerStats, profiler
 from .AsyncEvent import AsyncEvent
 from .InterpolationField import InterpolationField, InterpolationState
+from .InputState import InputState
+from .InputRecorder import InputRecorder, InputReplay, InputRecord, InputRecordKind
 
 from .Config import ConfigCls, Config  # pyright: ignore[reportGeneralTypeIssues]
 from .Core import CoreCls, Core  # pyright: ignore[reportGeneralTypeIssues]
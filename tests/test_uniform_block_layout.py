@@ -0,0 +1,64 @@
+import glfw
+import pytest
+
+from FloriaGF import GL
+from FloriaGF.Graphic.ShaderPrograms.CameraSupportShaderProgram import CameraVertexShader
+
+
+@pytest.fixture
+def context():
+    if not glfw.init():
+        pytest.skip('GLFW недоступен')
+
+    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 4)
+    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
+    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
+    glfw.window_hint(glfw.VISIBLE, False)
+
+    if (window := glfw.create_window(16, 16, 'test', None, None)) is None:
+        glfw.terminate()
+        pytest.skip('Контекст OpenGL 4.3 недоступен')
+
+    glfw.make_context_current(window)
+    yield window
+
+    glfw.destroy_window(window)
+    glfw.terminate()
+
+
+def test_camera_block_layout(context):
+    block = CameraVertexShader.camera
+
+    vertex = GL.Shader.Create(
+        'vertex',
+        f'''#version 430 core
+        {block.GetSource()}
+        void main() {{
+            gl_Position = {block.name}.projection * {block.name}.view * vec4({block.name}.resolution, 0, 1);
+        }}
+        ''',
+    )
+    fragment = GL.Shader.Create(
+        'fragment',
+        '''#version 430 core
+        out vec4 color;
+        void main() { color = vec4(1); }
+        ''',
+    )
+
+    program = GL.ShaderProgram.Create()
+    try:
+        GL.ShaderProgram.Attach(program, vertex, fragment)
+        GL.ShaderProgram.Link(program)
+
+        layout = GL.ShaderProgram.GetUniformBlockLayout(program, block.block_name)
+        assert layout is not None
+
+        size, offsets = layout
+        dtype = block.GetDType()
+        assert size <= dtype.itemsize
+        assert offsets == {name: field[1] for name, field in (dtype.fields or {}).items()}
+
+    finally:
+        GL.ShaderProgram.Delete(program)
+        GL.Shader.Delete(vertex, fragment)